@@ -6,6 +6,7 @@ from pydantic import BaseModel
 class Document(BaseModel):
     doi: str
     content: str
+    markdown_id: int | None = None
 
 
 class ModelResponse(BaseModel):
@@ -15,14 +16,17 @@ class ModelResponse(BaseModel):
     model_response: str
     model_reasoning: str
     compute_time_seconds: float
+    markdown_id: int | None = None
+    llm_prompt_id: int | None = None
 
     @property
     def to_df(self) -> DataFrame:
+        # The prompt texts are stored once and referenced by their ids
         return DataFrame(
             data={
                 "doi": [self.doi],
-                "system_prompt": [self.system_prompt],
-                "user_prompt": [self.user_prompt],
+                "markdown_id": [self.markdown_id],
+                "llm_prompt_id": [self.llm_prompt_id],
                 "model_response": [self.model_response],
                 "model_reasoning": [self.model_reasoning],
                 "compute_time_seconds": [self.compute_time_seconds],
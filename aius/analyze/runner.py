@@ -5,18 +5,19 @@ Copyright 2025 (C) Nicholas M. Synovic
 
 """
 
+from collections.abc import Iterator
 from itertools import islice
-from json import loads
+from json import dumps, loads
 from logging import Logger
 from typing import Literal
 
 import pandas as pd
-from pandas import DataFrame
+from pandas import DataFrame, Series
 
 from aius.analyze import BACKEND_MAPPING
 from aius.analyze.backend import Backend
 from aius.analyze.data_models import Document, ModelResponse
-from aius.db import DB
+from aius.db import DB, DEFAULT_CHUNKSIZE
 from aius.runner import Runner
 
 
@@ -65,53 +66,100 @@ class AnalysisRunner(Runner):  # noqa: D101
         )
         df = df.dropna(inplace=False, ignore_index=True)
         df["model_response"] = df["model_response"].apply(loads)
-        df = df[df["model_response"].apply(lambda d: d.get("result") is True)]
+        # `.loc` keeps the columns when the mask is empty (an all-empty chunk)
+        df = df.loc[
+            df["model_response"].apply(lambda d: d.get("result") is True).astype(bool)
+        ]
         df.reset_index(drop=True, inplace=True)
-        df.rename(columns={"user_prompt": "markdown"}, inplace=True)
+        df["markdown_id"] = df["markdown_id"].astype(int)
         return df
 
-    def _get_documents(self) -> list[Document]:
-        df: DataFrame = DataFrame()
+    def _iter_rows(self) -> Iterator[Series]:
+        # Rows only carry the `markdown._id` of a document, not its text
+        chunks: Iterator[DataFrame] = iter([])
+        table_name: str = ""
 
         match self.system_prompt_id:
             case "uses_dl":
-                df = self.db.read_table_to_dataframe(table_name="markdown")
+                chunks = self.db.iter_query(
+                    sql="SELECT _id AS markdown_id, doi FROM markdown ORDER BY _id;"
+                )
             case "uses_ptms":
-                df = self.db.read_table_to_dataframe(table_name="uses_dl_analysis")
-                df = self.__set_dataframe_formatting(df=df)
-            case "identify_ptms":
-                df = self.db.read_table_to_dataframe(table_name="uses_ptms_analysis")
-                df = self.__set_dataframe_formatting(df=df)
-            case "identify_ptm_reuse":
-                df = self.db.read_table_to_dataframe(table_name="uses_ptms_analysis")
-                df = self.__set_dataframe_formatting(df=df)
-            case "identify_ptm_impact":
-                df = self.db.read_table_to_dataframe(table_name="uses_ptms_analysis")
-                df = self.__set_dataframe_formatting(df=df)
-
-        df_islice: islice = islice(
-            df.iterrows(),
-            self.index,
-            None,
-            self.stride,
+                table_name = "uses_dl_analysis"
+            case "identify_ptms" | "identify_ptm_reuse" | "identify_ptm_impact":
+                table_name = "uses_ptms_analysis"
+
+        if table_name != "":
+            chunks = (
+                self.__set_dataframe_formatting(df=df)
+                for df in self.db.iter_table(
+                    table_name=table_name,
+                    columns=["doi", "markdown_id", "model_response"],
+                )
+            )
+
+        df: DataFrame
+        for df in chunks:
+            row: Series
+            for _, row in df.iterrows():
+                yield row
+
+    def _get_markdown(self, markdown_ids: list[int]) -> dict[int, str]:
+        markdown: dict[int, str] = {}
+
+        df: DataFrame
+        for df in self.db.iter_query(
+            sql="SELECT _id, markdown FROM markdown "
+            "WHERE _id IN (SELECT value FROM json_each(:markdown_ids));",
+            parameters={"markdown_ids": dumps(obj=markdown_ids)},
+        ):
+            markdown.update(zip(df["_id"], df["markdown"], strict=True))
+
+        return markdown
+
+    def _iter_documents(self) -> Iterator[list[Document]]:
+        # Rows selected by the index and stride are read, and their markdown
+        # fetched, `DEFAULT_CHUNKSIZE` documents at a time
+        rows: Iterator[Series] = islice(
+            self._iter_rows(), self.index, None, self.stride
         )
 
-        return [
-            Document(doi=row["doi"], content=row["markdown"]) for _, row in df_islice
-        ]
+        while batch := list(islice(rows, DEFAULT_CHUNKSIZE)):
+            markdown: dict[int, str] = self._get_markdown(
+                markdown_ids=[int(row["markdown_id"]) for row in batch],
+            )
 
-    def execute(self) -> int:  # noqa: D102
-        documents: list[Document] = self._get_documents()
+            yield [
+                Document(
+                    doi=row["doi"],
+                    content=markdown[int(row["markdown_id"])],
+                    markdown_id=int(row["markdown_id"]),
+                )
+                for row in batch
+            ]
 
-        responses: list[ModelResponse] = self.backend.inference_documents(
-            documents=documents,
-            system_prompt=self.system_prompt,
-        )
-
-        df: DataFrame = pd.concat(
-            objs=[resp.to_df for resp in responses],
-            ignore_index=True,
-        )
+    def execute(self) -> int:  # noqa: D102
+        # Responses reference the stored document and prompt instead of copies
+        llm_prompt_id: int = self.db.get_llm_prompt_id(tag=self.system_prompt_id)
+
+        # Only the response rows, not the documents, outlive a batch
+        response_dfs: list[DataFrame] = []
+
+        documents: list[Document]
+        for documents in self._iter_documents():
+            responses: list[ModelResponse] = self.backend.inference_documents(
+                documents=documents,
+                system_prompt=self.system_prompt,
+            )
+
+            document: Document
+            response: ModelResponse
+            for document, response in zip(documents, responses, strict=True):
+                response.markdown_id = document.markdown_id
+                response.llm_prompt_id = llm_prompt_id
+                response_dfs.append(response.to_df)
+
+        df: DataFrame = pd.concat(objs=response_dfs, ignore_index=True)
 
         df.to_parquet(
             path=f"aius_{self.backend.name}_{self.system_prompt_id}_index-{self.index}_stride-{self.stride}.parquet",
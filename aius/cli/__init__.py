@@ -8,6 +8,8 @@ from abc import ABC, abstractmethod
 from importlib.metadata import version
 
 DATABASE_HELP_MESSAGE: str = "Path to database"
+DATABASE_PROFILE_HELP_MESSAGE: str = "SQLite3 performance profile"
+DATABASE_CODEC_HELP_MESSAGE: str = "Compression codec for large text columns"
 
 
 class CLI(ABC):  # noqa: D101
@@ -40,6 +42,15 @@ in natural science publications
     @abstractmethod
     def add_analyze_subparser(self) -> None: ...  # noqa: D102
 
+    @abstractmethod
+    def add_recompress_subparser(self) -> None: ...  # noqa: D102
+
+    @abstractmethod
+    def add_export_subparser(self) -> None: ...  # noqa: D102
+
+    @abstractmethod
+    def add_reparse_subparser(self) -> None: ...  # noqa: D102
+
     @abstractmethod
     def parse_cli(self) -> dict: ...  # noqa: D102
 
@@ -58,3 +69,6 @@ in natural science publications
         self.add_jats_subparser()
         self.add_pandoc_subparser()
         self.add_analyze_subparser()
+        self.add_recompress_subparser()
+        self.add_export_subparser()
+        self.add_reparse_subparser()
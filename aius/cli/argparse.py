@@ -5,16 +5,29 @@ Copyright (C) 2025 Nicholas M. Synovic
 """
 
 import sys
-from argparse import ArgumentParser, _SubParsersAction
+from argparse import ArgumentParser, ArgumentTypeError, _SubParsersAction
 from datetime import datetime, timezone
 from pathlib import Path
 
 from aius.analyze import SYSTEM_PROMPT_TAG_MAPPING
-from aius.cli import CLI, DATABASE_HELP_MESSAGE
-from aius.db import DEFAULT_DATABASE_PATH
+from aius.cli import (
+    CLI,
+    DATABASE_CODEC_HELP_MESSAGE,
+    DATABASE_HELP_MESSAGE,
+    DATABASE_PROFILE_HELP_MESSAGE,
+)
+from aius.db import (
+    DB_CODECS,
+    DB_PROFILES,
+    DEFAULT_DATABASE_PATH,
+    DEFAULT_DB_PROFILE,
+    DEFAULT_EXPORT_PATH,
+)
 from aius.jats import ALL_OF_PLOS_DEFAULT_PATH
-from aius.megajournals import MEGAJOURNAL_MAPPING
+from aius.megajournals import MEGAJOURNAL_MAPPING, resolve_megajournal_names
+from aius.openalex import DEFAULT_OPENALEX_CONCURRENCY, OPENALEX_REQUIRED_FIELDS
 from aius.pandoc import DEFAULT_PANDOC_URI
+from aius.util.response_cache import DEFAULT_HTTP_CACHE_PATH
 
 
 class Argparse(CLI):  # noqa: D101
@@ -33,6 +46,53 @@ class Argparse(CLI):  # noqa: D101
 
         self.construct_cli()
 
+    @staticmethod
+    def _add_db_arguments(parser: ArgumentParser, subcommand: str) -> None:
+        parser.add_argument(
+            "--db-profile",
+            default=DEFAULT_DB_PROFILE,
+            type=str,
+            choices=list(DB_PROFILES.keys()),
+            help=DATABASE_PROFILE_HELP_MESSAGE,
+            dest=f"{subcommand}.db_profile",
+        )
+
+        parser.add_argument(
+            "--db-codec",
+            default="none",
+            type=str,
+            choices=DB_CODECS,
+            help=DATABASE_CODEC_HELP_MESSAGE,
+            dest=f"{subcommand}.db_codec",
+        )
+
+    @staticmethod
+    def _megajournal_names(value: str) -> list[str]:
+        try:
+            return resolve_megajournal_names(value=value)
+        except ValueError as error:
+            raise ArgumentTypeError(str(error)) from error
+
+    @staticmethod
+    def _add_http_cache_arguments(parser: ArgumentParser, subcommand: str) -> None:
+        parser.add_argument(
+            "--http-cache",
+            default=None,
+            type=lambda x: Path(x).resolve(),
+            help="Directory to cache HTTP responses in",
+            dest=f"{subcommand}.http_cache",
+        )
+
+        parser.add_argument(
+            "--replay",
+            action="store_true",
+            help=(
+                "Serve HTTP responses only from the cache "
+                f"(default: {DEFAULT_HTTP_CACHE_PATH.name})"
+            ),
+            dest=f"{subcommand}.replay",
+        )
+
     def add_version(self) -> None:  # noqa: D102
         self.parser.add_argument(
             "-v",
@@ -57,6 +117,7 @@ class Argparse(CLI):  # noqa: D101
             help=DATABASE_HELP_MESSAGE,
             dest="init.db",
         )
+        self._add_db_arguments(parser=parser, subcommand="init")
 
         parser.add_argument(
             "--max-year",
@@ -88,16 +149,44 @@ class Argparse(CLI):  # noqa: D101
             help=DATABASE_HELP_MESSAGE,
             dest="search.db",
         )
+        self._add_db_arguments(parser=parser, subcommand="search")
 
         parser.add_argument(
             "--megajournal",
-            default=next(iter(MEGAJOURNAL_MAPPING.keys())),
-            type=str,
-            choices=list(MEGAJOURNAL_MAPPING.keys()),
-            help="Journal to search for natural science documents reusing PTMs",
+            default=[next(iter(MEGAJOURNAL_MAPPING.keys()))],
+            type=self._megajournal_names,
+            help="Journals to search for natural science documents reusing PTMs, "
+            f"as `all` or a comma separated list of {list(MEGAJOURNAL_MAPPING.keys())}",
             dest="search.megajournal",
         )
 
+        parser.add_argument(
+            "--concurrency",
+            default=1,
+            type=int,
+            help="Number of search pages to request at the same time. Default is 1",
+            dest="search.concurrency",
+        )
+        self._add_http_cache_arguments(parser=parser, subcommand="search")
+
+        parser.add_argument(
+            "--restart",
+            action="store_true",
+            help=(
+                "Ignore the checkpoints of an earlier search and search every "
+                "page again"
+            ),
+            dest="search.restart",
+        )
+
+        parser.add_argument(
+            "--processes",
+            default=1,
+            type=int,
+            help="Number of processes to parse search pages with. Default is 1",
+            dest="search.processes",
+        )
+
     def add_openalex_subparser(self) -> None:  # noqa: D102
         parser: ArgumentParser = self.subparsers.add_parser(
             name="openalex",
@@ -112,6 +201,7 @@ class Argparse(CLI):  # noqa: D101
             help=DATABASE_HELP_MESSAGE,
             dest="openalex.db",
         )
+        self._add_db_arguments(parser=parser, subcommand="openalex")
 
         parser.add_argument(
             "--email",
@@ -121,6 +211,64 @@ class Argparse(CLI):  # noqa: D101
             dest="openalex.email",
         )
 
+        parser.add_argument(
+            "--concurrency",
+            default=DEFAULT_OPENALEX_CONCURRENCY,
+            type=int,
+            help="Number of OpenAlex requests to make at the same time. "
+            f"Default is {DEFAULT_OPENALEX_CONCURRENCY}",
+            dest="openalex.concurrency",
+        )
+
+        parser.add_argument(
+            "--max-age-days",
+            default=None,
+            type=float,
+            help="Fetch DOIs again when their stored metadata is older than this. "
+            "By default only DOIs without metadata are fetched",
+            dest="openalex.max_age_days",
+        )
+
+        parser.add_argument(
+            "--full",
+            action="store_true",
+            help="Fetch every DOI again, replacing the stored metadata",
+            dest="openalex.full",
+        )
+
+        parser.add_argument(
+            "--select",
+            default=[],
+            type=lambda x: [field.strip() for field in x.split(",") if field.strip()],
+            help="Comma separated work fields to store in addition to "
+            f"{', '.join(OPENALEX_REQUIRED_FIELDS)}",
+            dest="openalex.select",
+        )
+
+        parser.add_argument(
+            "--archive",
+            action="store_true",
+            help="Store full OpenAlex work records instead of the selected fields",
+            dest="openalex.archive",
+        )
+
+        parser.add_argument(
+            "--snapshot",
+            default=None,
+            type=lambda x: Path(x).resolve(),
+            help="Read works from a local OpenAlex snapshot directory of gzipped "
+            "JSON Lines partitions instead of the API",
+            dest="openalex.snapshot",
+        )
+
+        parser.add_argument(
+            "--processes",
+            default=1,
+            type=int,
+            help="Number of processes to scan snapshot partitions with. Default is 1",
+            dest="openalex.processes",
+        )
+
     def add_jats_subparser(self) -> None:  # noqa: D102
         parser: ArgumentParser = self.subparsers.add_parser(
             name="jats",
@@ -135,6 +283,7 @@ class Argparse(CLI):  # noqa: D101
             help=DATABASE_HELP_MESSAGE,
             dest="jats.db",
         )
+        self._add_db_arguments(parser=parser, subcommand="jats")
         parser.add_argument(
             "--megajournal",
             default=next(iter(MEGAJOURNAL_MAPPING.keys())),
@@ -150,6 +299,7 @@ class Argparse(CLI):  # noqa: D101
             help="Path to PLOS ZIP file containing all PLOS documents",
             dest="jats.plos_zip",
         )
+        self._add_http_cache_arguments(parser=parser, subcommand="jats")
 
     def add_pandoc_subparser(self) -> None:  # noqa: D102
         pandoc_parser: ArgumentParser = self.subparsers.add_parser(
@@ -165,6 +315,7 @@ class Argparse(CLI):  # noqa: D101
             help=DATABASE_HELP_MESSAGE,
             dest="pandoc.db",
         )
+        self._add_db_arguments(parser=pandoc_parser, subcommand="pandoc")
 
         pandoc_parser.add_argument(
             "--uri",
@@ -206,6 +357,7 @@ class Argparse(CLI):  # noqa: D101
             help=DATABASE_HELP_MESSAGE,
             dest="analyze.db",
         )
+        self._add_db_arguments(parser=parser, subcommand="analyze")
 
         parser.add_argument(
             "--index",
@@ -268,6 +420,86 @@ class Argparse(CLI):  # noqa: D101
             dest="analyze.system_prompt_id",
         )
 
+    def add_recompress_subparser(self) -> None:  # noqa: D102
+        parser: ArgumentParser = self.subparsers.add_parser(
+            name="recompress",
+            help="Recompress large text columns with the `--db-codec` codec",
+            description="Maintenance",
+        )
+
+        parser.add_argument(
+            "--db",
+            default=DEFAULT_DATABASE_PATH,
+            type=lambda x: Path(x).resolve(),
+            help=DATABASE_HELP_MESSAGE,
+            dest="recompress.db",
+        )
+        self._add_db_arguments(parser=parser, subcommand="recompress")
+
+        parser.add_argument(
+            "--vacuum",
+            action="store_true",
+            help="Vacuum the database afterwards to reclaim disk space",
+            dest="recompress.vacuum",
+        )
+
+    def add_export_subparser(self) -> None:  # noqa: D102
+        parser: ArgumentParser = self.subparsers.add_parser(
+            name="export",
+            help="Export the database to a partitioned Parquet dataset",
+            description="Maintenance",
+        )
+
+        parser.add_argument(
+            "--db",
+            default=DEFAULT_DATABASE_PATH,
+            type=lambda x: Path(x).resolve(),
+            help=DATABASE_HELP_MESSAGE,
+            dest="export.db",
+        )
+        self._add_db_arguments(parser=parser, subcommand="export")
+
+        parser.add_argument(
+            "--output",
+            default=DEFAULT_EXPORT_PATH,
+            type=lambda x: Path(x).resolve(),
+            help="Directory to write the Parquet dataset to",
+            dest="export.output",
+        )
+
+    def add_reparse_subparser(self) -> None:  # noqa: D102
+        parser: ArgumentParser = self.subparsers.add_parser(
+            name="reparse",
+            help="Rebuild articles from stored search results without the network",
+            description="Maintenance",
+        )
+
+        parser.add_argument(
+            "--db",
+            default=DEFAULT_DATABASE_PATH,
+            type=lambda x: Path(x).resolve(),
+            help=DATABASE_HELP_MESSAGE,
+            dest="reparse.db",
+        )
+        self._add_db_arguments(parser=parser, subcommand="reparse")
+
+        parser.add_argument(
+            "--megajournal",
+            default=next(iter(MEGAJOURNAL_MAPPING.keys())),
+            type=str,
+            choices=list(MEGAJOURNAL_MAPPING.keys()),
+            help="Journal to rebuild articles for",
+            dest="reparse.megajournal",
+        )
+
+        parser.add_argument(
+            "--processes",
+            default=1,
+            type=int,
+            help="Number of processes to parse search pages with. Default is 1",
+            dest="reparse.processes",
+        )
+
     def parse_cli(self) -> dict:  # noqa: D102
         return self.parser.parse_args().__dict__
 
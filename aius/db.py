@@ -4,39 +4,215 @@ SQLite3 Database class implementation.
 Copyright (C) 2025 Nicholas M. Synovic
 """
 
-import contextlib
+import lzma
 import warnings
+import zlib
+from collections.abc import Iterable, Iterator
+from contextlib import AbstractContextManager, nullcontext
+from itertools import islice
+from json import dumps, loads
 from logging import Logger
 from pathlib import Path
 from string import Template
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
 from pandas import DataFrame
+from pydantic import BaseModel
 from sqlalchemy import (
+    Alias,
     Boolean,
     Column,
+    ColumnElement,
+    Connection,
     DateTime,
     Engine,
     Float,
     ForeignKey,
+    Index,
+    Insert,
     Integer,
     MetaData,
     Row,
+    Select,
     String,
     Table,
+    TableClause,
     TextClause,
+    Update,
+    bindparam,
+    column,
     create_engine,
+    delete,
+    event,
+    func,
+    insert,
+    inspect,
+    or_,
+    select,
+    table,
     text,
+    update,
 )
+from sqlalchemy.engine.interfaces import DBAPIConnection, DBAPICursor
 from sqlalchemy.exc import OperationalError
+from sqlalchemy.pool import ConnectionPoolEntry
 
 from aius import MODULE_NAME
+from aius.openalex import extract_columns, extract_topic_rows
+from aius.util.doi import normalize_doi
 
 DEFAULT_DATABASE_PATH: Path = Path(f"{MODULE_NAME}.sqlite3").resolve()
 
+DEFAULT_EXPORT_PATH: Path = Path(f"{MODULE_NAME}_parquet").resolve()
+
+# Rows per chunk when streaming full-text tables out of the database
+DEFAULT_CHUNKSIZE: int = 100
+
+# Rows per `executemany` transaction when writing to the database
+DEFAULT_BATCH_SIZE: int = 1000
+
+# Thin alias kept for scripts and figures that read the view
+NATURAL_SCIENCE_VIEW_SQL: str = (
+    "CREATE VIEW natural_science_article_dois AS "
+    "SELECT doi FROM natural_science_articles"
+)
+
+
+class SQLiteProfile(BaseModel):  # noqa: D101
+    journal_mode: str = "WAL"
+    synchronous: str = "NORMAL"
+    cache_size: int = -65536  # Negative values are KiB rather than pages
+    mmap_size: int = 0
+    temp_store: str = "MEMORY"
+    busy_timeout: int = 60000  # Milliseconds
+    read_only: bool = False
+
+
+DB_PROFILES: dict[str, SQLiteProfile] = {
+    "safe": SQLiteProfile(
+        synchronous="FULL",
+        temp_store="DEFAULT",
+    ),
+    "fast": SQLiteProfile(
+        cache_size=-262144,
+        mmap_size=1073741824,
+    ),
+    "readonly": SQLiteProfile(
+        journal_mode="",  # Read-only connections cannot change the journal
+        cache_size=-262144,
+        mmap_size=1073741824,
+        read_only=True,
+    ),
+}
+
+DEFAULT_DB_PROFILE: str = "fast"
+
+# Large text columns that may be stored as compressed BLOBs
+COMPRESSED_COLUMNS: dict[str, list[str]] = {
+    "searches": ["json_data"],
+    "openalex": ["json_data"],
+    "jats": ["jats_xml"],
+    "markdown": ["markdown"],
+}
+
+# Free-text columns that are too unique to benefit from dictionary encoding
+PARQUET_PLAIN_COLUMNS: set[str] = {
+    "jats_xml",
+    "json_data",
+    "json_string",
+    "markdown",
+    "model_reasoning",
+    "model_response",
+    "prompt",
+    "title",
+    "url",
+}
+
+# Hive partitions of exported tables that can be tied to an article
+PARQUET_PARTITIONING: ds.Partitioning = ds.partitioning(
+    schema=pa.schema(
+        fields=[("megajournal", pa.string()), ("publication_year", pa.int64())]
+    ),
+    flavor="hive",
+)
+
+# Analysis tables and the `_llm_prompts.tag` of the prompt that produced them
+ANALYSIS_TABLES: dict[str, str] = {
+    "uses_dl_analysis": "uses_dl",
+    "uses_ptms_analysis": "uses_ptms",
+    "identify_ptms_analysis": "identify_ptms",
+    "identify_ptm_reuse_analysis": "identify_ptm_reuse",
+    "identify_ptm_impact_analysis": "identify_ptm_impact",
+}
+
+# Compatibility views that rejoin the prompt and document text of an analysis
+ANALYSIS_VIEW_TEMPLATE: Template = Template(
+    template="""CREATE VIEW ${table_name}_text AS
+    SELECT
+        a._id,
+        a.doi,
+        p.prompt AS system_prompt,
+        aius_decode(m.markdown) AS user_prompt,
+        a.model_response,
+        a.model_reasoning,
+        a.compute_time_seconds
+    FROM ${table_name} a
+    LEFT JOIN _llm_prompts p ON p._id = a.llm_prompt_id
+    LEFT JOIN markdown m ON m._id = a.markdown_id
+    """
+)
+
+
+class ColumnCodec:  # noqa: D101
+    # Compressed values are prefixed with a tag naming their codec, so values
+    # written with any codec (or none at all) can be read back
+    TAGS: dict[str, bytes] = {"zlib": b"zlib:", "lzma": b"lzma:"}
+
+    def __init__(self, name: str = "none") -> None:  # noqa: D107
+        self.name: str = name
+
+    def encode(self, value: str | None) -> str | bytes | None:  # noqa: D102
+        if value is None or self.name == "none":
+            return value
+
+        data: bytes = value.encode(encoding="UTF-8")
+        match self.name:
+            case "zlib":
+                return self.TAGS["zlib"] + zlib.compress(data, level=6)
+            case "lzma":
+                return self.TAGS["lzma"] + lzma.compress(data)
+            case _:
+                msg: str = f"Unknown column codec: {self.name}"
+                raise ValueError(msg)
+
+    @classmethod
+    def decode(cls, value: str | bytes | None) -> str | None:  # noqa: D102
+        if not isinstance(value, bytes):
+            return value
+
+        if value.startswith(cls.TAGS["zlib"]):
+            value = zlib.decompress(value[len(cls.TAGS["zlib"]) :])
+        elif value.startswith(cls.TAGS["lzma"]):
+            value = lzma.decompress(value[len(cls.TAGS["lzma"]) :])
+
+        return value.decode(encoding="UTF-8")
+
+
+DB_CODECS: list[str] = ["none", *ColumnCodec.TAGS.keys()]
+
 
 class DB:  # noqa: D101
-    def __init__(self, logger: Logger, db_path: Path) -> None:  # noqa: D107
+    def __init__(  # noqa: D107
+        self,
+        logger: Logger,
+        db_path: Path,
+        profile: str | SQLiteProfile = DEFAULT_DB_PROFILE,
+        codec: str = "none",
+    ) -> None:
         self.logger: Logger = logger
 
         # Supress warnings
@@ -44,16 +220,91 @@ class DB:  # noqa: D101
 
         # Establish class variables
         self.metadata: MetaData = MetaData()
+        self.profile: SQLiteProfile = (
+            DB_PROFILES[profile] if isinstance(profile, str) else profile
+        )
+        self.logger.info("SQLite3 profile: %s", self.profile)
+        self.codec: ColumnCodec = ColumnCodec(name=codec)
+        self.logger.info("Column codec: %s", self.codec.name)
 
         # Connect to the database
         uri: str = f"sqlite:///{db_path}"
+        if self.profile.read_only:
+            uri = f"sqlite:///file:{db_path}?mode=ro&uri=true"
+
         self.engine: Engine = create_engine(url=uri)
+        event.listen(self.engine, "connect", self._apply_profile)
         self.logger.info("Connected to SQLite3 database: %s", uri)
 
         # Create tables if they do not exists
         self._create_tables()
         self.logger.info("Created tables if they did not already exist")
 
+        if self.profile.read_only:
+            return
+
+        # Create indexes that older databases may be missing
+        self.ensure_indexes()
+
+        # Derive the topics and indexed columns of `openalex` rows ingested
+        # before they existed; the natural science filter and figures read them
+        self.backfill_openalex_topics()
+        self.backfill_openalex_columns()
+
+        # Pick up `openalex` rows written since the last connection
+        self.refresh_natural_science_articles()
+
+        # Deduplicate the articles of databases created before `documents`
+        self.backfill_documents()
+
+    @staticmethod
+    def _normalize_doi_or_none(doi: str | None) -> str | None:
+        return None if doi is None else normalize_doi(doi=doi)
+
+    def _apply_profile(
+        self,
+        dbapi_connection: DBAPIConnection,
+        _connection_record: ConnectionPoolEntry,
+    ) -> None:
+        # Runs once for every new connection added to the pool
+        pragmas: dict[str, str | int] = {
+            "journal_mode": self.profile.journal_mode,
+            "synchronous": self.profile.synchronous,
+            "cache_size": self.profile.cache_size,
+            "mmap_size": self.profile.mmap_size,
+            "temp_store": self.profile.temp_store,
+            "busy_timeout": self.profile.busy_timeout,
+            "query_only": int(self.profile.read_only),
+        }
+
+        # Lets views and raw SQL decompress `COMPRESSED_COLUMNS` values
+        dbapi_connection.create_function(
+            "aius_decode",
+            1,
+            ColumnCodec.decode,
+            deterministic=True,
+        )
+
+        # Lets SQL join raw DOIs, e.g. of `articles`, to normalized ones
+        dbapi_connection.create_function(
+            "aius_normalize_doi",
+            1,
+            self._normalize_doi_or_none,
+            deterministic=True,
+        )
+
+        cursor: DBAPICursor = dbapi_connection.cursor()
+
+        pragma: str
+        value: str | int
+        for pragma, value in pragmas.items():
+            if value == "":
+                continue
+
+            cursor.execute(f"PRAGMA {pragma} = {value};")
+
+        cursor.close()
+
     def _create_tables(self) -> None:
         # CO-STAR LLM prompts
         _: Table = Table(
@@ -74,6 +325,31 @@ class DB:  # noqa: D101
             Column("field", String),
         )
 
+        # Natural science DOIs materialized from `openalex`
+        _: Table = Table(
+            "natural_science_articles",
+            self.metadata,
+            Column("doi", String, primary_key=True),
+            Column("openalex_id", Integer, ForeignKey("openalex._id")),
+        )
+
+        # Refresh state of the `natural_science_articles` table
+        _: Table = Table(
+            "_natural_science_watermark",
+            self.metadata,
+            Column("_id", Integer, primary_key=True),
+            Column("openalex_id", Integer),
+            Column("fields", String),
+        )
+
+        # Backfill state of the indexed `openalex` columns
+        _: Table = Table(
+            "_openalex_columns_watermark",
+            self.metadata,
+            Column("_id", Integer, primary_key=True),
+            Column("openalex_id", Integer),
+        )
+
         # Keywords to search journals with
         _: Table = Table(
             "_search_keywords",
@@ -96,7 +372,7 @@ class DB:  # noqa: D101
             self.metadata,
             Column("_id", Integer, primary_key=True),
             Column("timestamp", DateTime),
-            Column("megajournal", String),
+            Column("megajournal", String, index=True),
             Column("search_keyword", String),
             Column("year", Integer),
             Column("url", String),
@@ -105,16 +381,64 @@ class DB:  # noqa: D101
             Column("json_data", String),
         )
 
+        # Search pages that were fully written, so interrupted searches resume
+        _: Table = Table(
+            "_search_checkpoints",
+            self.metadata,
+            Column("_id", Integer, primary_key=True),
+            Column("megajournal", String),
+            Column("search_keyword", String),
+            Column("year", Integer),
+            Column("page", Integer),
+            Column("search_id", Integer, ForeignKey("searches._id")),
+            Index(
+                "ix__search_checkpoints_page",
+                "megajournal",
+                "search_keyword",
+                "year",
+                "page",
+                unique=True,
+            ),
+        )
+
         # Articles table
         _: Table = Table(
             "articles",
             self.metadata,
             Column("_id", Integer, primary_key=True),
-            Column("search_id", Integer, ForeignKey("searches._id")),
+            Column("search_id", Integer, ForeignKey("searches._id"), index=True),
+            Column("doi", String, index=True),
+            Column("title", String),
+            Column("megajournal", String, index=True),
+            Column("journal", String),
+        )
+
+        # One row per paper, keyed by normalized DOI, however many searches
+        # and keywords returned it
+        _: Table = Table(
+            "documents",
+            self.metadata,
+            Column("_id", Integer, primary_key=True),
             Column("doi", String),
+            Column("megajournal", String, index=True),
             Column("title", String),
-            Column("megajournal", String),
             Column("journal", String),
+            Index("ix_documents_doi", "doi", unique=True),
+        )
+
+        # Searches that returned each document
+        _: Table = Table(
+            "document_searches",
+            self.metadata,
+            Column("_id", Integer, primary_key=True),
+            Column("document_id", Integer, ForeignKey("documents._id")),
+            Column("search_id", Integer, ForeignKey("searches._id"), index=True),
+            Index(
+                "ix_document_searches_link",
+                "document_id",
+                "search_id",
+                unique=True,
+            ),
         )
 
         # OpenAlex table
@@ -123,21 +447,45 @@ class DB:  # noqa: D101
             self.metadata,
             Column("_id", Integer, primary_key=True),
             Column("timestamp", DateTime),
-            Column("doi", String),
-            Column("cited_by_count", Integer),
-            Column("open_access", Boolean),
-            Column("topic_0", String),
-            Column("topic_1", String),
-            Column("topic_2", String),
+            Column("doi", String, index=True),
+            Column("cited_by_count", Integer, index=True),
+            Column("open_access", Boolean, index=True),
+            Column("topic_0", String, index=True),
+            Column("topic_1", String, index=True),
+            Column("topic_2", String, index=True),
+            Column("publication_year", Integer, index=True),
+            Column("type", String, index=True),
+            Column("primary_topic_field", String, index=True),
             Column("json_data", String),
         )
 
+        # OpenAlex topics table; one row per ranked topic of an `openalex` row
+        _: Table = Table(
+            "openalex_topics",
+            self.metadata,
+            Column("_id", Integer, primary_key=True),
+            Column("openalex_id", Integer, ForeignKey("openalex._id")),
+            Column("doi", String, index=True),
+            Column("rank", Integer),
+            Column("field_id", Integer),
+            Column("field_name", String),
+            Column("subfield", String),
+            Column("score", Float),
+            Index(
+                "ix_openalex_topics_rank",
+                "openalex_id",
+                "rank",
+                unique=True,
+            ),
+            Index("ix_openalex_topics_field", "field_id", "rank", "openalex_id"),
+        )
+
         # JATS table
         _: Table = Table(
             "jats",
             self.metadata,
             Column("_id", Integer, primary_key=True),
-            Column("doi", String),
+            Column("doi", String, index=True),
             Column("jats_xml", String),
         )
 
@@ -146,7 +494,7 @@ class DB:  # noqa: D101
             "markdown",
             self.metadata,
             Column("_id", Integer, primary_key=True),
-            Column("doi", String),
+            Column("doi", String, index=True),
             Column("markdown", String),
         )
 
@@ -155,9 +503,9 @@ class DB:  # noqa: D101
             "uses_dl_analysis",
             self.metadata,
             Column("_id", Integer, primary_key=True),
-            Column("doi", String),
-            Column("system_prompt", String),
-            Column("user_prompt", String),
+            Column("doi", String, index=True),
+            Column("markdown_id", Integer, ForeignKey("markdown._id"), index=True),
+            Column("llm_prompt_id", Integer, ForeignKey("_llm_prompts._id")),
             Column("model_response", String),
             Column("model_reasoning", String),
             Column("compute_time_seconds", Float),
@@ -168,9 +516,9 @@ class DB:  # noqa: D101
             "uses_ptms_analysis",
             self.metadata,
             Column("_id", Integer, primary_key=True),
-            Column("doi", String),
-            Column("system_prompt", String),
-            Column("user_prompt", String),
+            Column("doi", String, index=True),
+            Column("markdown_id", Integer, ForeignKey("markdown._id"), index=True),
+            Column("llm_prompt_id", Integer, ForeignKey("_llm_prompts._id")),
             Column("model_response", String),
             Column("model_reasoning", String),
             Column("compute_time_seconds", Float),
@@ -181,9 +529,9 @@ class DB:  # noqa: D101
             "identify_ptms_analysis",
             self.metadata,
             Column("_id", Integer, primary_key=True),
-            Column("doi", String),
-            Column("system_prompt", String),
-            Column("user_prompt", String),
+            Column("doi", String, index=True),
+            Column("markdown_id", Integer, ForeignKey("markdown._id"), index=True),
+            Column("llm_prompt_id", Integer, ForeignKey("_llm_prompts._id")),
             Column("model_response", String),
             Column("model_reasoning", String),
             Column("compute_time_seconds", Float),
@@ -194,9 +542,9 @@ class DB:  # noqa: D101
             "identify_ptm_reuse_analysis",
             self.metadata,
             Column("_id", Integer, primary_key=True),
-            Column("doi", String),
-            Column("system_prompt", String),
-            Column("user_prompt", String),
+            Column("doi", String, index=True),
+            Column("markdown_id", Integer, ForeignKey("markdown._id"), index=True),
+            Column("llm_prompt_id", Integer, ForeignKey("_llm_prompts._id")),
             Column("model_response", String),
             Column("model_reasoning", String),
             Column("compute_time_seconds", Float),
@@ -207,45 +555,176 @@ class DB:  # noqa: D101
             "identify_ptm_impact_analysis",
             self.metadata,
             Column("_id", Integer, primary_key=True),
-            Column("doi", String),
-            Column("system_prompt", String),
-            Column("user_prompt", String),
+            Column("doi", String, index=True),
+            Column("markdown_id", Integer, ForeignKey("markdown._id"), index=True),
+            Column("llm_prompt_id", Integer, ForeignKey("_llm_prompts._id")),
             Column("model_response", String),
             Column("model_reasoning", String),
             Column("compute_time_seconds", Float),
         )
 
+        # Table definitions are still needed to read a read-only database
+        if self.profile.read_only:
+            return
+
         self.metadata.create_all(bind=self.engine, checkfirst=True)
+        self._ensure_columns()
 
-        view_sql = """
-            CREATE VIEW IF NOT EXISTS natural_science_article_dois AS
-            WITH field_values AS (
-                SELECT
-                    field
-                FROM
-                    _openalex_natural_science_fields
+        with self.engine.begin() as conn:
+            table_name: str
+            for table_name in ANALYSIS_TABLES:
+                view_sql: str = ANALYSIS_VIEW_TEMPLATE.substitute(table_name=table_name)
+
+                # Views created before `aius_decode` returned compressed BLOBs
+                existing_analysis_view_sql: str | None = conn.execute(
+                    statement=text(
+                        "SELECT sql FROM sqlite_master WHERE type = 'view' "
+                        "AND name = :name;"
+                    ),
+                    parameters={"name": f"{table_name}_text"},
+                ).scalar()
+
+                if existing_analysis_view_sql != view_sql:
+                    conn.execute(
+                        statement=text(f"DROP VIEW IF EXISTS {table_name}_text;")
+                    )
+                    conn.execute(statement=text(view_sql))
+
+        # Only replace the view when its definition changed; older databases
+        # computed it from `openalex` on every read
+        existing_view_sql: str | None
+        with self.engine.begin() as conn:
+            existing_view_sql = conn.execute(
+                statement=text(
+                    "SELECT sql FROM sqlite_master WHERE type = 'view' "
+                    "AND name = 'natural_science_article_dois';"
+                )
+            ).scalar()
+
+            if existing_view_sql != NATURAL_SCIENCE_VIEW_SQL:
+                conn.execute(text("DROP VIEW IF EXISTS natural_science_article_dois;"))
+                conn.execute(text(NATURAL_SCIENCE_VIEW_SQL))
+                self.logger.info("Created `natural_science_article_dois` view")
+
+    def ensure_indexes(self) -> None:  # noqa: D102
+        # `create_all` skips the indexes of tables that already exist, so
+        # databases created before an index was declared need them created here
+        with self.engine.begin() as conn:
+            table: Table
+            for table in self.metadata.sorted_tables:
+                index: Index
+                for index in table.indexes:
+                    index.create(bind=conn, checkfirst=True)
+
+            # Let SQLite gather query planner statistics for new indexes
+            conn.execute(text("PRAGMA optimize;"))
+
+        self.logger.info("Ensured indexes exist on all tables")
+
+    def _insert_natural_science_articles(self, *conditions: ColumnElement) -> Insert:
+        # The earliest `openalex` row of each cited DOI with a natural science
+        # field among its top three topics, limited to rows matching `conditions`
+        openalex: Table = self.metadata.tables["openalex"]
+        topics: Table = self.metadata.tables["openalex_topics"]
+        fields: Table = self.metadata.tables["_openalex_natural_science_fields"]
+
+        return (
+            insert(self.metadata.tables["natural_science_articles"])
+            .prefix_with("OR IGNORE")
+            .from_select(
+                ["doi", "openalex_id"],
+                select(openalex.c.doi, func.min(openalex.c._id))
+                .where(
+                    *conditions,
+                    openalex.c.cited_by_count > 0,
+                    openalex.c._id.in_(
+                        select(topics.c.openalex_id).where(
+                            topics.c.rank < 3,
+                            topics.c.field_id.in_(select(fields.c.openalex_id)),
+                        )
+                    ),
+                )
+                .group_by(openalex.c.doi),
             )
-            SELECT
-                DISTINCT oa.doi
-            FROM
-                openalex oa
-            WHERE
-                oa.cited_by_count > 0
-                AND (
-                    oa.topic_0 IN (SELECT field FROM field_values)
-                    OR oa.topic_1 IN (SELECT field FROM field_values)
-                    OR oa.topic_2 IN (SELECT field FROM field_values)
+        )
+
+    def refresh_natural_science_articles(self) -> None:  # noqa: D102
+        with self.engine.begin() as conn:
+            state: Row | None = conn.execute(
+                statement=text(
+                    "SELECT openalex_id, fields FROM _natural_science_watermark "
+                    "WHERE _id = 1;"
                 )
-            ;
-            """
+            ).first()
 
-        # Execute the SQL to create the view
-        with self.engine.connect() as conn:
-            conn.execute(text("DROP VIEW IF EXISTS natural_science_article_dois;"))
-            conn.execute(text(view_sql))
-            conn.commit()
+            watermark: int = -1
+            previous_fields: set[int] = set()
+            if state is not None:
+                watermark = int(state[0])
+                # Watermarks written before topics were normalized hold field
+                # names; dropping them reprocesses every current field once
+                previous_fields = {
+                    field for field in loads(s=state[1]) if isinstance(field, int)
+                }
+
+            current_fields: set[int] = set(
+                conn.execute(
+                    statement=text(
+                        "SELECT openalex_id FROM _openalex_natural_science_fields;"
+                    )
+                ).scalars()
+            )
+
+            # Reprocess every DOI with a topic that entered or left the filter
+            changed_fields: list[int] = sorted(previous_fields ^ current_fields)
+            if state is not None and len(changed_fields) > 0:
+                self.logger.info("Natural science fields changed: %s", changed_fields)
+
+                conn.execute(
+                    statement=text(
+                        "DELETE FROM natural_science_articles WHERE doi IN ("
+                        "SELECT doi FROM openalex_topics "
+                        "WHERE rank < 3 AND field_id IN :fields);"
+                    ).bindparams(bindparam(key="fields", expanding=True)),
+                    parameters={"fields": changed_fields},
+                )
+                topics: Table = self.metadata.tables["openalex_topics"]
+                conn.execute(
+                    statement=self._insert_natural_science_articles(
+                        self.metadata.tables["openalex"].c.doi.in_(
+                            select(topics.c.doi).where(
+                                topics.c.rank < 3,
+                                topics.c.field_id.in_(changed_fields),
+                            )
+                        )
+                    )
+                )
 
-        self.logger.info("Created `natural_science_article_dois` view")
+            # Process rows appended to `openalex` since the last refresh
+            conn.execute(
+                statement=self._insert_natural_science_articles(
+                    self.metadata.tables["openalex"].c._id > watermark
+                )
+            )
+
+            max_openalex_id: int | None = conn.execute(
+                statement=text("SELECT MAX(_id) FROM openalex;")
+            ).scalar()
+
+            conn.execute(
+                statement=text(
+                    "INSERT OR REPLACE INTO _natural_science_watermark "
+                    "(_id, openalex_id, fields) VALUES (1, :openalex_id, :fields);"
+                ),
+                parameters={
+                    "openalex_id": watermark
+                    if max_openalex_id is None
+                    else max_openalex_id,
+                    "fields": dumps(obj=sorted(current_fields)),
+                },
+            )
+
+        self.logger.info("Refreshed `natural_science_articles` table")
 
     def get_search_keywords(self) -> list[str]:  # noqa: D102
         df: DataFrame = pd.read_sql_table(
@@ -278,56 +757,918 @@ class DB:  # noqa: D101
 
         return df[df["tag"] == llm_prompt_id]["prompt"].to_list()[0]
 
-    def get_last_row_id(self, table_name: str) -> int:  # noqa: D102
-        last_row_id: int = -1
+    def get_search_checkpoints(  # noqa: D102
+        self,
+        megajournal: str,
+    ) -> dict[tuple[str, int, int], int]:
+        with self.engine.connect() as conn:
+            rows: list[Row] = conn.execute(
+                statement=text(
+                    "SELECT search_keyword, year, page, search_id "
+                    "FROM _search_checkpoints WHERE megajournal = :megajournal;"
+                ),
+                parameters={"megajournal": megajournal},
+            ).all()
+
+        self.logger.info("Retrieved %s %s search checkpoints", len(rows), megajournal)
+
+        return {(row[0], int(row[1]), int(row[2])): int(row[3]) for row in rows}
+
+    def add_search_checkpoint(  # noqa: D102
+        self,
+        megajournal: str,
+        search_keyword: str,
+        year: int,
+        page: int,
+        search_id: int,
+    ) -> None:
+        with self.engine.begin() as conn:
+            conn.execute(
+                statement=text(
+                    "INSERT OR REPLACE INTO _search_checkpoints "
+                    "(megajournal, search_keyword, year, page, search_id) "
+                    "VALUES (:megajournal, :search_keyword, :year, :page, :search_id);"
+                ),
+                parameters={
+                    "megajournal": megajournal,
+                    "search_keyword": search_keyword,
+                    "year": year,
+                    "page": page,
+                    "search_id": search_id,
+                },
+            )
+
+    def upsert_documents(  # noqa: D102
+        self,
+        articles: DataFrame | Iterable[BaseModel],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        conn: Connection | None = None,
+    ) -> None:
+        # Papers are inserted once per normalized DOI; empty titles and
+        # journals are filled in by later searches that have them
+        upsert_sql: TextClause = text(
+            "INSERT INTO documents (doi, megajournal, title, journal) "
+            "VALUES (:doi, :megajournal, :title, :journal) "
+            "ON CONFLICT (doi) DO UPDATE SET "
+            "title = COALESCE(NULLIF(documents.title, ''), excluded.title), "
+            "journal = COALESCE(NULLIF(documents.journal, ''), excluded.journal);"
+        )
+        link_sql: TextClause = text(
+            "INSERT OR IGNORE INTO document_searches (document_id, search_id) "
+            "SELECT _id, :search_id FROM documents WHERE doi = :doi;"
+        )
+
+        batch: list[dict]
+        for batch in self._iter_row_batches(rows=articles, batch_size=batch_size):
+            rows: list[dict] = [
+                {
+                    "doi": normalize_doi(doi=row["doi"]),
+                    "megajournal": row.get("megajournal"),
+                    "title": row.get("title"),
+                    "journal": row.get("journal"),
+                    "search_id": row.get("search_id"),
+                }
+                for row in batch
+                if row.get("doi")
+            ]
+            links: list[dict] = [row for row in rows if row["search_id"] is not None]
+
+            if len(rows) == 0:
+                continue
+
+            with self._begin(conn=conn) as batch_conn:
+                batch_conn.execute(statement=upsert_sql, parameters=rows)
+                if len(links) > 0:
+                    batch_conn.execute(statement=link_sql, parameters=links)
+
+            self.logger.debug("Upserted %s documents", len(rows))
+
+    def backfill_documents(self) -> None:  # noqa: D102
+        # Databases created before `documents` existed derive it once from
+        # `articles`; afterwards searches upsert their own documents
+        if self.get_row_count(table_name="documents") > 0:
+            return
+
+        df: DataFrame
+        for df in self.iter_table(
+            table_name="articles",
+            columns=["doi", "megajournal", "title", "journal", "search_id"],
+            chunksize=DEFAULT_BATCH_SIZE,
+        ):
+            self.upsert_documents(articles=df)
+
+        self.logger.info(
+            "Backfilled %s documents from `articles`",
+            self.get_row_count(table_name="documents"),
+        )
+
+    def backfill_openalex_topics(self) -> None:  # noqa: D102
+        # Databases created before `openalex_topics` existed derive it once
+        # from `openalex.json_data`; afterwards `upsert_openalex` writes topics
+        if self.get_row_count(table_name="openalex_topics") > 0:
+            return
+
+        df: DataFrame
+        for df in self.iter_table(
+            table_name="openalex",
+            columns=["_id", "doi", "json_data"],
+            where="json_data IS NOT NULL",
+            chunksize=DEFAULT_BATCH_SIZE,
+        ):
+            self.insert_openalex_topics(
+                openalex_ids=[int(_id) for _id in df.index],
+                topics=[
+                    extract_topic_rows(
+                        doi=doi,
+                        topics=loads(s=json_data).get("topics") or [],
+                    )
+                    for doi, json_data in zip(df["doi"], df["json_data"], strict=True)
+                ],
+            )
+
+        self.logger.info(
+            "Backfilled %s topics from `openalex`",
+            self.get_row_count(table_name="openalex_topics"),
+        )
+
+    def backfill_openalex_columns(self) -> None:  # noqa: D102
+        # `upsert_openalex` rows carry their columns. Rows up to the watermark
+        # were checked before, so a legitimately null column is decoded once
+        with self.engine.connect() as conn:
+            watermark: int = int(
+                conn.execute(
+                    statement=text(
+                        "SELECT COALESCE(MAX(openalex_id), -1) "
+                        "FROM _openalex_columns_watermark;"
+                    )
+                ).scalar()
+            )
+            max_openalex_id: int | None = conn.execute(
+                statement=text("SELECT MAX(_id) FROM openalex;")
+            ).scalar()
+
+        if max_openalex_id is None or max_openalex_id <= watermark:
+            return
+
+        backfilled_rows: int = 0
+
+        df: DataFrame
+        for df in self.iter_table(
+            table_name="openalex",
+            columns=["_id", "json_data"],
+            where="_id > :watermark AND _id <= :max_openalex_id "
+            "AND type IS NULL AND json_data IS NOT NULL",
+            parameters={"watermark": watermark, "max_openalex_id": max_openalex_id},
+            chunksize=DEFAULT_BATCH_SIZE,
+        ):
+            self.update_rows(
+                table_name="openalex",
+                rows=[
+                    {"_id": int(_id), **extract_columns(result=loads(s=json_data))}
+                    for _id, json_data in df["json_data"].items()
+                ],
+            )
+            backfilled_rows += len(df)
+
+        with self.engine.begin() as conn:
+            conn.execute(
+                statement=text(
+                    "INSERT OR REPLACE INTO _openalex_columns_watermark "
+                    "(_id, openalex_id) VALUES (1, :openalex_id);"
+                ),
+                parameters={"openalex_id": max_openalex_id},
+            )
+
+        self.logger.info(
+            "Backfilled the columns of %s `openalex` rows", backfilled_rows
+        )
+
+    def upsert_openalex(  # noqa: D102
+        self,
+        rows: list[BaseModel],
+        topics: list[list[BaseModel]] | None = None,
+    ) -> None:
+        if len(rows) == 0:
+            return
 
-        sql_template = Template(template="SELECT _id FROM ${tn} ORDER BY _id DESC;")
-        sql: TextClause = text(sql_template.substitute(tn=table_name))
+        # Earlier rows of the DOIs, and the natural science entries and topics
+        # derived from them, are replaced
+        dois: list[str] = sorted({row.doi for row in rows})
 
-        self.logger.debug("Created SQL query: %s", sql)
+        with self.engine.begin() as conn:
+            table_name: str
+            for table_name in [
+                "natural_science_articles",
+                "openalex_topics",
+                "openalex",
+            ]:
+                doi_table: Table = self.metadata.tables[table_name]
+                conn.execute(
+                    statement=delete(doi_table).where(doi_table.c.doi.in_(dois))
+                )
 
-        with contextlib.suppress(TypeError):
-            # Removes try - except in code; pretty neat!
-            last_row: Row | None = self.engine.connect().execute(statement=sql).first()
+        row_ids: list[int] = self.bulk_insert(table_name="openalex", rows=rows)
 
-            if last_row is not None:
-                last_row_id = int(last_row[0])
-            else:
-                self.logger.debug("Last row returned `None`")
+        if topics is not None:
+            self.insert_openalex_topics(openalex_ids=row_ids, topics=topics)
 
-        return last_row_id
+        # SQLite reuses the `_id` of a deleted row when it was the largest, so
+        # a new row may sit at or below the `refresh_natural_science_articles`
+        # watermark. The DOIs are re-evaluated here instead
+        with self.engine.begin() as conn:
+            conn.execute(
+                statement=self._insert_natural_science_articles(
+                    self.metadata.tables["openalex"].c.doi.in_(dois)
+                )
+            )
+
+    def insert_openalex_topics(  # noqa: D102
+        self,
+        openalex_ids: list[int],
+        topics: list[list[BaseModel]],
+    ) -> None:
+        # `topics[i]` holds the ranked topics of the `openalex` row `openalex_ids[i]`
+        rows: list[dict] = [
+            {"openalex_id": openalex_id, **topic.model_dump()}
+            for openalex_id, row_topics in zip(openalex_ids, topics, strict=True)
+            for topic in row_topics
+        ]
+
+        if len(rows) == 0:
+            return
+
+        self.bulk_insert(table_name="openalex_topics", rows=DataFrame(data=rows))
+
+    def clear_search_checkpoints(self, megajournal: str) -> None:  # noqa: D102
+        with self.engine.begin() as conn:
+            conn.execute(
+                statement=text(
+                    "DELETE FROM _search_checkpoints WHERE megajournal = :megajournal;"
+                ),
+                parameters={"megajournal": megajournal},
+            )
+
+        self.logger.info("Cleared the %s search checkpoints", megajournal)
+
+    def get_llm_prompt_id(self, tag: str) -> int:  # noqa: D102
+        with self.engine.connect() as conn:
+            return int(
+                conn.execute(
+                    statement=text(
+                        "SELECT MIN(_id) FROM _llm_prompts WHERE tag = :tag;"
+                    ),
+                    parameters={"tag": tag},
+                ).scalar_one()
+            )
 
     def write_dataframe_to_table(  # noqa: D102
         self,
         table_name: str,
         df: DataFrame,
-    ) -> None:
+    ) -> list[int]:
         self.logger.info("Writing data to the `%s` table", table_name)
         self.logger.debug("Data: %s", table_name)
-        df.to_sql(
-            name=table_name,
-            con=self.engine,
-            if_exists="append",
-            index=True,
-            index_label="_id",
-        )
+        row_ids: list[int] = self.bulk_insert(table_name=table_name, rows=df)
         self.logger.info("Wrote data to the `%s` table", table_name)
+        return row_ids
+
+    @staticmethod
+    def _model_to_row(model: BaseModel) -> dict:
+        # Nested JSON payloads are stored as strings, matching `to_df`
+        return {
+            key: dumps(obj=value) if isinstance(value, dict | list) else value
+            for key, value in model.model_dump().items()
+        }
+
+    def _iter_row_batches(
+        self,
+        rows: DataFrame | Iterable[BaseModel],
+        batch_size: int,
+    ) -> Iterator[list[dict]]:
+        if isinstance(rows, DataFrame):
+            start: int
+            for start in range(0, rows.shape[0], batch_size):
+                chunk: DataFrame = rows.iloc[start : start + batch_size]
+                yield (
+                    chunk.astype(object)
+                    .where(chunk.notna(), None)
+                    .to_dict(orient="records")
+                )
+
+            return
+
+        models: Iterator[BaseModel] = iter(rows)
+        while batch := [
+            self._model_to_row(model=model) for model in islice(models, batch_size)
+        ]:
+            yield batch
+
+    def bulk_insert(  # noqa: D102
+        self,
+        table_name: str,
+        rows: DataFrame | Iterable[BaseModel],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        conn: Connection | None = None,
+    ) -> list[int]:
+        # Validate the table name against the schema
+        table_name = self.metadata.tables[table_name].name
+
+        compressed_columns: list[str] = COMPRESSED_COLUMNS.get(table_name, [])
+
+        row_ids: list[int] = []
+
+        batch: list[dict]
+        for batch in self._iter_row_batches(rows=rows, batch_size=batch_size):
+            # SQLite assigns `_id` (an INTEGER PRIMARY KEY) to rows without one
+            batch = [  # noqa: PLW2901
+                {
+                    key: self.codec.encode(value=value)
+                    if key in compressed_columns
+                    else value
+                    for key, value in row.items()
+                    if key != "_id"
+                }
+                for row in batch
+            ]
+
+            # Untyped columns bind values as-is, as `DataFrame.to_sql` did
+            statement: Insert = insert(
+                table(table_name, *[column(key) for key in batch[0]])
+            )
+
+            # One `executemany` per batch inside a single transaction. The
+            # transaction holds the write lock, so the assigned ids are the
+            # contiguous run ending at `last_insert_rowid()`
+            with self._begin(conn=conn) as batch_conn:
+                batch_conn.execute(statement, batch)
+                last_row_id: int = int(
+                    batch_conn.execute(
+                        statement=text("SELECT last_insert_rowid();")
+                    ).scalar()
+                )
+
+            row_ids.extend(range(last_row_id - len(batch) + 1, last_row_id + 1))
+            self.logger.debug(
+                "Inserted %s rows into the `%s` table", len(row_ids), table_name
+            )
+
+        return row_ids
+
+    def _begin(
+        self,
+        conn: Connection | None = None,
+    ) -> AbstractContextManager[Connection]:
+        # Join the caller's transaction, or commit in a transaction of its own
+        return self.engine.begin() if conn is None else nullcontext(enter_result=conn)
 
     def read_table_to_dataframe(self, table_name: str) -> DataFrame:  # noqa: D102
         self.logger.info("Reading data to the `%s` table", table_name)
         self.logger.debug("Data: %s", table_name)
-        return pd.read_sql_table(
-            table_name=table_name,
-            con=self.engine,
-            index_col="_id",
+        return self._decode_dataframe(
+            df=pd.read_sql_table(
+                table_name=table_name,
+                con=self.engine,
+                index_col="_id",
+            )
+        )
+
+    @staticmethod
+    def _decode_dataframe(df: DataFrame) -> DataFrame:
+        # Joins drop the table name, so decode by column name alone; plain
+        # text values pass through untouched
+        compressed_columns: set[str] = {
+            column_name
+            for column_names in COMPRESSED_COLUMNS.values()
+            for column_name in column_names
+        }
+
+        column_name: str
+        for column_name in compressed_columns.intersection(df.columns):
+            df[column_name] = df[column_name].map(ColumnCodec.decode)
+
+        return df
+
+    def _get_existing_columns(
+        self,
+        table_name: str,
+        conn: Connection | None = None,
+    ) -> set[str]:
+        # Columns as they exist on disk, which may lag behind `self.metadata`
+        return {
+            column_info["name"]
+            for column_info in inspect(
+                subject=self.engine if conn is None else conn
+            ).get_columns(table_name=table_name)
+        }
+
+    def _ensure_columns(self) -> None:
+        # `create_all` does not alter existing tables, so add columns that were
+        # declared after a database was created
+        with self.engine.begin() as conn:
+            table: Table
+            for table in self.metadata.sorted_tables:
+                existing_columns: set[str] = self._get_existing_columns(
+                    table_name=table.name,
+                    conn=conn,
+                )
+
+                table_column: Column
+                for table_column in table.columns:
+                    if table_column.name in existing_columns:
+                        continue
+
+                    column_sql: str = (
+                        f"{table_column.name} "
+                        f"{table_column.type.compile(dialect=self.engine.dialect)}"
+                    )
+
+                    foreign_key: ForeignKey
+                    for foreign_key in table_column.foreign_keys:
+                        column_sql += (
+                            f" REFERENCES {foreign_key.column.table.name}"
+                            f"({foreign_key.column.name})"
+                        )
+
+                    conn.execute(
+                        statement=text(
+                            f"ALTER TABLE {table.name} ADD COLUMN {column_sql};"
+                        )
+                    )
+                    self.logger.info(
+                        "Added column `%s.%s`", table.name, table_column.name
+                    )
+
+    def normalize_analysis_tables(self) -> None:  # noqa: D102
+        table_name: str
+        tag: str
+        for table_name, tag in ANALYSIS_TABLES.items():
+            legacy_columns: set[str] = {"system_prompt", "user_prompt"}.intersection(
+                self._get_existing_columns(table_name=table_name)
+            )
+            if len(legacy_columns) == 0:
+                continue
+
+            analysis: Table = self.metadata.tables[table_name]
+            markdown: Table = self.metadata.tables["markdown"]
+            llm_prompts: Table = self.metadata.tables["_llm_prompts"]
+
+            with self.engine.begin() as conn:
+                # Point each row at the stored document and prompt
+                conn.execute(
+                    statement=update(analysis)
+                    .where(analysis.c.markdown_id.is_(None))
+                    .values(
+                        markdown_id=select(func.min(markdown.c._id))
+                        .where(markdown.c.doi == analysis.c.doi)
+                        .scalar_subquery()
+                    )
+                )
+                conn.execute(
+                    statement=update(analysis)
+                    .where(analysis.c.llm_prompt_id.is_(None))
+                    .values(
+                        llm_prompt_id=select(func.min(llm_prompts.c._id))
+                        .where(llm_prompts.c.tag == tag)
+                        .scalar_subquery()
+                    )
+                )
+
+                # Keep the text of rows that could not be linked
+                unlinked_rows: int = int(
+                    conn.execute(
+                        statement=select(func.count())
+                        .select_from(analysis)
+                        .where(
+                            or_(
+                                analysis.c.markdown_id.is_(None),
+                                analysis.c.llm_prompt_id.is_(None),
+                            )
+                        )
+                    ).scalar()
+                )
+                if unlinked_rows > 0:
+                    self.logger.warning(
+                        "Kept text columns of `%s`: %s rows are not linked",
+                        table_name,
+                        unlinked_rows,
+                    )
+                    continue
+
+                column_name: str
+                for column_name in sorted(legacy_columns):
+                    conn.execute(
+                        statement=text(
+                            f"ALTER TABLE {table_name} DROP COLUMN {column_name};"
+                        )
+                    )
+
+            self.logger.info("Normalized the `%s` table", table_name)
+
+    def recompress(  # noqa: D102
+        self,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        vacuum: bool = False,  # noqa: FBT001, FBT002
+    ) -> None:
+        table_name: str
+        column_names: list[str]
+        for table_name, column_names in COMPRESSED_COLUMNS.items():
+            existing_columns: set[str] = self._get_existing_columns(
+                table_name=table_name
+            )
+
+            column_name: str
+            for column_name in column_names:
+                if column_name not in existing_columns:
+                    continue
+
+                self._recompress_column(
+                    table_name=table_name,
+                    column_name=column_name,
+                    batch_size=batch_size,
+                )
+
+        # Reclaim the pages freed by compression
+        if vacuum:
+            self.logger.info("Vacuuming the database")
+            with self.engine.connect() as conn:
+                conn.execute(statement=text("VACUUM;"))
+
+    def _recompress_column(
+        self,
+        table_name: str,
+        column_name: str,
+        batch_size: int,
+    ) -> None:
+        # Untyped columns bind and return stored values as-is, as in `bulk_insert`
+        source: TableClause = table(table_name, column("_id"), column(column_name))
+
+        select_sql: Select = (
+            select(source.c._id, source.c[column_name])
+            .where(
+                source.c._id > bindparam(key="last_id"),
+                source.c[column_name].is_not(None),
+            )
+            .order_by(source.c._id)
+            .limit(batch_size)
+        )
+        update_sql: Update = (
+            update(source)
+            .where(source.c._id == bindparam(key="row_id"))
+            .values({column_name: bindparam(key="value")})
+        )
+
+        # Walk the table by `_id` so no cursor stays open across the updates
+        last_id: int = -1
+        updated_rows: int = 0
+        while True:
+            with self.engine.begin() as conn:
+                rows: list[Row] = conn.execute(
+                    statement=select_sql,
+                    parameters={"last_id": last_id},
+                ).all()
+
+                if len(rows) == 0:
+                    break
+
+                updates: list[dict] = []
+
+                row: Row
+                for row in rows:
+                    value: str | bytes = self.codec.encode(
+                        value=ColumnCodec.decode(value=row[1])
+                    )
+                    if value != row[1]:
+                        updates.append({"row_id": row[0], "value": value})
+
+                if len(updates) > 0:
+                    conn.execute(statement=update_sql, parameters=updates)
+
+            last_id = int(rows[-1][0])
+            updated_rows += len(updates)
+
+        self.logger.info(
+            "Recompressed %s rows of `%s.%s` with the %s codec",
+            updated_rows,
+            table_name,
+            column_name,
+            self.codec.name,
+        )
+
+    def update_rows(  # noqa: D102
+        self,
+        table_name: str,
+        rows: list[dict],
+    ) -> None:
+        if len(rows) == 0:
+            return
+
+        # Validate the table and column names against the schema
+        schema_table: Table = self.metadata.tables[table_name]
+        compressed_columns: list[str] = COMPRESSED_COLUMNS.get(schema_table.name, [])
+        columns: list[str] = [
+            schema_table.columns[key].name for key in rows[0] if key != "_id"
+        ]
+
+        # `_id` is bound as `row_id` so it does not clash with the `_id` column
+        rows = [
+            {
+                "row_id" if key == "_id" else key: self.codec.encode(value=value)
+                if key in compressed_columns
+                else value
+                for key, value in row.items()
+            }
+            for row in rows
+        ]
+
+        # Untyped columns bind values as-is, as in `bulk_insert`
+        target: TableClause = table(
+            table_name, column("_id"), *[column(key) for key in columns]
+        )
+        update_sql: Update = (
+            update(target)
+            .where(target.c._id == bindparam(key="row_id"))
+            .values({key: bindparam(key=key) for key in columns})
+        )
+
+        with self.engine.begin() as conn:
+            conn.execute(statement=update_sql, parameters=rows)
+
+        self.logger.debug(
+            "Updated %s rows of the `%s` table", len(rows), schema_table.name
+        )
+
+    def delete_rows(  # noqa: D102
+        self,
+        table_name: str,
+        where: str,
+        parameters: dict | None = None,
+        conn: Connection | None = None,
+    ) -> int:
+        # `where` is a caller-provided SQL fragment with bound parameters
+        table: Table = self.metadata.tables[table_name]
+
+        with self._begin(conn=conn) as delete_conn:
+            row_count: int = delete_conn.execute(
+                statement=delete(table).where(text(where)),
+                parameters=parameters or {},
+            ).rowcount
+
+        self.logger.info("Deleted %s rows from the `%s` table", row_count, table.name)
+        return row_count
+
+    def get_row_count(self, table_name: str) -> int:  # noqa: D102
+        table: Table = self.metadata.tables[table_name]
+
+        with self.engine.connect() as conn:
+            return int(
+                conn.execute(statement=select(func.count()).select_from(table)).scalar()
+            )
+
+    def iter_query(  # noqa: D102
+        self,
+        sql: str | Select,
+        parameters: dict | None = None,
+        chunksize: int = DEFAULT_CHUNKSIZE,
+        index_col: str | None = None,
+    ) -> Iterator[DataFrame]:
+        self.logger.info("Streaming query in chunks of %s rows", chunksize)
+        self.logger.debug("SQL: %s", sql)
+
+        # A server-side cursor keeps at most `chunksize` rows in memory
+        with self.engine.connect() as conn:
+            streaming_conn: Connection = conn.execution_options(
+                stream_results=True,
+                max_row_buffer=chunksize,
+            )
+
+            df: DataFrame
+            for df in pd.read_sql(
+                sql=text(sql) if isinstance(sql, str) else sql,
+                con=streaming_conn,
+                params=parameters,
+                index_col=index_col,
+                chunksize=chunksize,
+            ):
+                yield self._decode_dataframe(df=df)
+
+    def iter_table(  # noqa: D102
+        self,
+        table_name: str,
+        columns: list[str] | None = None,
+        where: str | None = None,
+        parameters: dict | None = None,
+        chunksize: int = DEFAULT_CHUNKSIZE,
+    ) -> Iterator[DataFrame]:
+        # Validate the table and column names against the schema
+        schema_table: Table = self.metadata.tables[table_name]
+        table_columns: list[str] = [
+            table_column.name for table_column in schema_table.columns
+        ]
+
+        if columns is None:
+            columns = table_columns
+
+        unknown_columns: set[str] = set(columns) - set(table_columns)
+        if len(unknown_columns) > 0:
+            msg: str = f"Unknown columns for table `{table_name}`: {unknown_columns}"
+            raise KeyError(msg)
+
+        # Untyped columns return stored values as-is, as in `bulk_insert`
+        source: TableClause = table(
+            schema_table.name, *[column(key) for key in columns]
         )
+        sql: Select = select(*source.c)
+        if where is not None:
+            sql = sql.where(text(where))
+
+        self.logger.info("Streaming data from the `%s` table", table_name)
+        yield from self.iter_query(
+            sql=sql,
+            parameters=parameters,
+            chunksize=chunksize,
+            index_col="_id" if "_id" in columns else None,
+        )
+
+    @staticmethod
+    def _arrow_schema(table: Table) -> pa.Schema:
+        fields: list[pa.Field] = []
+
+        table_column: Column
+        for table_column in table.columns:
+            arrow_type: pa.DataType
+            match table_column.type:
+                case Integer():
+                    arrow_type = pa.int64()
+                case Boolean():
+                    arrow_type = pa.bool_()
+                # Timestamps are stored as POSIX seconds
+                case Float() | DateTime():
+                    arrow_type = pa.float64()
+                case _ if table_column.name in PARQUET_PLAIN_COLUMNS:
+                    arrow_type = pa.string()
+                # Short, repetitive strings compress well as dictionaries
+                case _:
+                    arrow_type = pa.dictionary(
+                        index_type=pa.int32(), value_type=pa.string()
+                    )
+
+            fields.append(pa.field(table_column.name, arrow_type))
+
+        return pa.schema(fields=fields)
+
+    def _export_select(self, schema_table: Table) -> Select:
+        # Untyped columns return stored values as-is, as in `bulk_insert`
+        table_columns: list[str] = schema_table.columns.keys()
+        source: Alias = table(
+            schema_table.name, *[column(column_name) for column_name in table_columns]
+        ).alias(name="t")
+
+        # Tables without DOIs are exported unpartitioned
+        if not self._is_partitioned(table=schema_table):
+            return select(*source.c)
+
+        # Raw DOIs, e.g. of `articles`, are matched to the normalized DOIs of
+        # `documents` and `openalex`
+        source_doi: ColumnElement = func.aius_normalize_doi(source.c.get("doi"))
+
+        megajournal: ColumnElement
+        if "megajournal" in table_columns:
+            megajournal = source.c.megajournal
+        else:
+            documents: TableClause = table(
+                "documents", column("doi"), column("megajournal")
+            )
+            megajournal = (
+                select(documents.c.megajournal)
+                .where(documents.c.doi == source_doi)
+                .scalar_subquery()
+            )
+
+        # `searches` has no DOI. It is partitioned by the publication year its
+        # search was restricted to; FrontiersIn searches span every year and
+        # are stored as year 0, so they are left unpartitioned
+        publication_year: ColumnElement
+        if "publication_year" in table_columns:
+            publication_year = source.c.publication_year
+        elif "year" in table_columns:
+            publication_year = func.nullif(source.c.year, 0)
+        else:
+            openalex: TableClause = table(
+                "openalex", column("_id"), column("doi"), column("publication_year")
+            )
+            publication_year = (
+                select(openalex.c.publication_year)
+                .where(openalex.c.doi == source_doi)
+                .order_by(openalex.c._id.desc())
+                .limit(1)
+                .scalar_subquery()
+            )
+
+        return select(
+            *[
+                source.c[column_name]
+                for column_name in table_columns
+                if column_name not in PARQUET_PARTITIONING.schema.names
+            ],
+            megajournal.label(name="megajournal"),
+            publication_year.label(name="publication_year"),
+        )
+
+    @staticmethod
+    def _is_partitioned(table: Table) -> bool:
+        return "doi" in table.columns or "megajournal" in table.columns
+
+    def export_parquet(  # noqa: D102
+        self,
+        output_dir: Path = DEFAULT_EXPORT_PATH,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> None:
+        table: Table
+        for table in self.metadata.sorted_tables:
+            schema: pa.Schema = self._arrow_schema(table=table)
+            partitioning: ds.Partitioning | None = None
+
+            if self._is_partitioned(table=table):
+                partitioning = PARQUET_PARTITIONING
+
+                # Partition columns are always last and typed by the partitioning
+                schema = pa.schema(
+                    fields=[
+                        field
+                        for field in schema
+                        if field.name not in PARQUET_PARTITIONING.schema.names
+                    ]
+                    + list(PARQUET_PARTITIONING.schema)
+                )
+
+            # Decoded chunks are converted and written one at a time
+            batches: Iterator[pa.RecordBatch] = (
+                batch
+                for df in self.iter_query(
+                    sql=self._export_select(schema_table=table),
+                    chunksize=batch_size,
+                )
+                for batch in pa.Table.from_pandas(
+                    df=df,
+                    schema=schema,
+                    preserve_index=False,
+                ).to_batches()
+            )
+
+            self.logger.info("Exporting the `%s` table to Parquet", table.name)
+            ds.write_dataset(
+                data=batches,
+                base_dir=output_dir / table.name,
+                basename_template=f"{table.name}-{{i}}.parquet",
+                format="parquet",
+                schema=schema,
+                partitioning=partitioning,
+                existing_data_behavior="delete_matching",
+            )
+
+    def read_arrow(  # noqa: D102
+        self,
+        table_name: str,
+        columns: list[str] | None = None,
+        filters: pc.Expression | list | None = None,
+        dataset_path: Path = DEFAULT_EXPORT_PATH,
+    ) -> pa.Table:
+        # Validate the table name against the schema
+        table: Table = self.metadata.tables[table_name]
+
+        if not (dataset_path / table.name).exists():
+            msg: str = (
+                f"No Parquet export of the `{table.name}` table in {dataset_path}; "
+                f"run `aius export --output {dataset_path}` first"
+            )
+            raise FileNotFoundError(msg)
+
+        dataset: ds.Dataset = ds.dataset(
+            source=dataset_path / table.name,
+            format="parquet",
+            partitioning=PARQUET_PARTITIONING
+            if self._is_partitioned(table=table)
+            else None,
+        )
+
+        # `filters` may also be given in the `pyarrow.parquet` list of tuples form
+        if isinstance(filters, list):
+            filters = pq.filters_to_expression(filters=filters)
+
+        # Only the selected columns and matching row groups are read from disk
+        return dataset.to_table(columns=columns, filter=filters)
 
 
-def connect_to_db(logger: Logger, db_path: Path) -> DB | int:  # noqa: D103
+def connect_to_db(  # noqa: D103
+    logger: Logger,
+    db_path: Path,
+    db_profile: str = DEFAULT_DB_PROFILE,
+    db_codec: str = "none",
+) -> DB | int:
     db: DB | int = -1
 
     try:
-        db = DB(logger=logger, db_path=db_path)
+        db = DB(logger=logger, db_path=db_path, profile=db_profile, codec=db_codec)
         logger.info("Connected to SQLite3 database: %s", db_path)
     except OperationalError:
         logger.error("Unable to connect to SQLite3 database: %s", db_path)
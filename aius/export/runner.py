@@ -0,0 +1,30 @@
+"""
+Parquet export runner.
+
+Copyright 2025 (C) Nicholas M. Synovic
+
+"""
+
+from logging import Logger
+from pathlib import Path
+
+from aius.db import DB, DEFAULT_EXPORT_PATH
+from aius.runner import Runner
+
+
+class ExportRunner(Runner):  # noqa: D101
+    def __init__(  # noqa: D107
+        self,
+        db: DB,
+        logger: Logger,
+        output_dir: Path = DEFAULT_EXPORT_PATH,
+    ) -> None:
+        super().__init__(name="export", db=db, logger=logger)
+        self.output_dir: Path = output_dir
+        self.logger.info("Output directory: %s", self.output_dir)
+
+    def execute(self) -> int:  # noqa: D102
+        # Each table becomes a Hive-partitioned dataset under `self.output_dir`
+        self.db.export_parquet(output_dir=self.output_dir)
+
+        return 0
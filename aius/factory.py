@@ -6,15 +6,39 @@ Copyright 2025 (C) Nicholas M. Synovic
 """
 
 from logging import Logger
+from pathlib import Path
 
 from aius.analyze.runner import AnalysisRunner
 from aius.db import DB, connect_to_db
+from aius.export.runner import ExportRunner
 from aius.init.runner import InitRunner
 from aius.jats.runner import JATSRunner
 from aius.openalex.runner import OpenAlexRunner
 from aius.pandoc.runner import PandocRunner
+from aius.recompress.runner import RecompressRunner
+from aius.reparse.runner import ReparseRunner
 from aius.runner import Runner
 from aius.search.runner import SearchRunner
+from aius.util.response_cache import DEFAULT_HTTP_CACHE_PATH, ResponseCache
+
+
+def get_http_cache(  # noqa: D103
+    logger: Logger,
+    runner_name: str,
+    **kwargs,  # noqa: ANN003
+) -> ResponseCache | None:
+    cache_dir: Path | None = kwargs[f"{runner_name}.http_cache"]
+    replay: bool = kwargs[f"{runner_name}.replay"]
+
+    # Replaying without a directory reads the default cache
+    if cache_dir is None and not replay:
+        return None
+
+    return ResponseCache(
+        cache_dir=DEFAULT_HTTP_CACHE_PATH if cache_dir is None else cache_dir,
+        replay=replay,
+        logger=logger,
+    )
 
 
 # Factory method design pattern implementation
@@ -26,7 +50,12 @@ def runner_factory(  # noqa: D103
     logger.info("%s kwargs: %s", runner_name, kwargs)
 
     # Connect to the database
-    db: DB | int = connect_to_db(logger=logger, db_path=kwargs[f"{runner_name}.db"])
+    db: DB | int = connect_to_db(
+        logger=logger,
+        db_path=kwargs[f"{runner_name}.db"],
+        db_profile=kwargs[f"{runner_name}.db_profile"],
+        db_codec=kwargs[f"{runner_name}.db_codec"],
+    )
     if isinstance(db, int):
         return 2
 
@@ -43,13 +72,26 @@ def runner_factory(  # noqa: D103
             runner = SearchRunner(
                 db=db,
                 logger=logger,
-                megajournal_name=kwargs["search.megajournal"],
+                megajournal_names=kwargs["search.megajournal"],
+                concurrency=kwargs["search.concurrency"],
+                restart=kwargs["search.restart"],
+                processes=kwargs["search.processes"],
+                http_cache=get_http_cache(
+                    logger=logger, runner_name=runner_name, **kwargs
+                ),
             )
         case "openalex":
             runner = OpenAlexRunner(
                 db=db,
                 logger=logger,
                 email=kwargs["openalex.email"],
+                concurrency=kwargs["openalex.concurrency"],
+                max_age_days=kwargs["openalex.max_age_days"],
+                full=kwargs["openalex.full"],
+                select=kwargs["openalex.select"],
+                archive=kwargs["openalex.archive"],
+                snapshot=kwargs["openalex.snapshot"],
+                processes=kwargs["openalex.processes"],
             )
         case "jats":
             runner = JATSRunner(
@@ -57,6 +99,9 @@ def runner_factory(  # noqa: D103
                 logger=logger,
                 megajournal_name=kwargs["jats.megajournal"],
                 plos_zip_fp=kwargs["jats.plos_zip"],
+                http_cache=get_http_cache(
+                    logger=logger, runner_name=runner_name, **kwargs
+                ),
             )
         case "pandoc":
             runner = PandocRunner(
@@ -78,6 +123,25 @@ def runner_factory(  # noqa: D103
                 stride=kwargs["analyze.stride"],
                 system_prompt_id=kwargs["analyze.system_prompt_id"],
             )
+        case "recompress":
+            runner = RecompressRunner(
+                db=db,
+                logger=logger,
+                vacuum=kwargs["recompress.vacuum"],
+            )
+        case "export":
+            runner = ExportRunner(
+                db=db,
+                logger=logger,
+                output_dir=kwargs["export.output"],
+            )
+        case "reparse":
+            runner = ReparseRunner(
+                db=db,
+                logger=logger,
+                megajournal_name=kwargs["reparse.megajournal"],
+                processes=kwargs["reparse.processes"],
+            )
         case _:
             runner = 1
 
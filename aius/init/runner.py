@@ -7,6 +7,8 @@ Copyright 2025 (C) Nicholas M. Synovic
 
 from logging import Logger
 
+from pandas import DataFrame
+
 from aius.analyze import SYSTEM_PROMPT_TAG_MAPPING_DF
 from aius.db import DB
 from aius.init import (
@@ -32,31 +34,39 @@ class InitRunner(Runner):  # noqa: D101
         self.logger.info("Minimum year: %s", self.min_year)
         self.logger.info("Maximum year: %s", self.max_year)
 
+    def _write_table(self, table_name: str, df: DataFrame) -> None:
+        # Rows get new `_id`s on every write, so a second `init` would
+        # duplicate the tables. Tables that already have rows are kept as-is
+        if self.db.get_row_count(table_name=table_name) > 0:
+            self.logger.info("Skipping the populated `%s` table", table_name)
+            return
+
+        self.db.write_dataframe_to_table(table_name=table_name, df=df)
+
     def execute(self) -> int:  # noqa: D102
         # Write LLM prompts
-        self.db.write_dataframe_to_table(
-            df=SYSTEM_PROMPT_TAG_MAPPING_DF,
+        self._write_table(
             table_name="_llm_prompts",
+            df=SYSTEM_PROMPT_TAG_MAPPING_DF,
         )
 
         # Write OpenAlex natural science field filter
-        self.db.write_dataframe_to_table(
-            df=NATURAL_SCIENCE_OA_FIELDS,
+        self._write_table(
             table_name="_openalex_natural_science_fields",
+            df=NATURAL_SCIENCE_OA_FIELDS,
         )
+        self.db.refresh_natural_science_articles()
 
         # Write search keywords
-        self.db.write_dataframe_to_table(
-            table_name="_search_keywords", df=JOURNAL_SEARCH_KEYWORDS
-        )
+        self._write_table(table_name="_search_keywords", df=JOURNAL_SEARCH_KEYWORDS)
 
         # Write years
-        self.db.write_dataframe_to_table(
+        self._write_table(
+            table_name="_years",
             df=compute_journal_search_years(
                 min_year=self.min_year,
                 max_year=self.max_year,
             ),
-            table_name="_years",
         )
 
         return 0
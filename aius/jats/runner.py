@@ -5,10 +5,10 @@ Copyright 2025 (C) Nicholas M. Synovic
 
 """
 
+from collections.abc import Iterator
 from logging import Logger
 from pathlib import Path
 
-import pandas as pd
 from pandas import DataFrame
 from requests import Session
 
@@ -18,6 +18,7 @@ from aius.megajournals import MEGAJOURNAL_MAPPING
 from aius.megajournals.megajournal import MegaJournal
 from aius.runner import Runner
 from aius.util.http_session import HTTPSession
+from aius.util.response_cache import ResponseCache
 
 
 class JATSRunner(Runner):  # noqa: D101
@@ -27,13 +28,14 @@ class JATSRunner(Runner):  # noqa: D101
         logger: Logger,
         megajournal_name: str,
         plos_zip_fp: Path = ALL_OF_PLOS_DEFAULT_PATH,
+        http_cache: ResponseCache | None = None,
     ) -> None:
         super().__init__(name="jats", db=db, logger=logger)
         # Set class constants
         self.plos_zip_fp: Path = plos_zip_fp
 
         # Custom HTTPS session with exponential backoff enabled
-        session_util: HTTPSession = HTTPSession()
+        session_util: HTTPSession = HTTPSession(cache=http_cache)
         self.timeout: int = session_util.timeout
         self.session: Session = session_util.session
 
@@ -44,56 +46,44 @@ class JATSRunner(Runner):  # noqa: D101
         self.megajournal: MegaJournal = MEGAJOURNAL_MAPPING[self.megajournal_name](
             logger=self.logger,
             db=self.db,
+            http_cache=http_cache,
         )
         self.logger.info("Identified journal as %s", self.megajournal.name)
 
-    def _get_data(self) -> DataFrame:
-        # Get data from the database
-        sql: str = """
-            SELECT ns.doi, a.megajournal, oa.json_data
-            FROM natural_science_article_dois ns
-            JOIN articles a ON a.doi = ns.doi
-            JOIN openalex oa ON oa.doi = ns.doi;
-        """
-        df: DataFrame = pd.read_sql(sql=sql, con=self.db.engine)
-
-        # Split the dataframe by megajournal
+    def _get_data(self) -> Iterator[DataFrame]:
+        # Split the data by megajournal
+        megajournal: str
         match self.megajournal_name:
             case "bmj":
-                return df[df["megajournal"] == "BMJ"].copy()
+                megajournal = "BMJ"
             case "f1000":
-                return df[df["megajournal"] == "F1000"].copy()
+                megajournal = "F1000"
             case "frontiersin":
-                return df[df["megajournal"] == "FrontiersIn"].copy()
+                megajournal = "FrontiersIn"
             case "plos":
-                return df[df["megajournal"] == "PLOS"].copy()
+                megajournal = "PLOS"
             case _:
-                return DataFrame()
+                return
 
-    def _get_table_row_count(self, table_name: str) -> int:
-        row_count: int = self.megajournal.db.get_last_row_id(table_name)
-        self.logger.info(
-            "%s rows previously existed in table `%s`", row_count, table_name
-        )
-        return row_count
-
-    def _update_df_index(self, table_row_count: int, df: DataFrame) -> None:
-        if table_row_count != 0:
-            update_val: int = table_row_count + 1
-            self.logger.info("Updating search IDs by %s", update_val)
-            df.index += update_val
+        # Stream data from the database
+        sql: str = """
+            SELECT ns.doi, d.megajournal, oa.json_data
+            FROM natural_science_article_dois ns
+            JOIN documents d ON d.doi = ns.doi
+            JOIN openalex oa ON oa.doi = ns.doi
+            WHERE d.megajournal = :megajournal;
+        """
+        yield from self.db.iter_query(sql=sql, parameters={"megajournal": megajournal})
 
     def execute(self) -> int:  # noqa: D102
-        row_count: int = self._get_table_row_count(table_name="jats")
-
-        df: DataFrame = self._get_data()
-
-        jats_df: DataFrame = self.megajournal.download_jats(
-            df=df,
-            plos_zip_fp=self.plos_zip_fp,
-        )
-        self._update_df_index(table_row_count=row_count, df=jats_df)
-
-        self.db.write_dataframe_to_table(table_name="jats", df=jats_df)
+        # Download and write one chunk at a time to bound memory usage
+        df: DataFrame
+        for df in self._get_data():
+            jats_df: DataFrame = self.megajournal.download_jats(
+                df=df,
+                plos_zip_fp=self.plos_zip_fp,
+            )
+
+            self.db.write_dataframe_to_table(table_name="jats", df=jats_df)
 
         return 0
@@ -9,3 +9,23 @@ MEGAJOURNAL_MAPPING: dict[str, type] = {
     "frontiersin": FrontiersIn,
     "plos": PLOS,
 }
+
+
+def resolve_megajournal_names(value: str) -> list[str]:  # noqa: D103
+    # `value` is `all` or a comma separated list of keys, such as `bmj,plos`
+    if value.strip().lower() == "all":
+        return list(MEGAJOURNAL_MAPPING.keys())
+
+    names: list[str] = []
+
+    name: str
+    for name in value.lower().split(sep=","):
+        name = name.strip()  # noqa: PLW2901
+        if name not in MEGAJOURNAL_MAPPING:
+            msg: str = f"Unknown megajournal `{name}`"
+            raise ValueError(msg)
+
+        if name not in names:
+            names.append(name)
+
+    return names
@@ -4,23 +4,36 @@ from logging import Logger
 from math import ceil
 from string import Template
 
-from bs4 import BeautifulSoup, ResultSet, Tag
 from pandas import DataFrame, Series
 from progress.bar import Bar
-from requests import HTTPError, Response, get
+from requests import HTTPError, Response
 from requests.exceptions import RetryError
 
 from aius.db import DB
 from aius.megajournals.megajournal import MegaJournal
-from aius.megajournals.models import ArticleModel, SearchModel
+from aius.megajournals.models import SearchModel
+from aius.megajournals.parsers import bmj_articles, bmj_document_count
+from aius.util.response_cache import ResponseCache
 
 
 class BMJ(MegaJournal):
-    def __init__(self, logger: Logger, db: DB) -> None:
+    def __init__(
+        self,
+        logger: Logger,
+        db: DB,
+        concurrency: int = 1,
+        http_cache: ResponseCache | None = None,
+    ) -> None:
         # Load default variable values
-        super().__init__(logger=logger, db=db)
+        super().__init__(
+            logger=logger,
+            db=db,
+            concurrency=concurrency,
+            http_cache=http_cache,
+        )
 
         self.megajournal: str = "BMJ"
+        self.name = self.megajournal
         self.search_url_template: Template = Template(
             template="https://journals.bmj.com/search/${query} limit_from:${year}-01-01 limit_to:${year}-12-31 jcode:bmjcimm||bmjdhai||bmjgh||bmjhci||bmjmed||bmjno||bmjnph||bmjonc||bmjopen||bmjph||bmjdrc||bmjgast||bmjophth||bmjqir||bmjresp||bmjosem||bmjpo||bmjccgg||bmjconc||bmjsit||egastro||fmch||gocm||gpsych||jmepb||jitc||lupusscimed||openhrt||rmdopen||svnbmj||tsaco||wjps exclude_meeting_abstracts:0 numresults:100 sort:publication-date direction:descending format_result:standard button:Submit button2:Submit button3:Submit?page=${page}"
         )
@@ -67,136 +80,16 @@ class BMJ(MegaJournal):
         )
 
     def _compute_total_number_of_pages(self, resp: SearchModel) -> int:
-        document_count: int = 1
-        soup: BeautifulSoup = BeautifulSoup(
-            markup=resp.json_data["html"],
-            features="lxml",
-        )
+        document_count: int | None = bmj_document_count(markup=resp.json_data["html"])
 
-        document_count_tag: Tag | None = soup.find(
-            name="div",
-            attrs={
-                "id": "search-summary-wrapper",
-                "class": "highwire-search-summary",
-            },
-        )
-
-        if isinstance(document_count_tag, Tag):
-            try:
-                document_count = int(document_count_tag.text.split(" ")[0])
-            except ValueError:
-                pass
+        if document_count is None:
+            document_count = 1
 
         return ceil(document_count / 100)
 
-    def search(self) -> list[SearchModel]:
-        data: list[SearchModel] = []
-
-        pair: tuple[str, int]
-        for pair in self.keyword_year_products:
-            self.logger.debug(msg=f"Keyword year pair being searched for: {pair}")
-
-            with Bar(
-                f"Searching {self.megajournal} for {pair[0]} in {pair[1]}...",
-                max=1,
-            ) as bar:
-                # Get the first page of results
-                resp: SearchModel = self.search_single_page(
-                    logger=self.logger,
-                    keyword_year_pair=pair,
-                    page=1,
-                )
-                data.append(resp)
-                bar.next()
-
-                # Get the number of pages to iterate through
-                page_count = self._compute_total_number_of_pages(resp=resp)
-
-                # Iterate to the next page if page_count == 1
-                if page_count <= 1:
-                    continue
-                else:
-                    bar.max = page_count
-                    bar.update()
-
-                page: int
-                for page in range(2, page_count + 1):
-                    resp: SearchModel = self.search_single_page(
-                        logger=self.logger,
-                        keyword_year_pair=pair,
-                        page=page,
-                    )
-                    data.append(resp)
-                    bar.next()
-
-        return data
-
-    def parse_response(self, responses: list[SearchModel]) -> list[ArticleModel]:
-        data: list[ArticleModel] = []
-
-        response_index: int = 0
-
-        with Bar(
-            "Extracting articles from search results...", max=len(responses)
-        ) as bar:
-            response: SearchModel
-            for response in responses:
-                soup: BeautifulSoup = BeautifulSoup(
-                    markup=response.json_data["html"],
-                    features="lxml",
-                )
-
-                docs: ResultSet[Tag] = soup.find_all(
-                    name="div",
-                    attrs={
-                        "class": "highwire-cite-highwire-article",
-                    },
-                )
-
-                doc: Tag
-                for doc in docs:
-                    doi_tag: Tag | None = doc.find(
-                        name="span",
-                        attrs={
-                            "class": "highwire-cite-metadata-doi",
-                        },
-                    )
-                    title_tag: Tag | None = doc.find(
-                        name="span",
-                        attrs={
-                            "class": "highwire-cite-title",
-                        },
-                    )
-                    journal_tag: Tag | None = doc.find(
-                        name="span",
-                        attrs={
-                            "class": "highwire-cite-metadata-journal",
-                        },
-                    )
-
-                    if not isinstance(doi_tag, Tag):
-                        continue
-
-                    if not isinstance(title_tag, Tag):
-                        continue
-
-                    if not isinstance(journal_tag, Tag):
-                        continue
-
-                    data.append(
-                        ArticleModel(
-                            doi=doi_tag.text.split(" ")[1],
-                            title=title_tag.text,
-                            megajournal=self.megajournal,
-                            journal=journal_tag.text,
-                            search_id=response_index,
-                        )
-                    )
-
-                response_index += 1
-                bar.next()
-
-        return data
+    @staticmethod
+    def parse_page(json_data: dict) -> list[tuple[str, str, str]]:  # noqa: D102
+        return bmj_articles(markup=json_data["html"])
 
     def download_jats(self, df: DataFrame, **kwargs) -> DataFrame:
         data: dict[str, list[str]] = {
@@ -225,8 +118,8 @@ class BMJ(MegaJournal):
                 self.logger.info("Getting JATS XML from: %s ...", xml_url)
 
                 try:
-                    # Doesn't use self.session
-                    resp: Response = get(
+                    # Doesn't use self.session's retries
+                    resp: Response = self.session_util.single_attempt_session.get(
                         url=xml_url,
                         timeout=60,
                         allow_redirects=True,
@@ -3,22 +3,35 @@ from itertools import product
 from logging import Logger
 from string import Template
 
-from bs4 import BeautifulSoup, ResultSet, Tag
 from pandas import DataFrame, Series
 from progress.bar import Bar
 from requests import HTTPError, Response
 
 from aius.db import DB
 from aius.megajournals.megajournal import MegaJournal
-from aius.megajournals.models import ArticleModel, SearchModel
+from aius.megajournals.models import SearchModel
+from aius.megajournals.parsers import f1000_dois, f1000_total_number_of_pages
+from aius.util.response_cache import ResponseCache
 
 
 class F1000(MegaJournal):
-    def __init__(self, logger: Logger, db: DB) -> None:
+    def __init__(
+        self,
+        logger: Logger,
+        db: DB,
+        concurrency: int = 1,
+        http_cache: ResponseCache | None = None,
+    ) -> None:
         # Load default variable values
-        super().__init__(logger=logger, db=db)
+        super().__init__(
+            logger=logger,
+            db=db,
+            concurrency=concurrency,
+            http_cache=http_cache,
+        )
 
         self.megajournal: str = "F1000"
+        self.name = self.megajournal
         self.search_url_template: Template = Template(
             template="https://f1000research.com/extapi/search?page=${page}&rows=100&start=0&q=R_TE:${query} AND R_PUD:%5B${t1} TO ${t2}%5D&wt=json"
         )
@@ -75,101 +88,18 @@ class F1000(MegaJournal):
         )
 
     def _compute_total_number_of_pages(self, resp: SearchModel) -> int:
-        document_count: int = 1
-        soup: BeautifulSoup = BeautifulSoup(
-            markup=resp.json_data["xml"],
-            features="lxml",
+        total_number_of_pages: int | None = f1000_total_number_of_pages(
+            markup=resp.json_data["xml"]
         )
 
-        self.logger.debug(soup.prettify())
-
-        document_count_tag: Tag | None = soup.find(name="results")
-
-        if isinstance(document_count_tag, Tag):
-            try:
-                document_count = int(document_count_tag["totalnumberofpages"])
-            except ValueError:
-                pass
-
-        return document_count
-
-    def search(self) -> list[SearchModel]:
-        data: list[SearchModel] = []
-
-        pair: tuple[str, int]
-        for pair in self.keyword_year_products:
-            self.logger.debug(msg=f"Keyword year pair being searched for: {pair}")
-
-            with Bar(
-                f"Searching {self.megajournal} for {pair[0]} in {pair[1]}...",
-                max=1,
-            ) as bar:
-                # Get the first page of results
-                resp: SearchModel = self.search_single_page(
-                    logger=self.logger,
-                    keyword_year_pair=pair,
-                    page=1,
-                )
-                data.append(resp)
-                bar.next()
-
-                # Get the number of pages to iterate through
-                page_count = self._compute_total_number_of_pages(resp=resp)
-
-                self.logger.debug(f"Page count {page_count}")
+        if total_number_of_pages is None:
+            return 1
 
-                # Iterate to the next page if page_count == 1
-                if page_count <= 1:
-                    continue
-                else:
-                    bar.max = page_count
-                    bar.update()
-
-                page: int
-                for page in range(2, page_count + 1):
-                    resp: SearchModel = self.search_single_page(
-                        logger=self.logger,
-                        keyword_year_pair=pair,
-                        page=page,
-                    )
-                    data.append(resp)
-                    bar.next()
-
-        return data
-
-    def parse_response(self, responses: list[SearchModel]) -> list[ArticleModel]:
-        data: list[ArticleModel] = []
-
-        response_index: int = 0
-
-        with Bar(
-            "Extracting articles from search results...", max=len(responses)
-        ) as bar:
-            response: SearchModel
-            for response in responses:
-                soup: BeautifulSoup = BeautifulSoup(
-                    markup=response.json_data["xml"],
-                    features="lxml",
-                )
-
-                docs: ResultSet[Tag] = soup.find_all(name="doi")
-
-                doc: Tag
-                for doc in docs:
-                    data.append(
-                        ArticleModel(
-                            doi=doc.text,
-                            title="",
-                            megajournal=self.megajournal,
-                            journal="",
-                            search_id=response_index,
-                        )
-                    )
-
-                response_index += 1
-                bar.next()
+        return total_number_of_pages
 
-        return data
+    @staticmethod
+    def parse_page(json_data: dict) -> list[tuple[str, str, str]]:  # noqa: D102
+        return [(doi, "", "") for doi in f1000_dois(markup=json_data["xml"])]
 
     def download_jats(self, df: DataFrame, **kwargs) -> DataFrame:  # noqa: D102
         data: dict[str, list[str]] = {
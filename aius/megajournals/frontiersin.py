@@ -1,7 +1,11 @@
+import re
+from collections.abc import Callable
 from datetime import datetime, timezone
+from functools import partial
 from itertools import product
 from json import dumps, loads
-from logging import Logger
+from logging import Logger, getLogger
+from math import ceil
 
 from pandas import DataFrame, Series
 from progress.bar import Bar
@@ -9,16 +13,45 @@ from requests import HTTPError, Response
 
 from aius.db import DB
 from aius.megajournals.megajournal import MegaJournal
-from aius.megajournals.models import ArticleModel, SearchModel
+from aius.megajournals.models import SearchModel
+from aius.util.response_cache import ResponseCache
+
+# Articles requested per search window (`Top`)
+FRONTIERSIN_PAGE_SIZE: int = 100
+
+# Frontiers DOIs carry the article's year: `10.3389/fpsyg.2021.123456`
+FRONTIERSIN_DOI_YEAR_PATTERN: re.Pattern = re.compile(
+    pattern=r"^10\.3389/[^.]+\.(\d{4})\."
+)
+
+# Article fields checked, in order, for a date when the DOI has no year. The
+# `Doi` field is the only one known to be in every search result
+FRONTIERSIN_DATE_FIELDS: tuple[str, ...] = (
+    "PublishedDate",
+    "PublicationDate",
+    "Date",
+)
 
 
 class FrontiersIn(MegaJournal):
-    def __init__(self, logger: Logger, db: DB) -> None:
+    def __init__(
+        self,
+        logger: Logger,
+        db: DB,
+        concurrency: int = 1,
+        http_cache: ResponseCache | None = None,
+    ) -> None:
         # Load default variable values
-        super().__init__(logger=logger, db=db)
+        super().__init__(
+            logger=logger,
+            db=db,
+            concurrency=concurrency,
+            http_cache=http_cache,
+        )
 
         # Set constants
         self.megajournal: str = "FrontiersIn"
+        self.name = self.megajournal
         self.search_api_endpoint: str = "https://www.frontiersin.org/api/v2/search"
         self.search_api_body: dict = {
             "Filter": {
@@ -32,24 +65,34 @@ class FrontiersIn(MegaJournal):
             },
             "Search": "",  # Change this to search for a keyword
             "SearchType": 2,
-            "Skip": 0,
-            "Top": 1,  # Change this to get more search results
+            "Skip": 0,  # Set to the start of each search window
+            "Top": FRONTIERSIN_PAGE_SIZE,
             "UserId": 0,
         }
 
+        # The search API cannot filter by year, so each keyword is paged
+        # through once for all years and stored as year 0, as before
+        # pagination. Articles published outside of `self.years` are dropped
+        # when the pages are parsed
+        self.years: list[int] = self.db.get_years()
         self.keyword_year_products: product = product(
             self.db.get_search_keywords(),
-            self.db.get_years(),
+            [0],
         )
 
         self.logger.info(msg=f"Mega Journal: {self.megajournal}")
         self.logger.info(msg=f"Keyword-Year products: {self.keyword_year_products}")
 
-    def _compute_total_number_of_papers(self, resp: SearchModel) -> int:
-        documents_found: int = int(resp.json_data["Summary"]["Article"]["Count"])
+    def _compute_total_number_of_pages(self, resp: SearchModel) -> int:
+        documents_found: int = 1
+        try:
+            documents_found = int(resp.json_data["Summary"]["Article"]["Count"])
+        except (KeyError, TypeError, ValueError):
+            self.logger.error(msg=f"No document count in search: {resp.url}")
+
         self.logger.info(msg=f"Total number of documents found: {documents_found}")
 
-        return documents_found
+        return ceil(documents_found / FRONTIERSIN_PAGE_SIZE)
 
     def search_single_page(
         self,
@@ -57,11 +100,11 @@ class FrontiersIn(MegaJournal):
         keyword_year_pair: tuple[str, int],
         page: int = 1,
     ) -> SearchModel:
-        # NOTE: Page is used to update the number of documents being searched for
-        # Update the search request body
+        # Each page is a window of `FRONTIERSIN_PAGE_SIZE` articles
         search_request_body: dict = self.search_api_body.copy()
         search_request_body["Search"] = keyword_year_pair[0]
-        search_request_body["Top"] = page
+        search_request_body["Skip"] = (page - 1) * FRONTIERSIN_PAGE_SIZE
+        search_request_body["Top"] = FRONTIERSIN_PAGE_SIZE
         logger.info(msg=f"Search API JSON data: {dumps(obj=search_request_body)}")
 
         timestamp: float = datetime.now(tz=timezone.utc).timestamp()
@@ -86,65 +129,64 @@ class FrontiersIn(MegaJournal):
             json_data=resp.json(),
         )
 
-    def search(self) -> list[SearchModel]:
-        data: list[SearchModel] = []
-
-        keywords: list[str] = sorted(
-            list({pair[0] for pair in self.keyword_year_products})
+    @staticmethod
+    def _publication_year(doc: dict) -> int | None:
+        match: re.Match | None = FRONTIERSIN_DOI_YEAR_PATTERN.match(
+            string=str(doc.get("Doi", ""))
+        )
+        if match is not None:
+            return int(match.group(1))
+
+        field: str
+        for field in FRONTIERSIN_DATE_FIELDS:
+            try:
+                return int(str(doc[field])[:4])
+            except (KeyError, TypeError, ValueError):
+                continue
+
+        return None
+
+    @property
+    def page_parser(self) -> Callable[[dict], list[tuple[str, str, str]]]:  # noqa: D102
+        # Loggers are pickled by name, so workers get the registered logger
+        return partial(
+            FrontiersIn.parse_page,
+            years=frozenset(self.years),
+            logger=getLogger(name=self.logger.name),
         )
 
-        keyword: str
-        for keyword in keywords:
-            self.logger.debug(msg=f"Keyword being searched for: {keyword}")
-
-            print(f"Searching {self.megajournal} for {keyword} in all years...")
-            resp: SearchModel = self.search_single_page(
-                logger=self.logger,
-                keyword_year_pair=(keyword, 0),
-                page=1,
-            )
-
-            paper_count: int = self._compute_total_number_of_papers(resp=resp)
-
-            data.append(
-                self.search_single_page(
-                    logger=self.logger,
-                    keyword_year_pair=(keyword, 0),
-                    page=paper_count,
-                )
+    @staticmethod
+    def parse_page(  # noqa: D102
+        json_data: dict,
+        years: frozenset[int] = frozenset(),
+        logger: Logger | None = None,
+    ) -> list[tuple[str, str, str]]:
+        # Without `years` every article is kept
+        data: list[tuple[str, str, str]] = []
+        undated: list[str] = []
+
+        doc: dict
+        for doc in json_data["Articles"]:
+            year: int | None = FrontiersIn._publication_year(doc=doc)
+
+            # Articles without a year are kept rather than silently dropped,
+            # and reported so that a change of DOI format is noticed
+            if year is None:
+                undated.append(doc["Doi"])
+            elif len(years) > 0 and year not in years:
+                continue
+
+            data.append((doc["Doi"], doc["Title"], doc["Journal"]["Title"]))
+
+        if len(years) > 0 and len(undated) > 0:
+            (logger or getLogger(name=__name__)).warning(
+                "Kept %s FrontiersIn articles without a publication year: %s",
+                len(undated),
+                undated,
             )
 
         return data
 
-    def parse_response(self, responses: list[SearchModel]) -> list[ArticleModel]:
-        data: list[ArticleModel] = []
-
-        response_index: int = 0
-
-        with Bar(
-            "Extracting articles from search results...", max=len(responses)
-        ) as bar:
-            response: SearchModel
-            for response in responses:
-                docs: list[dict] = response.json_data["Articles"]
-
-                doc: dict
-                for doc in docs:
-                    data.append(
-                        ArticleModel(
-                            doi=doc["Doi"],
-                            title=doc["Title"],
-                            megajournal=self.megajournal,
-                            journal=doc["Journal"]["Title"],
-                            search_id=response_index,
-                        )
-                    )
-
-                response_index += 1
-                bar.next()
-
-        return data
-
     def download_jats(self, df: DataFrame, **kwargs) -> DataFrame:
         data: dict[str, list[str]] = {
             "doi": [],
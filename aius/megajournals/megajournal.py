@@ -1,29 +1,77 @@
 from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
 from datetime import datetime, timezone
+from functools import partial
 from itertools import product
+from json import loads
 from logging import Logger
+from multiprocessing import get_context
 from string import Template
 
 from pandas import DataFrame
+from progress.bar import Bar
 from requests import Response, Session
 
-from aius.db import DB
+from aius.db import DB, DEFAULT_CHUNKSIZE
 from aius.megajournals.models import ArticleModel, SearchModel
 from aius.util.http_session import HTTPSession
+from aius.util.response_cache import ResponseCache
+
+# Search pages handed to a parse worker at a time
+PARSE_SHARD_SIZE: int = 8
+
+
+def parse_pool(processes: int) -> ProcessPoolExecutor:  # noqa: D103
+    # Workers are spawned rather than forked, as the search producer thread and
+    # HTTP connection pools may be running when the pool starts
+    return ProcessPoolExecutor(
+        max_workers=processes,
+        mp_context=get_context(method="spawn"),
+    )
+
+
+def _parse_page(
+    parser: Callable[[dict], list[tuple[str, str, str]]],
+    json_data: dict | str,
+) -> list[tuple[str, str, str]]:
+    # Stored searches are decoded in the worker rather than the parent
+    if isinstance(json_data, str):
+        json_data = loads(s=json_data)
+
+    return parser(json_data)
 
 
 class MegaJournal(ABC):
-    def __init__(self, logger: Logger, db: DB) -> None:
+    def __init__(
+        self,
+        logger: Logger,
+        db: DB,
+        concurrency: int = 1,
+        http_cache: ResponseCache | None = None,
+    ) -> None:
         self.logger: Logger = logger
         self.db: DB = db
 
+        # Maximum number of search pages requested at the same time
+        self.concurrency: int = max(1, concurrency)
+
         # Empty variables that are set by instancing classes
         self.name: str = ""
         self.search_url_template: Template = Template(template="")
         self.keyword_year_products: product = product()
 
         # Custom HTTPS session with exponential backoff enabled
-        self.session_util: HTTPSession = HTTPSession()
+        self.session_util: HTTPSession = HTTPSession(
+            pool_maxsize=self.concurrency,
+            cache=http_cache,
+        )
         self.timeout: int = self.session_util.timeout
         self.session: Session = self.session_util.session
 
@@ -55,11 +103,206 @@ class MegaJournal(ABC):
             json_data=resp.json(),
         )
 
-    @abstractmethod
-    def search(self) -> list[SearchModel]: ...
+    def _compute_total_number_of_pages(self, resp: SearchModel) -> int:
+        # Journals with paginated search results override this
+        return 1
+
+    def _load_search(self, search_id: int) -> SearchModel:
+        df: DataFrame = next(
+            self.db.iter_table(
+                table_name="searches",
+                columns=list(SearchModel.model_fields),
+                where="_id = :search_id",
+                parameters={"search_id": search_id},
+            )
+        )
+
+        row: dict = df.to_dict(orient="records")[0]
+        row["json_data"] = loads(s=row["json_data"])
+        return SearchModel(**row)
+
+    def search(
+        self,
+        checkpoints: dict[tuple[str, int, int], int] | None = None,
+    ) -> Iterator[SearchModel]:
+        # `checkpoints` maps (keyword, year, page) to the `searches._id` of
+        # pages that were already written; those pages are not requested again
+        checkpoints = {} if checkpoints is None else checkpoints
+
+        pairs: list[tuple[str, int]] = list(self.keyword_year_products)
+        self.logger.debug(msg=f"Keyword year pairs being searched for: {pairs}")
+
+        with (
+            ThreadPoolExecutor(max_workers=self.concurrency) as executor,
+            Bar(
+                f"Searching {self.name} with {self.concurrency} workers...",
+                max=len(pairs),
+            ) as bar,
+        ):
+
+            def search_page(pair: tuple[str, int], page: int) -> Future[SearchModel]:
+                if (*pair, page) in checkpoints:
+                    stored_page: Future[SearchModel] = Future()
+                    stored_page.set_result(
+                        self._load_search(search_id=checkpoints[(*pair, page)])
+                    )
+                    return stored_page
+
+                return executor.submit(
+                    self.search_single_page,
+                    logger=self.logger,
+                    keyword_year_pair=pair,
+                    page=page,
+                )
+
+            # At most `self.concurrency` first pages and `self.concurrency`
+            # remaining pages are in flight, so memory stays flat however many
+            # pages a search has. Pages are yielded in serial order (each pair
+            # in turn, page by page) whatever order the requests finish in
+            first_pages: dict[tuple[str, int], Future[SearchModel]] = {}
+
+            index: int
+            pair: tuple[str, int]
+            for index, pair in enumerate(pairs):
+                # Keep the first pages of the next pairs in flight
+                next_pair: tuple[str, int]
+                for next_pair in pairs[index : index + self.concurrency]:
+                    if next_pair not in first_pages:
+                        first_pages[next_pair] = search_page(pair=next_pair, page=1)
+
+                first_page: SearchModel = first_pages.pop(pair).result()
+                bar.next()
+                if (*pair, 1) not in checkpoints:
+                    yield first_page
 
+                page_count: int = self._compute_total_number_of_pages(resp=first_page)
+                self.logger.debug(f"Page count of {pair}: {page_count}")
+
+                pages: list[int] = [
+                    page
+                    for page in range(2, page_count + 1)
+                    if (*pair, page) not in checkpoints
+                ]
+                bar.max += len(pages)
+                bar.update()
+
+                in_flight: deque[Future[SearchModel]] = deque()
+
+                page: int
+                for page in pages:
+                    in_flight.append(search_page(pair=pair, page=page))
+
+                    if len(in_flight) >= self.concurrency:
+                        bar.next()
+                        yield in_flight.popleft().result()
+
+                while len(in_flight) > 0:
+                    bar.next()
+                    yield in_flight.popleft().result()
+
+    @staticmethod
     @abstractmethod
-    def parse_response(self, responses: list[SearchModel]) -> list[ArticleModel]: ...
+    def parse_page(json_data: dict) -> list[tuple[str, str, str]]:  # noqa: D102
+        # Runs in parse worker processes, so it may only depend on `json_data`
+        # and the arguments bound by `page_parser`
+        ...
+
+    @property
+    def page_parser(self) -> Callable[[dict], list[tuple[str, str, str]]]:
+        # Sent to parse workers; journals bind extra `parse_page` arguments
+        return type(self).parse_page
+
+    def _to_articles(
+        self,
+        search_id: int,
+        page: list[tuple[str, str, str]],
+    ) -> Iterator[ArticleModel]:
+        doi: str
+        title: str
+        journal: str
+        for doi, title, journal in page:
+            yield ArticleModel(
+                doi=doi,
+                title=title,
+                megajournal=self.name,
+                journal=journal,
+                search_id=search_id,
+            )
+
+    def _parse_pages(
+        self,
+        pages: Iterable[dict | str],
+        executor: Executor | None = None,
+    ) -> Iterator[list[tuple[str, str, str]]]:
+        parser: Callable = partial(_parse_page, self.page_parser)
+
+        if executor is None:
+            return map(parser, pages)
+
+        # `Executor.map` returns results in the order of `pages`
+        return executor.map(parser, pages, chunksize=PARSE_SHARD_SIZE)
+
+    def parse_response(  # noqa: D102
+        self,
+        responses: list[SearchModel],
+        search_ids: list[int] | None = None,
+        executor: Executor | None = None,
+    ) -> list[ArticleModel]:
+        # Pages are parsed in this process without an `executor`; articles keep
+        # the order of `responses`, which stands in for missing `search_ids`
+        if search_ids is None:
+            search_ids = list(range(len(responses)))
+
+        data: list[ArticleModel] = []
+
+        with Bar(
+            "Extracting articles from search results...", max=len(responses)
+        ) as bar:
+            search_id: int
+            page: list[tuple[str, str, str]]
+            for search_id, page in zip(
+                search_ids,
+                self._parse_pages(
+                    pages=[response.json_data for response in responses],
+                    executor=executor,
+                ),
+                strict=True,
+            ):
+                data.extend(self._to_articles(search_id=search_id, page=page))
+                bar.next()
+
+        return data
+
+    def parse_stored_searches(  # noqa: D102
+        self,
+        executor: Executor | None = None,
+        chunksize: int = DEFAULT_CHUNKSIZE,
+    ) -> Iterator[list[ArticleModel]]:
+        # Successful pages are streamed from `searches` `chunksize` rows at a
+        # time and never requested from the network
+        df: DataFrame
+        for df in self.db.iter_query(
+            sql="""
+                SELECT _id, json_data FROM searches
+                WHERE megajournal = :megajournal AND status_code = 200
+                ORDER BY _id;
+            """,
+            parameters={"megajournal": self.name},
+            chunksize=chunksize,
+            index_col="_id",
+        ):
+            data: list[ArticleModel] = []
+
+            search_id: int
+            page: list[tuple[str, str, str]]
+            for search_id, page in zip(
+                df.index.tolist(),
+                self._parse_pages(pages=df["json_data"], executor=executor),
+                strict=True,
+            ):
+                data.extend(self._to_articles(search_id=search_id, page=page))
+
+            yield data
 
     @abstractmethod
     def download_jats(self, df: DataFrame, **kwargs) -> DataFrame: ...
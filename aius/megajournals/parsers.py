@@ -0,0 +1,224 @@
+"""
+Megajournal search result page parsers.
+
+Copyright 2025 (C) Nicholas M. Synovic
+
+"""
+
+from bs4 import BeautifulSoup, ResultSet, Tag
+from lxml import etree, html
+
+
+def _has_class(name: str) -> str:
+    # Match one token of a space separated class attribute, like CSS `.name`
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+def _lower(expression: str) -> str:
+    # BeautifulSoup lowercases XML names when parsing with the lxml HTML parser
+    return (
+        f"translate({expression}, "
+        "'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')"
+    )
+
+
+# Compiled once at import time; `BMJ` and `F1000` parse with these
+BMJ_DOCUMENT_COUNT: etree.XPath = etree.XPath(
+    "string((//div[@id = 'search-summary-wrapper' and "
+    f"{_has_class(name='highwire-search-summary')}])[1])"
+)
+BMJ_ARTICLES: etree.XPath = etree.XPath(
+    f"//div[{_has_class(name='highwire-cite-highwire-article')}]"
+)
+BMJ_DOI: etree.XPath = etree.XPath(
+    f"string((.//span[{_has_class(name='highwire-cite-metadata-doi')}])[1])"
+)
+BMJ_TITLE: etree.XPath = etree.XPath(
+    f"(.//span[{_has_class(name='highwire-cite-title')}])[1]"
+)
+BMJ_JOURNAL: etree.XPath = etree.XPath(
+    f"(.//span[{_has_class(name='highwire-cite-metadata-journal')}])[1]"
+)
+
+F1000_TOTAL_NUMBER_OF_PAGES: etree.XPath = etree.XPath(
+    f"string((//*[{_lower(expression='local-name()')} = 'results'])[1]"
+    f"/@*[{_lower(expression='local-name()')} = 'totalnumberofpages'])"
+)
+F1000_DOIS: etree.XPath = etree.XPath(
+    f"//*[{_lower(expression='local-name()')} = 'doi']"
+)
+
+_XML_PARSER: etree.XMLParser = etree.XMLParser(
+    recover=True,
+    huge_tree=True,
+    resolve_entities=False,
+    no_network=True,
+)
+
+
+def _parse_html(markup: str) -> etree._Element | None:
+    if not markup.strip():
+        return None
+
+    return html.document_fromstring(markup)
+
+
+def _parse_xml(markup: str) -> etree._Element | None:
+    if not markup.strip():
+        return None
+
+    # Bytes, so that documents with an encoding declaration are accepted
+    return etree.fromstring(markup.encode(encoding="UTF-8"), parser=_XML_PARSER)
+
+
+def bmj_document_count(markup: str) -> int | None:
+    """Return the number of documents reported by a BMJ search page."""
+    root: etree._Element | None = _parse_html(markup=markup)
+    if root is None:
+        return None
+
+    try:
+        return int(BMJ_DOCUMENT_COUNT(root).split(" ")[0])
+    except ValueError:
+        return None
+
+
+def bmj_articles(markup: str) -> list[tuple[str, str, str]]:
+    """Return the (doi, title, journal) of every article on a BMJ search page."""
+    root: etree._Element | None = _parse_html(markup=markup)
+    if root is None:
+        return []
+
+    data: list[tuple[str, str, str]] = []
+
+    doc: etree._Element
+    for doc in BMJ_ARTICLES(root):
+        doi: str = BMJ_DOI(doc)
+        titles: list[etree._Element] = BMJ_TITLE(doc)
+        journals: list[etree._Element] = BMJ_JOURNAL(doc)
+
+        if not doi or not titles or not journals:
+            continue
+
+        data.append(
+            (
+                doi.split(" ")[1],
+                titles[0].text_content(),
+                journals[0].text_content(),
+            )
+        )
+
+    return data
+
+
+def f1000_total_number_of_pages(markup: str) -> int | None:
+    """Return the number of pages reported by an F1000 search page."""
+    root: etree._Element | None = _parse_xml(markup=markup)
+    if root is None:
+        return None
+
+    try:
+        return int(F1000_TOTAL_NUMBER_OF_PAGES(root))
+    except ValueError:
+        return None
+
+
+def f1000_dois(markup: str) -> list[str]:
+    """Return the DOI of every article on an F1000 search page."""
+    root: etree._Element | None = _parse_xml(markup=markup)
+    if root is None:
+        return []
+
+    return ["".join(doc.itertext()) for doc in F1000_DOIS(root)]
+
+
+# The original BeautifulSoup parsers, kept to check the lxml parsers against
+def bmj_document_count_soup(markup: str) -> int | None:
+    """BeautifulSoup implementation of `bmj_document_count`."""
+    soup: BeautifulSoup = BeautifulSoup(markup=markup, features="lxml")
+
+    document_count_tag: Tag | None = soup.find(
+        name="div",
+        attrs={
+            "id": "search-summary-wrapper",
+            "class": "highwire-search-summary",
+        },
+    )
+
+    if isinstance(document_count_tag, Tag):
+        try:
+            return int(document_count_tag.text.split(" ")[0])
+        except ValueError:
+            pass
+
+    return None
+
+
+def bmj_articles_soup(markup: str) -> list[tuple[str, str, str]]:
+    """BeautifulSoup implementation of `bmj_articles`."""
+    data: list[tuple[str, str, str]] = []
+
+    soup: BeautifulSoup = BeautifulSoup(markup=markup, features="lxml")
+
+    docs: ResultSet[Tag] = soup.find_all(
+        name="div",
+        attrs={
+            "class": "highwire-cite-highwire-article",
+        },
+    )
+
+    doc: Tag
+    for doc in docs:
+        doi_tag: Tag | None = doc.find(
+            name="span",
+            attrs={
+                "class": "highwire-cite-metadata-doi",
+            },
+        )
+        title_tag: Tag | None = doc.find(
+            name="span",
+            attrs={
+                "class": "highwire-cite-title",
+            },
+        )
+        journal_tag: Tag | None = doc.find(
+            name="span",
+            attrs={
+                "class": "highwire-cite-metadata-journal",
+            },
+        )
+
+        if not isinstance(doi_tag, Tag):
+            continue
+
+        if not isinstance(title_tag, Tag):
+            continue
+
+        if not isinstance(journal_tag, Tag):
+            continue
+
+        data.append((doi_tag.text.split(" ")[1], title_tag.text, journal_tag.text))
+
+    return data
+
+
+def f1000_total_number_of_pages_soup(markup: str) -> int | None:
+    """BeautifulSoup implementation of `f1000_total_number_of_pages`."""
+    soup: BeautifulSoup = BeautifulSoup(markup=markup, features="lxml")
+
+    document_count_tag: Tag | None = soup.find(name="results")
+
+    if isinstance(document_count_tag, Tag):
+        try:
+            return int(document_count_tag["totalnumberofpages"])
+        except (KeyError, ValueError):
+            pass
+
+    return None
+
+
+def f1000_dois_soup(markup: str) -> list[str]:
+    """BeautifulSoup implementation of `f1000_dois`."""
+    soup: BeautifulSoup = BeautifulSoup(markup=markup, features="lxml")
+
+    return [doc.text for doc in soup.find_all(name="doi")]
@@ -10,13 +10,25 @@ from progress.bar import Bar
 
 from aius.db import DB
 from aius.megajournals.megajournal import MegaJournal
-from aius.megajournals.models import ArticleModel, SearchModel
+from aius.megajournals.models import SearchModel
+from aius.util.response_cache import ResponseCache
 
 
 class PLOS(MegaJournal):
-    def __init__(self, logger: Logger, db: DB) -> None:
+    def __init__(
+        self,
+        logger: Logger,
+        db: DB,
+        concurrency: int = 1,
+        http_cache: ResponseCache | None = None,
+    ) -> None:
         # Load default variable values
-        super().__init__(logger=logger, db=db)
+        super().__init__(
+            logger=logger,
+            db=db,
+            concurrency=concurrency,
+            http_cache=http_cache,
+        )
 
         self.megajournal: str = "PLOS"
         self.name = self.megajournal
@@ -41,76 +53,12 @@ class PLOS(MegaJournal):
 
         return pages
 
-    def search(self) -> list[SearchModel]:
-        data: list[SearchModel] = []
-
-        pair: tuple[str, int]
-        for pair in self.keyword_year_products:
-            self.logger.debug(msg=f"Keyword year pair being searched for: {pair}")
-
-            with Bar(
-                f"Searching {self.megajournal} for {pair[0]} in {pair[1]}...",
-                max=1,
-            ) as bar:
-                # Get the first page of results
-                resp: SearchModel = self.search_single_page(
-                    logger=self.logger,
-                    keyword_year_pair=pair,
-                    page=1,
-                )
-                data.append(resp)
-                bar.next()
-
-                # Get the number of pages to iterate through
-                page_count = self._compute_total_number_of_pages(resp=resp)
-
-                # Iterate to the next page if page_count == 1
-                if page_count <= 1:
-                    continue
-                else:
-                    bar.max = page_count
-                    bar.update()
-
-                page: int
-                for page in range(2, page_count + 1):
-                    resp: SearchModel = self.search_single_page(
-                        logger=self.logger,
-                        keyword_year_pair=pair,
-                        page=page,
-                    )
-                    data.append(resp)
-                    bar.next()
-
-        return data
-
-    def parse_response(self, responses: list[SearchModel]) -> list[ArticleModel]:
-        data: list[ArticleModel] = []
-
-        response_index: int = 0
-
-        with Bar(
-            "Extracting articles from search results...", max=len(responses)
-        ) as bar:
-            response: SearchModel
-            for response in responses:
-                docs: list[dict] = response.json_data["searchResults"]["docs"]
-
-                doc: dict
-                for doc in docs:
-                    data.append(
-                        ArticleModel(
-                            doi=doc["id"],
-                            title=doc["title"],
-                            megajournal=self.megajournal,
-                            journal=doc["journal_name"],
-                            search_id=response_index,
-                        )
-                    )
-
-                response_index += 1
-                bar.next()
-
-        return data
+    @staticmethod
+    def parse_page(json_data: dict) -> list[tuple[str, str, str]]:  # noqa: D102
+        return [
+            (doc["id"], doc["title"], doc["journal_name"])
+            for doc in json_data["searchResults"]["docs"]
+        ]
 
     def download_jats(self, df: DataFrame, **kwargs) -> DataFrame:
         data: dict[str, list[str | int]] = {
@@ -3,6 +3,40 @@ from json import dumps
 from pandas import DataFrame
 from pydantic import BaseModel
 
+# DOIs per request; OpenAlex returns at most 100 works per page
+OPENALEX_CHUNK_SIZE: int = 100
+
+# Requests in flight at a time; the `api.openalex.org` token bucket of
+# `HTTPSession` keeps them within the polite pool rate
+DEFAULT_OPENALEX_CONCURRENCY: int = 8
+
+# Top-level work fields that `OpenAlexRunner` reads; always requested when
+# records are projected with `select=`
+OPENALEX_REQUIRED_FIELDS: list[str] = [
+    "id",
+    "doi",
+    "publication_year",
+    "type",
+    "cited_by_count",
+    "open_access",
+    "primary_topic",
+    "topics",
+]
+
+
+# Ranked topics of a work that are stored in `topic_0`, `topic_1`, and `topic_2`
+# and considered by the natural science filter
+OPENALEX_TOPIC_RANKS: int = 3
+
+
+class TopicModel(BaseModel):  # noqa: D101
+    doi: str
+    rank: int
+    field_id: int | None
+    field_name: str | None
+    subfield: str | None = None
+    score: float | None = None
+
 
 class MetadataModel(BaseModel):  # noqa: D101
     timestamp: float
@@ -12,6 +46,9 @@ class MetadataModel(BaseModel):  # noqa: D101
     topic_0: str | None
     topic_1: str | None
     topic_2: str | None
+    publication_year: int | None = None
+    type: str | None = None
+    primary_topic_field: str | None = None
     json_data: dict
 
     @property
@@ -24,7 +61,53 @@ class MetadataModel(BaseModel):  # noqa: D101
             "topic_0": [self.topic_0],
             "topic_1": [self.topic_1],
             "topic_2": [self.topic_2],
+            "publication_year": [self.publication_year],
+            "type": [self.type],
+            "primary_topic_field": [self.primary_topic_field],
             "json_data": [dumps(obj=self.json_data)],
         }
 
         return DataFrame(data=data)
+
+
+def extract_topic_rows(doi: str, topics: list[dict[str, dict]]) -> list[TopicModel]:
+    """Return the ranked topics of a work as `openalex_topics` rows."""
+    data: list[TopicModel] = []
+
+    rank: int
+    topic: dict
+    for rank, topic in enumerate(topics):
+        field: dict = topic.get("field") or {}
+        subfield: dict = topic.get("subfield") or {}
+
+        # Field ids are URLs such as `https://openalex.org/fields/17`
+        field_id: str | None = field.get("id")
+
+        data.append(
+            TopicModel(
+                doi=doi,
+                rank=rank,
+                field_id=None
+                if field_id is None
+                else int(field_id.rstrip("/").rsplit("/", 1)[-1]),
+                field_name=field.get("display_name"),
+                subfield=subfield.get("display_name"),
+                score=topic.get("score"),
+            )
+        )
+
+    return data
+
+
+def extract_columns(result: dict) -> dict:
+    """Return the fields of a work that are stored in indexed `openalex` columns."""
+    # Snapshot records and projections may lack any of them, or hold null
+    primary_topic: dict = result.get("primary_topic") or {}
+
+    return {
+        "cited_by_count": int(result.get("cited_by_count") or 0),
+        "open_access": bool((result.get("open_access") or {}).get("is_oa")),
+        "publication_year": result.get("publication_year"),
+        "type": result.get("type"),
+        "primary_topic_field": (primary_topic.get("field") or {}).get("display_name"),
+    }
@@ -5,18 +5,38 @@ Copyright 2025 (C) Nicholas M. Synovic
 
 """
 
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
 from datetime import datetime, timezone
 from logging import Logger
+from multiprocessing import get_context
+from pathlib import Path
 from string import Template
 
 import pandas as pd
-from pandas import DataFrame
 from progress.bar import Bar
 from requests import Response, Session
+from sqlalchemy import text
 
 from aius.db import DB
-from aius.openalex import MetadataModel
+from aius.openalex import (
+    DEFAULT_OPENALEX_CONCURRENCY,
+    OPENALEX_CHUNK_SIZE,
+    OPENALEX_REQUIRED_FIELDS,
+    OPENALEX_TOPIC_RANKS,
+    MetadataModel,
+    extract_columns,
+    extract_topic_rows,
+)
+from aius.openalex.snapshot import init_worker, list_partitions, scan_partition
 from aius.runner import Runner
+from aius.util.doi import normalize_doi
 from aius.util.http_session import HTTPSession
 
 
@@ -26,114 +46,259 @@ class OpenAlexRunner(Runner):  # noqa: D101
         db: DB,
         logger: Logger,
         email: str,
+        concurrency: int = DEFAULT_OPENALEX_CONCURRENCY,
+        max_age_days: float | None = None,
+        full: bool = False,  # noqa: FBT001, FBT002
+        select: list[str] | None = None,
+        archive: bool = False,  # noqa: FBT001, FBT002
+        snapshot: Path | None = None,
+        processes: int = 1,
     ) -> None:
         # Set class constants
         super().__init__(name="openalex", db=db, logger=logger)
         self.email: str = email
 
-        self.search_template: Template = Template(
-            template="https://api.openalex.org/works?per-page=100&mailto=${email}&filter=doi:${dois}"
-        )
+        # Maximum number of DOI chunks requested at the same time
+        self.concurrency: int = max(1, concurrency)
+        self.logger.info("Concurrency: %s", self.concurrency)
+
+        # Only DOIs without metadata, or with metadata older than
+        # `max_age_days`, are fetched unless `full` is set
+        self.max_age_days: float | None = max_age_days
+        self.full: bool = full
+        self.logger.info("Max age (days): %s", self.max_age_days)
+        self.logger.info("Full refresh: %s", self.full)
+
+        # Works are read from a local snapshot instead of the API when set
+        self.snapshot: Path | None = snapshot
+        self.processes: int = max(1, processes)
+        self.logger.info("Snapshot: %s", self.snapshot)
+        self.logger.info("Snapshot processes: %s", self.processes)
+
+        # Records are projected to the fields the pipeline reads, plus
+        # `select`, unless full records are archived
+        self.select: list[str] | None = None
+        if not archive:
+            self.select = list(
+                dict.fromkeys([*OPENALEX_REQUIRED_FIELDS, *(select or [])])
+            )
+        self.logger.info("Selected fields: %s", self.select)
+
+        search_url: str = "https://api.openalex.org/works?per-page=100&mailto=${email}&filter=doi:${dois}"
+        if self.select is not None:
+            search_url = f"{search_url}&select={','.join(self.select)}"
+
+        self.search_template: Template = Template(template=search_url)
 
         # Custom HTTPS session with exponential backoff enabled
-        session_util: HTTPSession = HTTPSession()
+        session_util: HTTPSession = HTTPSession(pool_maxsize=self.concurrency)
         self.timeout: int = session_util.timeout
         self.session: Session = session_util.session
 
-    def _get_doi_chunks(self, chunk_size: int = 50) -> list[list[str]]:
-        # Get all DOIs from the database
-        sql: str = "SELECT DISTINCT doi FROM articles;"
-        doi_df: DataFrame = pd.read_sql_query(sql=sql, con=self.db.engine)
-        doi_list: list[str] = doi_df["doi"].tolist()
+    def _get_dois(self) -> list[str]:
+        # Every paper once, whichever keywords found it
+        if self.full:
+            sql: str = "SELECT doi FROM documents ORDER BY _id;"
+            return pd.read_sql_query(sql=text(sql), con=self.db.engine)["doi"].tolist()
+
+        # Anti-join through `ix_openalex_doi`: documents without a fresh
+        # OpenAlex row. Without a maximum age (a NULL cutoff) any row is fresh
+        cutoff: float | None = None
+        if self.max_age_days is not None:
+            cutoff = datetime.now(tz=timezone.utc).timestamp() - (
+                self.max_age_days * 24 * 60 * 60
+            )
+
+        sql = """
+            SELECT d.doi FROM documents d
+            WHERE NOT EXISTS (
+                SELECT 1 FROM openalex oa
+                WHERE oa.doi = d.doi
+                AND (:cutoff IS NULL OR oa.timestamp >= :cutoff)
+            )
+            ORDER BY d._id;
+        """
+        return pd.read_sql_query(
+            sql=text(sql),
+            con=self.db.engine,
+            params={"cutoff": cutoff},
+        )["doi"].tolist()
+
+    def _get_doi_chunks(
+        self,
+        chunk_size: int = OPENALEX_CHUNK_SIZE,
+    ) -> list[list[str]]:
+        doi_list: list[str] = self._get_dois()
+        self.logger.info("DOIs to fetch from OpenAlex: %s", len(doi_list))
 
         # Format dois
         doi_list = ["https://doi.org/" + doi for doi in doi_list]
 
-        # Chunk dois into groups
-        return [doi_list[i : i + 50] for i in range(0, len(doi_list), 50)]
+        # Chunk dois into groups that fill one page of results
+        return [
+            doi_list[i : i + chunk_size] for i in range(0, len(doi_list), chunk_size)
+        ]
 
     @staticmethod
     def extract_topics(topics: list[dict[str, dict]]) -> tuple:  # noqa: D102
-        topic_0: str | None = None
-        topic_1: str | None = None
-        topic_2: str | None = None
+        # Field names of the first `OPENALEX_TOPIC_RANKS` topics, padded with None
+        fields: list[str | None] = [
+            (topic.get("field") or {}).get("display_name")
+            for topic in (topics or [])[:OPENALEX_TOPIC_RANKS]
+        ]
+
+        return tuple(fields + [None] * (OPENALEX_TOPIC_RANKS - len(fields)))
 
-        for i, topic in enumerate(topics):
-            if i == 0:
-                topic_0 = topic["field"]["display_name"]
-            elif i == 1:
-                topic_1 = topic["field"]["display_name"]
-            else:
-                topic_2 = topic["field"]["display_name"]
+    def to_metadata(self, result: dict, timestamp: float) -> MetadataModel:  # noqa: D102
+        topic_0, topic_1, topic_2 = self.extract_topics(topics=result.get("topics"))
 
-        return (topic_0, topic_1, topic_2)
+        return MetadataModel(
+            timestamp=timestamp,
+            doi=normalize_doi(doi=result["doi"]),
+            topic_0=topic_0,
+            topic_1=topic_1,
+            topic_2=topic_2,
+            json_data=result,
+            **extract_columns(result=result),
+        )
 
-    def search(self) -> list[MetadataModel]:  # noqa: D102
+    def to_metadata_rows(  # noqa: D102
+        self,
+        results: list[dict],
+        timestamp: float,
+    ) -> list[MetadataModel]:
         data: list[MetadataModel] = []
 
+        # A malformed work is skipped rather than aborting the whole ingest
+        result: dict
+        for result in results:
+            try:
+                data.append(self.to_metadata(result=result, timestamp=timestamp))
+            except (AttributeError, KeyError, TypeError, ValueError):
+                self.logger.exception(
+                    "Skipping malformed OpenAlex work: %s",
+                    result.get("id") or result.get("doi"),
+                )
+
+        return data
+
+    def _search_chunk(self, chunk: list[str]) -> list[MetadataModel]:
+
+        url: str = self.search_template.substitute(
+            email=self.email,
+            dois="|".join(chunk),
+        )
+        self.logger.info("Querying %s", url)
+
+        timestamp: float = datetime.now(tz=timezone.utc).timestamp()
+        resp: Response = self.session.get(url=url, timeout=self.timeout)
+        self.logger.debug("Response status code: %s", resp.status_code)
+
+        if resp.status_code != 200:  # noqa: PLR2004
+            self.logger.error("Non 200 response code for %s: %s", url, resp.content)
+            return []
+
+        return self.to_metadata_rows(
+            results=resp.json()["results"],
+            timestamp=timestamp,
+        )
+
+    def search(self) -> Iterator[list[MetadataModel]]:  # noqa: D102
         doi_chunks: list[list[str]] = self._get_doi_chunks()
 
-        with Bar("Searching OpenAlex for DOI metadata...", max=len(doi_chunks)) as bar:
+        with (
+            ThreadPoolExecutor(max_workers=self.concurrency) as executor,
+            Bar("Searching OpenAlex for DOI metadata...", max=len(doi_chunks)) as bar,
+        ):
+            # At most `self.concurrency` chunks are in flight, and results are
+            # yielded in chunk order whatever order the requests finish in
+            in_flight: deque[Future[list[MetadataModel]]] = deque()
+
             chunk: list[str]
             for chunk in doi_chunks:
-                url: str = self.search_template.substitute(
-                    email=self.email,
-                    dois="|".join(chunk),
-                )
-                self.logger.info("Querying %s", url)
+                in_flight.append(executor.submit(self._search_chunk, chunk=chunk))
 
-                timestamp: float = datetime.now(tz=timezone.utc).timestamp()
-                resp: Response = self.session.get(url=url)
-                self.logger.debug("Response status code: %s", resp.status_code)
+                if len(in_flight) >= self.concurrency:
+                    bar.next()
+                    yield in_flight.popleft().result()
 
-                result: dict
-                for result in resp.json()["results"]:
-                    topic_0, topic_1, topic_2 = self.extract_topics(
-                        topics=result["topics"]
-                    )
+            while len(in_flight) > 0:
+                bar.next()
+                yield in_flight.popleft().result()
 
-                    data.append(
-                        MetadataModel(
-                            timestamp=timestamp,
-                            doi=result["doi"].replace("https://doi.org/", ""),
-                            cited_by_count=int(result["cited_by_count"]),
-                            open_access=result["open_access"]["is_oa"],
-                            topic_0=topic_0,
-                            topic_1=topic_1,
-                            topic_2=topic_2,
-                            json_data=result,
-                        )
-                    )
+    def search_snapshot(self) -> Iterator[list[MetadataModel]]:  # noqa: D102
+        dois: list[str] = self._get_dois()
+        self.logger.info("DOIs to match in the snapshot: %s", len(dois))
+
+        partitions: list[Path] = list_partitions(snapshot=self.snapshot)
+        self.logger.info("Snapshot partitions: %s", len(partitions))
+
+        # Each worker holds the DOI set and streams whole partitions; only
+        # matching works travel back, in partition order
+        executor: Executor = ProcessPoolExecutor(
+            max_workers=self.processes,
+            mp_context=get_context(method="spawn"),
+            initializer=init_worker,
+            initargs=(dois,),
+        )
 
+        with (
+            executor,
+            Bar("Scanning the OpenAlex snapshot...", max=len(partitions)) as bar,
+        ):
+            # As in `search`, at most `self.processes` partitions are queued
+            in_flight: deque[Future[list[dict]]] = deque()
+
+            def next_results() -> list[MetadataModel]:
+                results: list[dict] = in_flight.popleft().result()
+                timestamp: float = datetime.now(tz=timezone.utc).timestamp()
                 bar.next()
+                return self.to_metadata_rows(results=results, timestamp=timestamp)
 
-        return data
+            partition: Path
+            for partition in partitions:
+                in_flight.append(
+                    executor.submit(
+                        scan_partition, partition=partition, select=self.select
+                    )
+                )
+
+                if len(in_flight) >= self.processes:
+                    yield next_results()
+
+            while len(in_flight) > 0:
+                yield next_results()
 
     def execute(self) -> int:  # noqa: D102
-        # Get the current row count of the `openalex` table to ensure that the
-        # SQL Unique constraint is not violated by updating DataFrame index
-        # later
-        search_table_row_count: int = self.db.get_last_row_id(table_name="openalex")
-
-        # Conduct searches
-        self.logger.info("Executing OpenAlex search")
-        searches: list[MetadataModel] = self.search()
-        self.logger.info("Searched %s documents", len(searches))
-
-        # Create DataFrame of searches
-        self.logger.info(msg="Preparing searches for database write")
-        searches_df: DataFrame = pd.concat(
-            objs=[mm.to_df for mm in searches],
-            ignore_index=True,
-        )
+        # Conduct searches, writing each chunk or snapshot partition as it
+        # arrives in place of any earlier rows of its DOIs
+        searches_iter: Iterator[list[MetadataModel]]
+        if self.snapshot is None:
+            self.logger.info("Executing OpenAlex search")
+            searches_iter = self.search()
+        else:
+            self.logger.info("Executing OpenAlex snapshot search: %s", self.snapshot)
+            searches_iter = self.search_snapshot()
+
+        search_count: int = 0
+
+        searches: list[MetadataModel]
+        for searches in searches_iter:
+            self.db.upsert_openalex(
+                rows=searches,
+                topics=[
+                    extract_topic_rows(
+                        doi=row.doi,
+                        topics=row.json_data.get("topics") or [],
+                    )
+                    for row in searches
+                ],
+            )
+            search_count += len(searches)
 
-        # Update unique search IDs
-        if search_table_row_count != 0:
-            update_val: int = search_table_row_count + 1
-            self.logger.info("Updating search IDs by %s", update_val)
-            searches_df.index += update_val
+        self.logger.info("Searched %s documents", search_count)
 
-        # Write DataFrame to the database
-        self.db.write_dataframe_to_table(table_name="openalex", df=searches_df)
+        # Materialize the natural science DOIs of the new rows
+        self.db.refresh_natural_science_articles()
 
         return 0
@@ -0,0 +1,64 @@
+"""
+OpenAlex works snapshot scanning.
+
+Copyright 2025 (C) Nicholas M. Synovic
+
+"""
+
+import gzip
+import re
+from json import loads
+from pathlib import Path
+
+from aius.util.doi import normalize_doi
+
+# `doi` values anywhere in a line, read without decoding it. Nested objects,
+# e.g. locations, may hold DOIs too, so matches are checked after decoding
+DOI_FIELD_PATTERN: re.Pattern = re.compile(pattern=r'"doi":\s*"([^"]+)"')
+
+# DOIs to match in this process; set once per worker by `init_worker`
+_dois: frozenset[str] = frozenset()
+
+
+def init_worker(dois: list[str]) -> None:  # noqa: D103
+    global _dois  # noqa: PLW0603
+    _dois = frozenset(dois)
+
+
+def list_partitions(snapshot: Path) -> list[Path]:  # noqa: D103
+    # `snapshot` is the `data/works` directory of gzipped JSON Lines partitions
+    # (`updated_date=YYYY-MM-DD/part_000.gz`) or a single partition
+    if snapshot.is_file():
+        return [snapshot]
+
+    return sorted(snapshot.rglob(pattern="*.gz"))
+
+
+def scan_partition(  # noqa: D103
+    partition: Path,
+    select: list[str] | None = None,
+) -> list[dict]:
+    # Lines are streamed and only decoded when they hold a requested DOI, so
+    # memory stays flat however large a partition is. `select` keeps top-level
+    # fields, as with the API's `select=`
+    data: list[dict] = []
+
+    with gzip.open(filename=partition, mode="rt", encoding="UTF-8") as fp:
+        line: str
+        for line in fp:
+            if not any(
+                normalize_doi(doi=doi) in _dois
+                for doi in DOI_FIELD_PATTERN.findall(string=line)
+            ):
+                continue
+
+            # Only the top-level `doi` identifies the work
+            work: dict = loads(s=line)
+            if normalize_doi(doi=work.get("doi") or "") not in _dois:
+                continue
+            if select is not None:
+                work = {field: work.get(field) for field in select}
+
+            data.append(work)
+
+    return data
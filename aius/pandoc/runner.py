@@ -7,7 +7,6 @@ Copyright 2025 (C) Nicholas M. Synovic
 
 from logging import Logger
 
-import pandas as pd
 from bs4 import BeautifulSoup, ResultSet, Tag
 from mdformat import text
 from pandas import DataFrame, Series
@@ -50,36 +49,40 @@ class PandocRunner(Runner):  # noqa: D101
 
         return soup.prettify()
 
-    def execute(self) -> int:  # noqa: D102
+    def convert_chunk(self, df: DataFrame, bar: Bar) -> DataFrame:  # noqa: D102
         data: dict[str, list[str]] = {"doi": [], "markdown": []}
 
-        df: DataFrame = pd.read_sql_table(
-            table_name="jats",
-            con=self.db.engine,
-            index_col="_id",
-        )
-
-        with Bar("Converting JATS XML to Markdown...", max=df.shape[0]) as bar:
-            row: Series
-            for _, row in df.iterrows():
-                data["doi"].append(row["doi"])
+        row: Series
+        for _, row in df.iterrows():
+            data["doi"].append(row["doi"])
 
-                xml: str = self.format_xml(xml=row["jats_xml"])
-                self.json_body["text"] = xml
+            xml: str = self.format_xml(xml=row["jats_xml"])
+            self.json_body["text"] = xml
 
-                self.logger.info("Converting %s from JATS XML to Markdown", row["doi"])
-                resp: Response = post(
-                    url=self.pandoc_uri,
-                    json=self.json_body,
-                    timeout=3600,
-                )
+            self.logger.info("Converting %s from JATS XML to Markdown", row["doi"])
+            resp: Response = post(
+                url=self.pandoc_uri,
+                json=self.json_body,
+                timeout=3600,
+            )
 
-                data["markdown"].append(text(md=resp.content.decode(encoding="utf-8")))
+            data["markdown"].append(text(md=resp.content.decode(encoding="utf-8")))
 
-                bar.next()
+            bar.next()
 
-        df: DataFrame = DataFrame(data=data)
+        return DataFrame(data=data)
 
-        self.db.write_dataframe_to_table(table_name="markdown", df=df)
+    def execute(self) -> int:  # noqa: D102
+        row_count: int = self.db.get_row_count(table_name="jats")
+
+        # Convert and write one chunk at a time to bound memory usage
+        with Bar("Converting JATS XML to Markdown...", max=row_count) as bar:
+            df: DataFrame
+            for df in self.db.iter_table(
+                table_name="jats",
+                columns=["doi", "jats_xml"],
+            ):
+                markdown_df: DataFrame = self.convert_chunk(df=df, bar=bar)
+                self.db.write_dataframe_to_table(table_name="markdown", df=markdown_df)
 
         return 0
@@ -0,0 +1,29 @@
+"""
+Column recompression runner.
+
+Copyright 2025 (C) Nicholas M. Synovic
+
+"""
+
+from logging import Logger
+
+from aius.db import DB
+from aius.runner import Runner
+
+
+class RecompressRunner(Runner):  # noqa: D101
+    def __init__(  # noqa: D107
+        self,
+        db: DB,
+        logger: Logger,
+        vacuum: bool = False,  # noqa: FBT001, FBT002
+    ) -> None:
+        super().__init__(name="recompress", db=db, logger=logger)
+        self.vacuum: bool = vacuum
+        self.logger.info("Vacuum: %s", self.vacuum)
+
+    def execute(self) -> int:  # noqa: D102
+        # Rewrites every compressible column in place with `self.db.codec`
+        self.db.recompress(vacuum=self.vacuum)
+
+        return 0
@@ -0,0 +1,70 @@
+"""
+Rebuild articles from stored journal searches.
+
+Copyright 2025 (C) Nicholas M. Synovic
+
+"""
+
+from contextlib import nullcontext
+from logging import Logger
+
+from aius.db import DB
+from aius.megajournals import MEGAJOURNAL_MAPPING
+from aius.megajournals.megajournal import MegaJournal, parse_pool
+from aius.megajournals.models import ArticleModel
+from aius.runner import Runner
+
+
+class ReparseRunner(Runner):  # noqa: D101
+    def __init__(  # noqa: D107
+        self,
+        db: DB,
+        logger: Logger,
+        megajournal_name: str,
+        processes: int = 1,
+    ) -> None:
+        super().__init__(name="reparse", db=db, logger=logger)
+
+        self.megajournal_name: str = megajournal_name.lower()
+        self.logger.info("Journal name: %s", self.megajournal_name)
+        self.processes: int = max(1, processes)
+        self.logger.info("Parse processes: %s", self.processes)
+
+        # Only the parser of the journal is used; nothing is requested
+        self.megajournal: MegaJournal = MEGAJOURNAL_MAPPING[self.megajournal_name](
+            logger=self.logger,
+            db=self.db,
+        )
+
+    def execute(self) -> int:  # noqa: D102
+        # The stored searches are the source of truth for the journal's
+        # articles. The delete and the inserts commit in one transaction, so a
+        # failed reparse leaves the old articles untouched
+        article_count: int = 0
+
+        with (
+            self.db.engine.begin() as conn,
+            nullcontext()
+            if self.processes == 1
+            else parse_pool(processes=self.processes) as executor,
+        ):
+            self.db.delete_rows(
+                table_name="articles",
+                where="megajournal = :megajournal",
+                parameters={"megajournal": self.megajournal.name},
+                conn=conn,
+            )
+
+            articles: list[ArticleModel]
+            for articles in self.megajournal.parse_stored_searches(executor=executor):
+                self.db.bulk_insert(table_name="articles", rows=articles, conn=conn)
+                self.db.upsert_documents(articles=articles, conn=conn)
+                article_count += len(articles)
+
+        self.logger.info(
+            "Rebuilt %s articles of %s",
+            article_count,
+            self.megajournal.name,
+        )
+
+        return 0
@@ -5,116 +5,243 @@ Copyright 2025 (C) Nicholas M. Synovic
 
 """
 
+from collections.abc import Iterator
+from concurrent.futures import Executor
+from contextlib import nullcontext
 from logging import Logger
-
-import pandas as pd
-from pandas import DataFrame
+from queue import Full, Queue
+from threading import Event, Thread
 
 from aius.db import DB
 from aius.megajournals import MEGAJOURNAL_MAPPING
-from aius.megajournals.megajournal import MegaJournal
+from aius.megajournals.megajournal import MegaJournal, parse_pool
 from aius.megajournals.models import ArticleModel, SearchModel
 from aius.runner import Runner
+from aius.util.response_cache import ResponseCache
+
+# Fetched pages waiting to be written and parsed
+SEARCH_QUEUE_SIZE: int = 16
+
+# Written searches parsed together per parse process
+PARSE_BATCH_SIZE: int = 8
 
 
 # Template method design pattern
 class SearchRunner(Runner):  # noqa: D101
-    def __init__(  # noqa: D107
+    def __init__(  # noqa: D107, PLR0913
         self,
         db: DB,
         logger: Logger,
-        megajournal_name: str,
+        megajournal_names: list[str],
+        concurrency: int = 1,
+        http_cache: ResponseCache | None = None,
+        restart: bool = False,  # noqa: FBT001, FBT002
+        processes: int = 1,
     ) -> None:
         # Set constants
         super().__init__(name="search", db=db, logger=logger)
 
-        # Identify which megajournal to use
+        # Identify which megajournals to use
         # Factory method design pattern
-        self.megajournal_name: str = megajournal_name.lower()
-        self.logger.info("Journal name: %s", self.megajournal_name)
-        self.megajournal: MegaJournal = MEGAJOURNAL_MAPPING[self.megajournal_name](
-            logger=self.logger, db=self.db
-        )
-        self.logger.info("Identified journal as %s", self.megajournal.name)
-
-    def _get_table_row_count(self, table_name: str) -> int:
-        row_count: int = self.megajournal.db.get_last_row_id(table_name)
+        self.megajournal_names: list[str] = [name.lower() for name in megajournal_names]
+        self.logger.info("Journal names: %s", self.megajournal_names)
+        self.restart: bool = restart
+        self.processes: int = max(1, processes)
+        self.logger.info("Parse processes: %s", self.processes)
+
+        # Journals share the per-host token buckets of `HTTPSession`
+        self.megajournals: list[MegaJournal] = [
+            MEGAJOURNAL_MAPPING[name](
+                logger=self.logger,
+                db=self.db,
+                concurrency=concurrency,
+                http_cache=http_cache,
+            )
+            for name in self.megajournal_names
+        ]
         self.logger.info(
-            "%s rows previously existed in table `%s`", row_count, table_name
+            "Identified journals as %s",
+            [megajournal.name for megajournal in self.megajournals],
         )
-        return row_count
-
-    def _update_df_index(self, table_row_count: int, df: DataFrame) -> None:
-        if table_row_count != 0:
-            update_val: int = table_row_count + 1
-            self.logger.info("Updating search IDs by %s", update_val)
-            df.index += update_val
-
-    def search_for_articles(self) -> list[SearchModel]:
-        # Get the current row count of the `searches` table to ensure that the
-        # SQL Unique constraint is not violated by updating DataFrame index
-        # later
-        row_count: int = self._get_table_row_count(table_name="searches")
-
-        # Conduct searches
-        self.logger.info("Executing %s search", self.megajournal.name)
-        searches: list[SearchModel] = self.megajournal.search()
-        self.logger.info(
-            "Searched %s queries in %s",
-            len(searches),
-            self.megajournal.name,
-        )
-
-        # Create DataFrame of searches
-        self.logger.info(msg="Preparing searches for database write")
-
-        searches_df = pd.concat(
-            objs=[sm.to_df for sm in searches],
-            ignore_index=True,
-        )
-        self.logger.debug("Search DataFrame: %s", searches_df)
-
-        # Update unique search IDs
-        self._update_df_index(table_row_count=row_count, df=searches_df)
 
-        # Write data
-        self.db.write_dataframe_to_table(table_name="searches", df=searches_df)
-
-        return searches
-
-    def parse_articles(self, searches: list[SearchModel]) -> None:
-        # Get the current row count of the `articles` table to ensure that the
-        # SQL Unique constraint is not violated by updating DataFrame index
-        # later
-        row_count: int = self._get_table_row_count(table_name="articles")
-
-        # Parse searches for articles
-        self.logger.info("Executing %s article extraction", self.megajournal.name)
-        articles: list[ArticleModel] = self.megajournal.parse_response(
-            responses=searches
+    def _produce_searches(
+        self,
+        megajournal: MegaJournal,
+        checkpoints: dict[tuple[str, int, int], int],
+        searches: Queue,
+        stop: Event,
+    ) -> None:
+        def put(item: SearchModel | BaseException | None) -> bool:
+            # Give up once the consumer has stopped reading
+            while not stop.is_set():
+                try:
+                    searches.put(item=(megajournal, item), timeout=1)
+                except Full:
+                    continue
+                return True
+            return False
+
+        try:
+            search: SearchModel
+            for search in megajournal.search(checkpoints=checkpoints):
+                if not put(item=search):
+                    return
+        except Exception as error:  # noqa: BLE001
+            put(item=error)
+        finally:
+            put(item=None)
+
+    def _get_checkpoints(
+        self,
+        megajournal: MegaJournal,
+    ) -> dict[tuple[str, int, int], int]:
+        # Pages already written by an interrupted search are skipped
+        if self.restart:
+            self.db.clear_search_checkpoints(megajournal=megajournal.name)
+            return {}
+
+        return self.db.get_search_checkpoints(megajournal=megajournal.name)
+
+    def search_for_articles(self) -> Iterator[tuple[MegaJournal, SearchModel]]:
+        # Producers: a thread per journal fetches pages into a shared bounded
+        # queue, so journals are searched concurrently, fetching overlaps with
+        # parsing, and memory stays flat
+        searches: Queue = Queue(maxsize=SEARCH_QUEUE_SIZE * len(self.megajournals))
+        stop: Event = Event()
+
+        megajournal: MegaJournal
+        for megajournal in self.megajournals:
+            self.logger.info("Executing %s search", megajournal.name)
+            Thread(
+                target=self._produce_searches,
+                kwargs={
+                    "megajournal": megajournal,
+                    "checkpoints": self._get_checkpoints(megajournal=megajournal),
+                    "searches": searches,
+                    "stop": stop,
+                },
+                daemon=True,
+            ).start()
+
+        # A failing journal does not stop the others; its error is raised
+        # once every journal has finished
+        errors: list[BaseException] = []
+        running: int = len(self.megajournals)
+
+        try:
+            while running > 0:
+                item: SearchModel | BaseException | None
+                megajournal, item = searches.get()
+
+                if item is None:
+                    running -= 1
+                elif isinstance(item, BaseException):
+                    self.logger.error("Searching %s failed: %r", megajournal.name, item)
+                    errors.append(item)
+                else:
+                    yield megajournal, item
+        finally:
+            # The daemon producers exit at their next put
+            stop.set()
+
+        if len(errors) > 0:
+            raise errors[0]
+
+    def write_search(self, search: SearchModel) -> int:  # noqa: D102
+        # SQLite assigns the unique search ID
+        return self.db.bulk_insert(table_name="searches", rows=[search])[0]
+
+    def parse_articles(
+        self,
+        megajournal: MegaJournal,
+        searches: list[tuple[SearchModel, int]],
+        executor: Executor | None = None,
+    ) -> None:
+        # Parse the written (search, search ID) pairs for articles; articles
+        # reference the `_id` the database assigned to their search
+        articles: list[ArticleModel] = megajournal.parse_response(
+            responses=[search for search, _ in searches],
+            search_ids=[search_id for _, search_id in searches],
+            executor=executor,
         )
         self.logger.info(
             "Extracted %s from %s",
             len(articles),
-            self.megajournal.name,
+            megajournal.name,
         )
 
-        # Create DataFrame of articles
-        self.logger.info(msg="Preparing articles for database write")
-        articles_df: DataFrame = pd.concat(
-            objs=[am.to_df for am in articles],
-            ignore_index=True,
-        )
-        self.logger.debug("Data: %s", articles_df)
-
-        # Update unique article IDs
-        self._update_df_index(table_row_count=row_count, df=articles_df)
-
-        # Write DataFrames to the database
-        self.db.write_dataframe_to_table(table_name="articles", df=articles_df)
+        # Write articles to the database, and each paper once to `documents`
+        self.db.bulk_insert(table_name="articles", rows=articles)
+        self.db.upsert_documents(articles=articles)
+
+        # Only successful pages are complete; others are requested again
+        search: SearchModel
+        search_id: int
+        for search, search_id in searches:
+            if search.status_code == 200:  # noqa: PLR2004
+                self.db.add_search_checkpoint(
+                    megajournal=megajournal.name,
+                    search_keyword=search.search_keyword,
+                    year=search.year,
+                    page=search.page,
+                    search_id=search_id,
+                )
 
     def execute(self) -> int:  # noqa: D102
-        searches: list[SearchModel] = self.search_for_articles()
-        self.parse_articles(searches=searches)
+        # Consumer: the only database writer. It persists each search, then
+        # parses and persists its articles. With several parse processes,
+        # each journal's searches are parsed in batches that are sharded
+        # across the pool
+        batch_size: int = 1
+        if self.processes > 1:
+            batch_size = self.processes * PARSE_BATCH_SIZE
+
+        batches: dict[str, list[tuple[SearchModel, int]]] = {
+            megajournal.name: [] for megajournal in self.megajournals
+        }
+        search_counts: dict[str, int] = dict.fromkeys(batches, 0)
+
+        with (
+            nullcontext()
+            if self.processes == 1
+            else parse_pool(processes=self.processes)
+        ) as executor:
+            try:
+                megajournal: MegaJournal
+                search: SearchModel
+                for megajournal, search in self.search_for_articles():
+                    batch: list[tuple[SearchModel, int]] = batches[megajournal.name]
+                    batch.append((search, self.write_search(search=search)))
+                    search_counts[megajournal.name] += 1
+
+                    if len(batch) >= batch_size:
+                        # Emptied first, so a failed batch is not parsed twice
+                        pending: list[tuple[SearchModel, int]] = batch.copy()
+                        batch.clear()
+                        self.parse_articles(
+                            megajournal=megajournal,
+                            searches=pending,
+                            executor=executor,
+                        )
+            finally:
+                # Written searches of every journal are parsed, even when
+                # another journal failed
+                for megajournal in self.megajournals:
+                    batch = batches.pop(megajournal.name, [])
+                    if len(batch) > 0:
+                        self.parse_articles(
+                            megajournal=megajournal,
+                            searches=batch,
+                            executor=executor,
+                        )
+
+        megajournal_name: str
+        search_count: int
+        for megajournal_name, search_count in search_counts.items():
+            self.logger.info(
+                "Searched %s queries in %s",
+                search_count,
+                megajournal_name,
+            )
 
         return 0
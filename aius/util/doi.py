@@ -0,0 +1,13 @@
+import re
+
+# Resolver URLs and labels that prefix a bare DOI, e.g. `https://doi.org/`
+DOI_PREFIX_PATTERN: re.Pattern = re.compile(
+    pattern=r"^(?:https?://(?:dx\.)?doi\.org/|doi:\s*)",
+    flags=re.IGNORECASE,
+)
+
+
+def normalize_doi(doi: str) -> str:  # noqa: D103
+    # DOIs are case-insensitive; the bare DOI is case-folded, e.g.
+    # `10.1371/journal.pone.0000001`
+    return DOI_PREFIX_PATTERN.sub(repl="", string=doi.strip()).strip().casefold()
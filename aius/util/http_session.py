@@ -1,6 +1,246 @@
-from requests import Response, Session
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from threading import Lock
+from time import monotonic, sleep
+from urllib.parse import urlparse
+
+from requests import PreparedRequest, Response, Session
 from requests.adapters import HTTPAdapter, Retry
 
+from aius.util.response_cache import ResponseCache
+
+# Sustained requests per second allowed to each host. Hosts that are not listed
+# are not rate limited
+DEFAULT_HOST_RATES: dict[str, float] = {
+    "api.openalex.org": 10.0,
+    "f1000research.com": 2.0,
+    "journals.bmj.com": 2.0,
+    "journals.plos.org": 5.0,
+    "www.frontiersin.org": 2.0,
+}
+
+
+class TokenBucket:
+    """Thread-safe token bucket that paces requests to a single host.
+
+    Tokens refill continuously at ``rate`` per second up to ``capacity``. Each
+    request takes one token, blocking until one is available. A server asking
+    clients to back off pauses the bucket for every thread sharing it.
+
+    Attributes:
+        rate (float): Tokens added per second.
+        capacity (float): Maximum number of tokens, i.e. the largest burst.
+    """
+
+    def __init__(self, rate: float, capacity: float | None = None) -> None:
+        """Initialize a full token bucket.
+
+        Args:
+            rate (float): Tokens added per second. Must be positive.
+            capacity (float | None): Maximum burst size. Defaults to one
+                second worth of tokens, and at least one token.
+        """
+        self.rate: float = rate
+        self.capacity: float = max(1.0, rate) if capacity is None else capacity
+
+        self._tokens: float = self.capacity
+        self._updated: float = monotonic()
+        self._lock: Lock = Lock()
+
+    def acquire(self) -> None:
+        """Take one token, sleeping until one is available."""
+        while True:
+            with self._lock:
+                now: float = monotonic()
+
+                # `_updated` lies in the future while the bucket is paused
+                if now >= self._updated:
+                    self._tokens = min(
+                        self.capacity,
+                        self._tokens + (now - self._updated) * self.rate,
+                    )
+                    self._updated = now
+
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+
+                wait: float = (
+                    max(0.0, self._updated - now) + (1 - self._tokens) / self.rate
+                )
+
+            sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        """Hand out no tokens for ``seconds``, then refill from empty.
+
+        Args:
+            seconds (float): Time to wait, e.g. from a ``Retry-After`` header.
+        """
+        with self._lock:
+            self._tokens = 0.0
+            self._updated = max(self._updated, monotonic() + seconds)
+
+
+# Buckets are shared by every session in the process, so concurrent fetchers of
+# the same host draw from one budget
+_TOKEN_BUCKETS: dict[str, TokenBucket] = {}
+_TOKEN_BUCKETS_LOCK: Lock = Lock()
+
+
+def get_token_bucket(host: str, rate: float) -> TokenBucket:
+    """Return the process-wide token bucket of ``host``.
+
+    Args:
+        host (str): Host name, e.g. ``"api.openalex.org"``.
+        rate (float): Requests per second. Updates the rate of an existing
+            bucket.
+
+    Returns:
+        TokenBucket: The bucket shared by all requests to ``host``.
+    """
+    with _TOKEN_BUCKETS_LOCK:
+        bucket: TokenBucket | None = _TOKEN_BUCKETS.get(host)
+
+        if bucket is None:
+            bucket = TokenBucket(rate=rate)
+            _TOKEN_BUCKETS[host] = bucket
+        else:
+            bucket.rate = rate
+
+        return bucket
+
+
+def parse_retry_after(resp: Response, default: float) -> float:
+    """Return the delay requested by the ``Retry-After`` header of ``resp``.
+
+    Args:
+        resp (Response): Response, typically with status code 429.
+        default (float): Delay to use when the header is missing or invalid.
+
+    Returns:
+        float: Seconds to wait before the next request.
+    """
+    retry_after: str | None = resp.headers.get("Retry-After")
+    if retry_after is None:
+        return default
+
+    try:
+        return max(0.0, float(retry_after))
+    except ValueError:
+        pass
+
+    # The header may also be an HTTP date
+    try:
+        retry_at: datetime = parsedate_to_datetime(retry_after)
+    except (TypeError, ValueError):
+        return default
+
+    return max(0.0, (retry_at - datetime.now(tz=timezone.utc)).total_seconds())
+
+
+class RateLimitedSession(Session):
+    """Requests session that paces each host through a shared token bucket.
+
+    Every request, including redirects, waits for a token of its host. A 429
+    response pauses that host's bucket for the ``Retry-After`` delay and is
+    then retried, so all threads slow down together instead of retrying
+    independently. Responses found in ``cache`` skip the network entirely.
+
+    Attributes:
+        host_rates (dict[str, float]): Requests per second of each host.
+        max_retries (int): Maximum number of retries of a 429 response.
+        cache (ResponseCache | None): Optional on-disk response cache.
+    """
+
+    def __init__(
+        self,
+        host_rates: dict[str, float],
+        max_retries: int,
+        cache: ResponseCache | None = None,
+    ) -> None:
+        """Initialize the session.
+
+        Args:
+            host_rates (dict[str, float]): Requests per second of each host.
+            max_retries (int): Maximum number of retries of a 429 response.
+            cache (ResponseCache | None): Optional on-disk response cache.
+        """
+        super().__init__()
+        self.host_rates: dict[str, float] = host_rates
+        self.max_retries: int = max_retries
+        self.cache: ResponseCache | None = cache
+
+    def send(self, request: PreparedRequest, **kwargs) -> Response:  # noqa: ANN003
+        """Send ``request`` once its host has a token, retrying on 429.
+
+        Args:
+            request (PreparedRequest): Request to send.
+            **kwargs: Passed to ``requests.Session.send``.
+
+        Returns:
+            Response: The cached response, the first non-429 response, or the
+                last 429 response once the retries are exhausted.
+        """
+        # Streamed bodies are left to the caller and never cached
+        use_cache: bool = self.cache is not None and not kwargs.get("stream")
+        if use_cache:
+            cached_resp: Response | None = self.cache.get(request=request)
+            if cached_resp is not None:
+                return self._follow_cached_redirects(
+                    resp=cached_resp, request=request, **kwargs
+                )
+
+        host: str = urlparse(url=request.url).hostname or ""
+        rate: float | None = self.host_rates.get(host)
+        bucket: TokenBucket | None = (
+            None if rate is None else get_token_bucket(host=host, rate=rate)
+        )
+
+        attempt: int = 0
+        while True:
+            if bucket is not None:
+                bucket.acquire()
+
+            resp: Response = super().send(request, **kwargs)
+            if resp.status_code != 429 or attempt >= self.max_retries:  # noqa: PLR2004
+                # `request` received the first hop of a redirect chain. Later
+                # hops are sent, and cached, through this method
+                if use_cache:
+                    self.cache.put(
+                        request=request,
+                        resp=resp.history[0] if resp.history else resp,
+                    )
+                return resp
+
+            delay: float = parse_retry_after(resp=resp, default=float(2**attempt))
+            resp.close()
+
+            if bucket is not None:
+                bucket.pause(seconds=delay)
+            else:
+                sleep(delay)
+
+            attempt += 1
+
+    def _follow_cached_redirects(
+        self,
+        resp: Response,
+        request: PreparedRequest,
+        **kwargs,  # noqa: ANN003
+    ) -> Response:
+        # Mirrors `requests.Session.send`, so each hop is looked up in the cache
+        if not resp.is_redirect or not kwargs.pop("allow_redirects", True):
+            return resp
+
+        history: list[Response] = [
+            resp,
+            *self.resolve_redirects(resp, request, **kwargs),
+        ]
+        final_resp: Response = history.pop()
+        final_resp.history = history
+        return final_resp
+
 
 class HTTPSession:
     """HTTP session manager with retry logic for scientific web requests.
@@ -22,11 +262,18 @@ class HTTPSession:
         https://www.nature.com/articles/nature12373
 
     Note:
-        The session automatically retries on HTTP status codes: 403, 429, 500, 502, 503, 504
+        The session automatically retries on HTTP status codes: 403, 500, 502, 503, 504
         with exponential backoff. Only HEAD, GET, OPTIONS, and POST methods are retried.
+        Requests are paced per host by a shared token bucket, and 429 responses
+        pause that host for their ``Retry-After`` delay before being retried.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        pool_maxsize: int = 10,
+        host_rates: dict[str, float] | None = None,
+        cache: ResponseCache | None = None,
+    ) -> None:
         """Initialize HTTP session with retry configuration.
 
         Sets up a requests Session with retry logic for failed HTTP requests.
@@ -36,37 +283,67 @@ class HTTPSession:
         The session is configured with:
         - 3600 second default timeout for HTTP requests
         - Maximum 10 retry attempts with 1-second backoff factor
-        - Retries enabled for status codes: 403, 429, 500, 502, 503, 504
+        - Retries enabled for status codes: 403, 500, 502, 503, 504
+        - Per host rate limits, with 429 responses retried after ``Retry-After``
         - Retries allowed for methods: HEAD, GET, OPTIONS, POST
 
+        Args:
+            pool_maxsize (int): Connections kept open per host. Raise this to
+                the number of threads sharing the session. Defaults to 10.
+            host_rates (dict[str, float] | None): Requests per second of each
+                host, overriding ``DEFAULT_HOST_RATES``.
+            cache (ResponseCache | None): On-disk response cache shared by
+                ``session`` and ``single_attempt_session``.
+
         Returns:
             None
 
         Side Effects:
-            - Sets instance attributes: timeout, max_retries, session
+            - Sets instance attributes: timeout, max_retries, host_rates, session,
+              single_attempt_session
             - Configures HTTPS adapter with retry logic
         """
         self.timeout: int = 3600
         self.max_retries: int = 10
 
-        self.session: Session = Session()
+        self.host_rates: dict[str, float] = {
+            **DEFAULT_HOST_RATES,
+            **({} if host_rates is None else host_rates),
+        }
+
+        # Paced and cached like `session`, but without urllib3 retries
+        self.single_attempt_session: Session = RateLimitedSession(
+            host_rates=self.host_rates,
+            max_retries=0,
+            cache=cache,
+        )
+
+        self.session: Session = RateLimitedSession(
+            host_rates=self.host_rates,
+            max_retries=self.max_retries,
+            cache=cache,
+        )
         self.session.mount(
             "https://",
             HTTPAdapter(
                 max_retries=Retry(
                     total=10,
                     backoff_factor=1,
-                    status_forcelist=[403, 429, 500, 502, 503, 504],
+                    status_forcelist=[403, 500, 502, 503, 504],
                     allowed_methods=["HEAD", "GET", "OPTIONS", "POST"],
                 ),
+                pool_maxsize=max(10, pool_maxsize),
             ),
         )
-        self.session.headers.update(
-            {
-                "User-Agent": "AIUsageInScience/1.5.4",
-                "Accept": "text/html,application/xhtml+xml,application/json,application/xml;q=0.9,*/*;q=0.8",
-            }
-        )
+
+        session: Session
+        for session in (self.session, self.single_attempt_session):
+            session.headers.update(
+                {
+                    "User-Agent": "AIUsageInScience/1.5.4",
+                    "Accept": "text/html,application/xhtml+xml,application/json,application/xml;q=0.9,*/*;q=0.8",
+                }
+            )
 
     def resolve_doi(self, doi_id: str) -> str:
         """Resolve a Digital Object Identifier (DOI) to its target URL.
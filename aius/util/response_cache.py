@@ -0,0 +1,208 @@
+from hashlib import sha256
+from json import dumps, loads
+from logging import Logger, getLogger
+from pathlib import Path
+from threading import Lock
+from time import time
+
+from requests import PreparedRequest, Response
+from requests.exceptions import RequestException
+from requests.structures import CaseInsensitiveDict
+
+DEFAULT_HTTP_CACHE_PATH: Path = Path("aius_http_cache").resolve()
+
+# Cached responses older than this are fetched again, unless replaying
+DEFAULT_HTTP_CACHE_TTL_SECONDS: float = 30 * 24 * 60 * 60
+
+# The least recently written responses are evicted beyond this size
+DEFAULT_HTTP_CACHE_MAX_BYTES: int = 20 * 1024**3
+
+
+class ReplayCacheMissError(RequestException):
+    """Raised in replay mode for a request that has no cached response."""
+
+
+class ResponseCache:
+    """Content-addressed on-disk cache of HTTP responses.
+
+    Responses are stored under the SHA-256 of the request method, URL, and body
+    hash, so POST searches with different bodies are cached separately. Each
+    entry is one line of JSON metadata (status, reason, headers, and URL)
+    followed by the raw response body. Only
+    successful (200) responses and redirects are written; each redirect hop is
+    stored under the request that received it. Entries expire after ``ttl``
+    seconds, and the oldest entries are evicted once the cache grows beyond
+    ``max_bytes``.
+
+    In replay mode the cache never touches the network: every cached entry is
+    served regardless of age, and a miss raises ``ReplayCacheMissError`` rather
+    than producing a response that could be stored as a real one.
+
+    Attributes:
+        cache_dir (Path): Directory holding one file per cached response.
+        ttl (float): Seconds a cached response stays fresh.
+        max_bytes (int): Maximum total size of the cached responses.
+        replay (bool): Serve only from the cache.
+
+    Example:
+        >>> cache = ResponseCache(cache_dir=Path("aius_http_cache"))
+        >>> session = HTTPSession(cache=cache).session
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path = DEFAULT_HTTP_CACHE_PATH,
+        ttl: float = DEFAULT_HTTP_CACHE_TTL_SECONDS,
+        max_bytes: int = DEFAULT_HTTP_CACHE_MAX_BYTES,
+        replay: bool = False,  # noqa: FBT001, FBT002
+        logger: Logger | None = None,
+    ) -> None:
+        """Open, and create if needed, the cache directory.
+
+        Args:
+            cache_dir (Path): Directory holding the cached responses.
+            ttl (float): Seconds a cached response stays fresh.
+            max_bytes (int): Maximum total size of the cached responses.
+            replay (bool): Serve only from the cache and never from the network.
+            logger (Logger | None): Logger for cache hits, misses, and evictions.
+        """
+        self.cache_dir: Path = cache_dir
+        self.ttl: float = ttl
+        self.max_bytes: int = max_bytes
+        self.replay: bool = replay
+        self.logger: Logger = getLogger() if logger is None else logger
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        self._lock: Lock = Lock()
+        self._size: int = sum(fp.stat().st_size for fp in self._entries())
+
+    def _entries(self) -> list[Path]:
+        return list(self.cache_dir.glob(pattern="*.response"))
+
+    @staticmethod
+    def key(request: PreparedRequest) -> str:
+        """Return the cache key of ``request``.
+
+        Args:
+            request (PreparedRequest): Request to address.
+
+        Returns:
+            str: Hex SHA-256 of the method, URL, and body hash.
+        """
+        body: bytes | str | None = request.body
+        if isinstance(body, str):
+            body = body.encode(encoding="UTF-8")
+
+        body_hash: str = sha256(body or b"").hexdigest()
+
+        return sha256(
+            f"{request.method}\n{request.url}\n{body_hash}".encode()
+        ).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.response"
+
+    def get(self, request: PreparedRequest) -> Response | None:
+        """Return the cached response of ``request``, if it is fresh.
+
+        Args:
+            request (PreparedRequest): Request to look up.
+
+        Returns:
+            Response | None: The cached response, or None when the request
+                should go to the network.
+
+        Raises:
+            ReplayCacheMissError: In replay mode, when ``request`` is not cached.
+        """
+        path: Path = self._path(key=self.key(request=request))
+
+        try:
+            age: float = time() - path.stat().st_mtime
+            if self.replay or age <= self.ttl:
+                return self._to_response(data=path.read_bytes(), request=request)
+        except (FileNotFoundError, KeyError, ValueError):
+            pass
+
+        if self.replay:
+            self.logger.warning("Replay cache miss: %s %s", request.method, request.url)
+            msg: str = f"Replay cache miss: {request.method} {request.url}"
+            raise ReplayCacheMissError(msg, request=request)
+
+        return None
+
+    def put(self, request: PreparedRequest, resp: Response) -> None:
+        """Cache ``resp`` as the response of ``request`` if it succeeded or redirected.
+
+        Args:
+            request (PreparedRequest): Request that produced ``resp``.
+            resp (Response): Response to store. Its content is read.
+        """
+        if resp.status_code != 200 and not resp.is_redirect:  # noqa: PLR2004
+            return
+
+        metadata: str = dumps(
+            obj={
+                "status_code": resp.status_code,
+                "reason": resp.reason,
+                "headers": dict(resp.headers),
+                "url": resp.url,
+            }
+        )
+        data: bytes = metadata.encode(encoding="UTF-8") + b"\n" + resp.content
+
+        path: Path = self._path(key=self.key(request=request))
+
+        # Write to a temporary file first so readers never see partial entries
+        tmp_path: Path = path.with_suffix(f".{id(data)}.tmp")
+        tmp_path.write_bytes(data)
+
+        with self._lock:
+            previous_size: int = path.stat().st_size if path.exists() else 0
+            tmp_path.replace(path)
+            self._size += len(data) - previous_size
+
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def _evict(self) -> None:
+        # Oldest entries first, until the cache is back under 90% of its limit
+        target: int = int(self.max_bytes * 0.9)
+
+        entries: list[tuple[float, int, Path]] = []
+
+        path: Path
+        for path in self._entries():
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        evicted: int = 0
+        for _, size, path in sorted(entries):
+            if self._size <= target:
+                break
+
+            path.unlink(missing_ok=True)
+            self._size -= size
+            evicted += 1
+
+        self.logger.info("Evicted %s responses from the HTTP cache", evicted)
+
+    @staticmethod
+    def _to_response(data: bytes, request: PreparedRequest) -> Response:
+        # The JSON metadata line never contains a raw newline; the body follows
+        metadata_line, content = data.split(sep=b"\n", maxsplit=1)
+        metadata: dict = loads(s=metadata_line)
+
+        resp: Response = Response()
+        resp.status_code = metadata["status_code"]
+        resp.reason = metadata["reason"]
+        resp.headers = CaseInsensitiveDict(data=metadata["headers"])
+        resp.url = metadata["url"]
+        resp.request = request
+        resp._content = content
+        resp._content_consumed = True
+        return resp
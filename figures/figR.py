@@ -1,5 +1,4 @@
 import textwrap
-from json import loads
 from pathlib import Path
 
 import click
@@ -38,7 +37,7 @@ def get_papers_per_journal(db: Engine) -> DataFrame:
 def get_papers(db: Engine) -> DataFrame:
     sql: str = """
 SELECT
-    udl.doi, oa.topic_0, oa.topic_1, oa.topic_2, oa.json_data
+    udl.doi, oa.topic_0, oa.topic_1, oa.topic_2, oa.publication_year
 FROM
     uses_dl_analysis udl
 JOIN
@@ -59,10 +58,9 @@ def create_data(df: DataFrame) -> DataFrame:
             str(row["topic_1"]),
             str(row["topic_2"]),
         ]
-        json: dict = loads(str(row["json_data"]))
         for topic in topics:
-            if json["publication_year"] > 2016:
-                data["year"].append(json["publication_year"])
+            if row["publication_year"] > 2016:
+                data["year"].append(row["publication_year"])
                 data["field"].append(topic)
 
     data_df = DataFrame(data=data)
@@ -144,9 +144,7 @@ def load_model_responses(db_path: Path) -> DataFrame:
     query = f"""
         SELECT
   oa.doi,
-  json_extract(
-    oa.json_data, '$.publication_year'
-  ) AS publication_year,
+  oa.publication_year,
   reuse.model_response
 FROM
   openalex oa
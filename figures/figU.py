@@ -115,9 +115,7 @@ def load_model_responses(db_path: Path) -> DataFrame:
     query = f"""
 SELECT
 	oa.doi,
-	json_extract(
-		oa.json_data, '$.publication_year'
-	) AS publication_year,
+	oa.publication_year,
 	impact.model_response
 FROM
 	openalex oa
@@ -25,7 +25,7 @@ def load_dl_rows(db: Engine) -> DataFrame:
     sql: str = """
 SELECT
     udl.doi,
-    CAST(json_extract(oa.json_data, '$.publication_year') AS INTEGER) AS publication_year,
+    oa.publication_year,
     udl.model_response
 FROM
     uses_dl_analysis udl
@@ -45,7 +45,7 @@ def load_ptm_reuse_rows(db: Engine) -> DataFrame:
     sql: str = """
 SELECT
     reuse.doi,
-    CAST(json_extract(oa.json_data, '$.publication_year') AS INTEGER) AS publication_year,
+    oa.publication_year,
     reuse.model_response
 FROM
     identify_ptm_reuse_analysis reuse
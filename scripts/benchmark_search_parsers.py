@@ -0,0 +1,124 @@
+"""
+Benchmark the lxml search result parsers against the BeautifulSoup parsers.
+
+Recorded BMJ and F1000 search pages are read from the `searches` table, each
+page is parsed with both implementations, and the outputs are checked to be
+identical before the timings are printed.
+"""
+
+from __future__ import annotations
+
+import argparse
+from collections.abc import Callable
+from json import loads
+from logging import Logger, getLogger
+from pathlib import Path
+from time import perf_counter
+
+from aius.db import DB
+from aius.megajournals.parsers import (
+    bmj_articles,
+    bmj_articles_soup,
+    bmj_document_count,
+    bmj_document_count_soup,
+    f1000_dois,
+    f1000_dois_soup,
+    f1000_total_number_of_pages,
+    f1000_total_number_of_pages_soup,
+)
+
+# megajournal -> (json_data key, [(name, lxml parser, BeautifulSoup parser)])
+PARSERS: dict[str, tuple[str, list[tuple[str, Callable, Callable]]]] = {
+    "BMJ": (
+        "html",
+        [
+            ("articles", bmj_articles, bmj_articles_soup),
+            ("page count", bmj_document_count, bmj_document_count_soup),
+        ],
+    ),
+    "F1000": (
+        "xml",
+        [
+            ("articles", f1000_dois, f1000_dois_soup),
+            (
+                "page count",
+                f1000_total_number_of_pages,
+                f1000_total_number_of_pages_soup,
+            ),
+        ],
+    ),
+}
+
+
+def load_pages(db: DB, megajournal: str, key: str, limit: int) -> list[str]:
+    pages: list[str] = []
+
+    for df in db.iter_table(
+        table_name="searches",
+        columns=["json_data"],
+        where="megajournal = :megajournal AND status_code = 200",
+        parameters={"megajournal": megajournal},
+    ):
+        for json_data in df["json_data"]:
+            pages.append(loads(s=json_data)[key])
+
+            if len(pages) >= limit:
+                return pages
+
+    return pages
+
+
+def time_parser(parser: Callable, pages: list[str], repeat: int) -> float:
+    best: float = float("inf")
+
+    for _ in range(repeat):
+        start: float = perf_counter()
+        for page in pages:
+            parser(markup=page)
+        best = min(best, perf_counter() - start)
+
+    return best
+
+
+def benchmark(db_path: Path, limit: int, repeat: int) -> None:
+    logger: Logger = getLogger(name="benchmark_search_parsers")
+    db: DB = DB(logger=logger, db_path=db_path, profile="readonly")
+
+    for megajournal, (key, parsers) in PARSERS.items():
+        pages: list[str] = load_pages(
+            db=db,
+            megajournal=megajournal,
+            key=key,
+            limit=limit,
+        )
+
+        if len(pages) == 0:
+            print(f"{megajournal}: no recorded search pages")
+            continue
+
+        for name, fast_parser, soup_parser in parsers:
+            mismatches: int = sum(
+                fast_parser(markup=page) != soup_parser(markup=page) for page in pages
+            )
+
+            fast: float = time_parser(parser=fast_parser, pages=pages, repeat=repeat)
+            soup: float = time_parser(parser=soup_parser, pages=pages, repeat=repeat)
+
+            print(
+                f"{megajournal} {name} ({len(pages)} pages): "
+                f"lxml {fast:.3f}s, BeautifulSoup {soup:.3f}s, "
+                f"{soup / fast:.1f}x faster, {mismatches} mismatches"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("db_path", type=Path)
+    parser.add_argument("--limit", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    benchmark(db_path=args.db_path.resolve(), limit=args.limit, repeat=args.repeat)
+
+
+if __name__ == "__main__":
+    main()
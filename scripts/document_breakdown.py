@@ -7,7 +7,7 @@ from pandas import DataFrame
 
 from aius.db import DB
 
-TABLE: str = "uses_ptms_analysis"
+TABLE: str = "uses_ptms_analysis_text"
 
 
 def set_dataframe_formatting(df: DataFrame) -> DataFrame:
@@ -30,8 +30,8 @@ def main() -> None:
     db: DB = DB(logger=logger, db_path=db_path)
 
     sql: str = f"""
-SELECT {TABLE}.*, articles.megajournal FROM {TABLE}
-JOIN articles ON articles.doi = {TABLE}.doi;
+SELECT {TABLE}.*, documents.megajournal FROM {TABLE}
+JOIN documents ON documents.doi = {TABLE}.doi;
 """
 
     df: DataFrame = pd.read_sql(sql=sql, con=db.engine, index_col="_id")
@@ -7,7 +7,7 @@ import click
 import pandas as pd
 from pandas import DataFrame
 
-from aius.db import DB
+from aius.db import ANALYSIS_TABLES, DB
 
 
 def get_parquet_files(parquet_dir: Path) -> list[Path]:
@@ -19,6 +19,24 @@ def get_dataframes(parquet_files: list[Path]) -> list[DataFrame]:
     return [pd.read_parquet(path=file) for file in parquet_files]
 
 
+def link_prompt_text(db: DB, db_table: str, df: DataFrame) -> DataFrame:
+    # Older parquet files copy the prompt texts into every row
+    if "user_prompt" not in df.columns:
+        return df
+
+    markdown_ids: DataFrame = pd.read_sql(
+        sql="SELECT doi, MIN(_id) AS markdown_id FROM markdown GROUP BY doi;",
+        con=db.engine,
+    )
+
+    df = df.drop(
+        columns=["system_prompt", "user_prompt", "markdown_id"], errors="ignore"
+    )
+    df = df.merge(right=markdown_ids, how="left", on="doi")
+    df["llm_prompt_id"] = db.get_llm_prompt_id(tag=ANALYSIS_TABLES[db_table])
+    return df
+
+
 @click.command()
 @click.option(
     "--parquet-dir",
@@ -46,6 +64,9 @@ def main(parquet_dir: Path, db_path: Path, db_table: str) -> None:
     dfs: list[DataFrame] = get_dataframes(parquet_files=parquet_files)
     df: DataFrame = pd.concat(objs=dfs, ignore_index=True)
 
+    if db_table in ANALYSIS_TABLES:
+        df = link_prompt_text(db=db, db_table=db_table, df=df)
+
     db.write_dataframe_to_table(table_name=db_table, df=df)
 
 
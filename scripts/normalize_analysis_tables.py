@@ -0,0 +1,40 @@
+"""
+One-time migration for the LLM analysis tables.
+
+Replaces the `system_prompt` and `user_prompt` text copied into every analysis
+row with `llm_prompt_id` and `markdown_id` references. Tables with rows that
+cannot be linked keep their text columns.
+"""
+
+from __future__ import annotations
+
+import argparse
+from logging import Logger, getLogger
+from pathlib import Path
+
+from sqlalchemy import text
+
+from aius.db import DB
+
+
+def migrate(db_path: Path, vacuum: bool = False) -> None:
+    logger: Logger = getLogger(name="normalize_analysis_tables")
+    db: DB = DB(logger=logger, db_path=db_path)
+    db.normalize_analysis_tables()
+
+    # Dropped columns only give their pages back to the file on VACUUM
+    if vacuum:
+        with db.engine.connect() as conn:
+            conn.execute(statement=text("VACUUM;"))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("db_path", type=Path)
+    parser.add_argument("--vacuum", action="store_true")
+    args = parser.parse_args()
+    migrate(db_path=args.db_path.resolve(), vacuum=args.vacuum)
+
+
+if __name__ == "__main__":
+    main()
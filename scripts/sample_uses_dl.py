@@ -1,10 +1,13 @@
 import base64
 import gzip
-import sqlite3
+from logging import getLogger
+from pathlib import Path
 
 import click
 import pandas as pd
 
+from aius.db import DB
+
 
 def compress_string(text):
     """Compresses a string using GZIP and encodes it in Base64."""
@@ -25,11 +28,11 @@ def sample_and_compress(db_path, table, fraction, output):
     """Samples a SQLite table and GZIP compresses the 'markdown' column."""
 
     try:
-        conn = sqlite3.connect(db_path)
+        db = DB(logger=getLogger(), db_path=Path(db_path), profile="readonly")
 
         click.echo(f"Loading data from {table}...")
-        # We only pull the 'markdown' column to save memory, or use SELECT *
-        df = pd.read_sql_query(f"SELECT * FROM {table}", conn)
+        # Read through `DB` so that compressed markdown is decoded
+        df = pd.concat(objs=db.iter_query(sql=f"SELECT * FROM {table};"))
 
         if "markdown" not in df.columns:
             click.secho("Error: Column 'markdown' not found in table.", fg="red")
@@ -51,8 +54,6 @@ def sample_and_compress(db_path, table, fraction, output):
 
     except Exception as e:
         click.secho(f"An error occurred: {e}", fg="red")
-    finally:
-        conn.close()
 
 
 if __name__ == "__main__":
@@ -16,20 +16,20 @@ def query_database(db_path: Path) -> pd.DataFrame:
 
     conn = sqlite3.connect(db_uri, uri=True)
 
-    # 2. SQL Query extracting year from JSON and filtering via the View
+    # 2. SQL Query reading the indexed year and filtering via the View
     query = """
         SELECT
             ns.doi,
-            a.megajournal,
-            CAST(json_extract(oa.json_data, '$.publication_year') AS INTEGER) as year
+            d.megajournal,
+            oa.publication_year as year
         FROM
             natural_science_article_dois ns
         JOIN
-            articles a ON ns.doi = a.doi
+            documents d ON ns.doi = d.doi
         JOIN
             openalex oa ON ns.doi = oa.doi
         WHERE
-            oa.json_data IS NOT NULL
+            oa.publication_year IS NOT NULL
     """
 
     logger.info("Reading Natural Science DOIs and extracting years...")
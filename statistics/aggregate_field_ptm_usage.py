@@ -1,9 +1,12 @@
 from json import loads
+from logging import Logger
 from pathlib import Path
 
 import pandas as pd
 from pandas import DataFrame, Series
-from sqlalchemy import Engine, create_engine
+from sqlalchemy import Engine
+
+from aius.db import DB
 
 DB_PATH: Path = Path("../data/aius_12-17-2025.db").resolve()
 FIELD: list[str] = [
@@ -37,7 +40,7 @@ def get_natural_science_papers_per_journal(db: Engine) -> DataFrame:
 SELECT
     upl.*, oa.topic_0, oa.topic_1, oa.topic_2
 FROM
-    uses_ptms_analysis upl
+    uses_ptms_analysis_text upl
 JOIN
     openalex oa
 ON
@@ -63,9 +66,9 @@ def create_data(df: DataFrame) -> Series:
 
 
 def main() -> None:
-    db: Engine = create_engine(url=f"sqlite:///{DB_PATH}")
+    db: DB = DB(logger=Logger(name=""), db_path=DB_PATH, profile="readonly")
 
-    papers: DataFrame = get_natural_science_papers_per_journal(db=db)
+    papers: DataFrame = get_natural_science_papers_per_journal(db=db.engine)
     papers = set_dataframe_formatting(df=papers)
 
     data: Series = create_data(df=papers)
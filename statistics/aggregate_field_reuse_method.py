@@ -1,10 +1,13 @@
 import warnings
 from json import loads
+from logging import Logger
 from pathlib import Path
 
 import pandas as pd
 from pandas import DataFrame, Series
-from sqlalchemy import Engine, create_engine
+from sqlalchemy import Engine
+
+from aius.db import DB
 
 warnings.filterwarnings("ignore")
 
@@ -35,7 +38,7 @@ def set_dataframe_formatting(df: DataFrame) -> DataFrame:
 
 
 def get_natural_science_papers_per_journal(db: Engine) -> DataFrame:
-    sql: str = "SELECT * FROM identify_ptm_reuse_analysis;"
+    sql: str = "SELECT * FROM identify_ptm_reuse_analysis_text;"
     return pd.read_sql(sql=sql, con=db)
 
 
@@ -85,9 +88,9 @@ def create_data(df: DataFrame) -> Series:
 
 
 def main() -> None:
-    db: Engine = create_engine(url=f"sqlite:///{DB_PATH}")
+    db: DB = DB(logger=Logger(name=""), db_path=DB_PATH, profile="readonly")
 
-    papers: DataFrame = get_natural_science_papers_per_journal(db=db)
+    papers: DataFrame = get_natural_science_papers_per_journal(db=db.engine)
     papers = set_dataframe_formatting(df=papers)
 
     data: Series = create_data(df=papers)
@@ -1,11 +1,13 @@
 from json import loads
+from logging import Logger
 from pathlib import Path
 
-import pandas as pd
 from pandas import DataFrame, Series
-from sqlalchemy import Engine, create_engine
+
+from aius.db import DB
 
 DB_PATH: Path = Path("../data/aius_12-17-2025.db").resolve()
+EXPORT_PATH: Path = Path("../data/aius_12-17-2025_parquet").resolve()
 FIELD: list[str] = [
     "Agricultural and Biological Sciences",
     "Biochemistry, Genetics and Molecular Biology",
@@ -33,12 +35,13 @@ def set_dataframe_formatting(df: DataFrame) -> DataFrame:
     return df
 
 
-def get_natural_science_papers_per_journal(db: Engine) -> DataFrame:
-    sql: str = """
-SELECT upl.*, oa.json_data FROM uses_ptms_analysis upl
-JOIN openalex oa on oa.doi = upl.doi;
-"""
-    return pd.read_sql(sql=sql, con=db)
+def get_natural_science_papers_per_journal(db: DB) -> DataFrame:
+    # Read only the needed columns of the `aius export` dataset
+    return db.read_arrow(
+        table_name="uses_ptms_analysis",
+        columns=["doi", "model_response", "publication_year"],
+        dataset_path=EXPORT_PATH,
+    ).to_pandas()
 
 
 def create_data(df: DataFrame) -> Series:
@@ -48,14 +51,13 @@ def create_data(df: DataFrame) -> Series:
 
     row: Series
     for _, row in df.iterrows():
-        json: dict = loads(s=row["json_data"])
-        data["year"].append(json["publication_year"])
+        data["year"].append(row["publication_year"])
 
     return DataFrame(data=data)["year"].value_counts()
 
 
 def main() -> None:
-    db: Engine = create_engine(url=f"sqlite:///{DB_PATH}")
+    db: DB = DB(logger=Logger(name=""), db_path=DB_PATH, profile="readonly")
 
     papers: DataFrame = get_natural_science_papers_per_journal(db=db)
     papers = set_dataframe_formatting(df=papers)
@@ -0,0 +1,67 @@
+from logging import getLogger
+from pathlib import Path
+
+from pandas import DataFrame
+
+from aius.analyze.runner import AnalysisRunner
+from aius.db import DB
+
+
+def _runner(db: DB, system_prompt_id: str) -> AnalysisRunner:
+    db.bulk_insert(
+        table_name="_llm_prompts",
+        rows=DataFrame(data=[{"tag": system_prompt_id, "prompt": "prompt"}]),
+    )
+    return AnalysisRunner(
+        db=db,
+        logger=getLogger(),
+        index=0,
+        model_name="model",
+        stride=1,
+        system_prompt_id=system_prompt_id,
+        auth_key="test-key",
+        backend="openai",
+    )
+
+
+def test_analysis_runner_skips_all_empty_response_chunks(tmp_path: Path) -> None:
+    db = DB(logger=getLogger(), db_path=tmp_path / "aius.sqlite3")
+    db.bulk_insert(
+        table_name="uses_dl_analysis",
+        rows=DataFrame(
+            data=[
+                {"doi": "10.1/a", "markdown_id": 1, "model_response": ""},
+                {"doi": "10.1/b", "markdown_id": 2, "model_response": ""},
+            ]
+        ),
+    )
+
+    runner = _runner(db=db, system_prompt_id="uses_ptms")
+
+    assert list(runner._iter_rows()) == []
+
+
+def test_analysis_runner_keeps_positive_responses(tmp_path: Path) -> None:
+    db = DB(logger=getLogger(), db_path=tmp_path / "aius.sqlite3")
+    db.bulk_insert(
+        table_name="uses_dl_analysis",
+        rows=DataFrame(
+            data=[
+                {"doi": "10.1/a", "markdown_id": 1, "model_response": ""},
+                {
+                    "doi": "10.1/b",
+                    "markdown_id": 2,
+                    "model_response": '{"result": true}',
+                },
+                {
+                    "doi": "10.1/c",
+                    "markdown_id": 3,
+                    "model_response": '{"result": false}',
+                },
+            ]
+        ),
+    )
+
+    runner = _runner(db=db, system_prompt_id="uses_ptms")
+
+    assert [row["doi"] for row in runner._iter_rows()] == ["10.1/b"]
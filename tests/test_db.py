@@ -0,0 +1,479 @@
+import sqlite3
+from importlib.util import module_from_spec, spec_from_file_location
+from json import dumps
+from logging import getLogger
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from pandas import DataFrame
+
+from aius.db import DB, ColumnCodec
+from aius.megajournals.models import ArticleModel
+from aius.openalex import MetadataModel, TopicModel
+
+
+def _index_names(db_path: Path) -> set[str]:
+    with sqlite3.connect(db_path) as conn:
+        rows = conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index';"
+        ).fetchall()
+    return {row[0] for row in rows}
+
+
+def test_db_creates_doi_indexes(tmp_path: Path) -> None:
+    db_path = tmp_path / "aius.sqlite3"
+    DB(logger=getLogger(), db_path=db_path)
+
+    indexes = _index_names(db_path=db_path)
+
+    assert "ix_articles_doi" in indexes
+    assert "ix_articles_search_id" in indexes
+    assert "ix_openalex_topic_0" in indexes
+    assert "ix_uses_dl_analysis_doi" in indexes
+
+
+def test_ensure_indexes_upgrades_existing_database(tmp_path: Path) -> None:
+    db_path = tmp_path / "aius.sqlite3"
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            "CREATE TABLE jats (_id INTEGER PRIMARY KEY, doi TEXT, jats_xml TEXT);"
+        )
+
+    assert "ix_jats_doi" not in _index_names(db_path=db_path)
+
+    DB(logger=getLogger(), db_path=db_path)
+
+    assert "ix_jats_doi" in _index_names(db_path=db_path)
+
+
+def _natural_science_dois(db: DB) -> list[str]:
+    with sqlite3.connect(db.engine.url.database) as conn:
+        rows = conn.execute(
+            "SELECT doi FROM natural_science_article_dois ORDER BY doi;"
+        ).fetchall()
+    return [row[0] for row in rows]
+
+
+def test_natural_science_articles_refresh_incrementally(tmp_path: Path) -> None:
+    db = DB(logger=getLogger(), db_path=tmp_path / "aius.sqlite3")
+    with sqlite3.connect(db.engine.url.database) as conn:
+        conn.execute(
+            "INSERT INTO _openalex_natural_science_fields (openalex_id, field) "
+            "VALUES (16, 'Chemistry');"
+        )
+        conn.execute(
+            "INSERT INTO openalex (doi, cited_by_count) VALUES "
+            "('10.1/a', 1), ('10.1/b', 1), ('10.1/c', 0), ('10.1/e', 2);"
+        )
+        # Only the first three topics count; `10.1/e` matches at rank 3
+        conn.execute(
+            "INSERT INTO openalex_topics (openalex_id, doi, rank, field_id) VALUES "
+            "(1, '10.1/a', 0, 16), (2, '10.1/b', 0, 27), (2, '10.1/b', 1, 31), "
+            "(3, '10.1/c', 0, 16), (4, '10.1/e', 0, 27), (4, '10.1/e', 1, 27), "
+            "(4, '10.1/e', 2, 27), (4, '10.1/e', 3, 16);"
+        )
+
+    db.refresh_natural_science_articles()
+    assert _natural_science_dois(db=db) == ["10.1/a"]
+
+    with sqlite3.connect(db.engine.url.database) as conn:
+        conn.execute("INSERT INTO openalex (doi, cited_by_count) VALUES ('10.1/d', 3);")
+        conn.execute(
+            "INSERT INTO openalex_topics (openalex_id, doi, rank, field_id) "
+            "VALUES (5, '10.1/d', 2, 16);"
+        )
+        conn.execute(
+            "INSERT INTO _openalex_natural_science_fields (openalex_id, field) "
+            "VALUES (31, 'Physics and Astronomy');"
+        )
+
+    db.refresh_natural_science_articles()
+    assert _natural_science_dois(db=db) == ["10.1/a", "10.1/b", "10.1/d"]
+
+    with sqlite3.connect(db.engine.url.database) as conn:
+        conn.execute("DELETE FROM _openalex_natural_science_fields WHERE _id = 1;")
+
+    db.refresh_natural_science_articles()
+    assert _natural_science_dois(db=db) == ["10.1/b"]
+
+
+def test_upsert_openalex_reevaluates_reused_ids(tmp_path: Path) -> None:
+    db = DB(logger=getLogger(), db_path=tmp_path / "aius.sqlite3")
+    with sqlite3.connect(db.engine.url.database) as conn:
+        conn.execute(
+            "INSERT INTO _openalex_natural_science_fields (openalex_id, field) "
+            "VALUES (16, 'Chemistry');"
+        )
+
+    def upsert(dois: list[str]) -> None:
+        db.upsert_openalex(
+            rows=[
+                MetadataModel(
+                    timestamp=0.0,
+                    doi=doi,
+                    cited_by_count=1,
+                    open_access=True,
+                    topic_0="Chemistry",
+                    topic_1=None,
+                    topic_2=None,
+                    json_data={},
+                )
+                for doi in dois
+            ],
+            topics=[
+                [TopicModel(doi=doi, rank=0, field_id=16, field_name="Chemistry")]
+                for doi in dois
+            ],
+        )
+        db.refresh_natural_science_articles()
+
+    upsert(dois=["10.1/a", "10.1/b"])
+    assert _natural_science_dois(db=db) == ["10.1/a", "10.1/b"]
+
+    # `10.1/b` holds the largest `_id`, which SQLite hands out again
+    upsert(dois=["10.1/b"])
+    assert _natural_science_dois(db=db) == ["10.1/a", "10.1/b"]
+
+
+def test_db_backfills_openalex_columns_once(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # A database written before the `publication_year` and `type` columns
+    db_path = tmp_path / "aius.sqlite3"
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            "CREATE TABLE openalex (_id INTEGER PRIMARY KEY, timestamp DATETIME, "
+            "doi VARCHAR, cited_by_count INTEGER, open_access BOOLEAN, "
+            "topic_0 VARCHAR, topic_1 VARCHAR, topic_2 VARCHAR, json_data VARCHAR);"
+        )
+        conn.executemany(
+            "INSERT INTO openalex (doi, json_data) VALUES (?, ?);",
+            [
+                ("10.1/a", dumps(obj={"publication_year": 2018, "type": "article"})),
+                ("10.1/b", dumps(obj={"publication_year": 2019, "type": None})),
+            ],
+        )
+
+    DB(logger=getLogger(), db_path=db_path)
+
+    with sqlite3.connect(db_path) as conn:
+        rows = conn.execute(
+            "SELECT doi, publication_year, type FROM openalex ORDER BY doi;"
+        ).fetchall()
+
+    assert rows == [("10.1/a", 2018, "article"), ("10.1/b", 2019, None)]
+
+    # The null `type` of `10.1/b` is not decoded again on the next connection
+    updated_rows: list[list[dict]] = []
+    monkeypatch.setattr(
+        DB,
+        "update_rows",
+        lambda self, table_name, rows: updated_rows.append(rows),
+    )
+    DB(logger=getLogger(), db_path=db_path)
+
+    assert updated_rows == []
+
+
+def test_db_profiles_apply_pragmas(tmp_path: Path) -> None:
+    db_path = tmp_path / "aius.sqlite3"
+    db = DB(logger=getLogger(), db_path=db_path, profile="fast")
+
+    with db.engine.connect() as conn:
+        assert conn.exec_driver_sql("PRAGMA journal_mode;").scalar() == "wal"
+        assert conn.exec_driver_sql("PRAGMA synchronous;").scalar() == 1
+        assert conn.exec_driver_sql("PRAGMA temp_store;").scalar() == 2
+
+    readonly_db = DB(logger=getLogger(), db_path=db_path, profile="readonly")
+
+    with readonly_db.engine.connect() as conn:
+        assert conn.exec_driver_sql("PRAGMA query_only;").scalar() == 1
+
+
+def test_iter_table_streams_chunks(tmp_path: Path) -> None:
+    db = DB(logger=getLogger(), db_path=tmp_path / "aius.sqlite3")
+    with sqlite3.connect(db.engine.url.database) as conn:
+        conn.executemany(
+            "INSERT INTO markdown (doi, markdown) VALUES (?, ?);",
+            [(f"10.1/{i}", f"# Paper {i}") for i in range(25)],
+        )
+
+    chunks = list(
+        db.iter_table(
+            table_name="markdown",
+            columns=["doi"],
+            where="markdown LIKE :pattern",
+            parameters={"pattern": "# Paper 1%"},
+            chunksize=4,
+        )
+    )
+
+    assert [len(chunk) for chunk in chunks] == [4, 4, 3]
+    assert chunks[0].columns.tolist() == ["doi"]
+
+
+def test_bulk_insert_accepts_models_and_dataframes(tmp_path: Path) -> None:
+    db = DB(logger=getLogger(), db_path=tmp_path / "aius.sqlite3")
+
+    articles = (
+        ArticleModel(
+            doi=f"10.1/{i}",
+            title="",
+            megajournal="PLOS",
+            journal="PLOS ONE",
+            search_id=1,
+        )
+        for i in range(5)
+    )
+    assert db.bulk_insert(table_name="articles", rows=articles, batch_size=2) == [
+        1,
+        2,
+        3,
+        4,
+        5,
+    ]
+
+    df = DataFrame(data={"doi": ["10.1/5", "10.1/6"], "title": ["A", None]})
+    assert db.bulk_insert(table_name="articles", rows=df) == [6, 7]
+
+    with sqlite3.connect(db.engine.url.database) as conn:
+        rows = conn.execute("SELECT doi, title FROM articles ORDER BY _id;").fetchall()
+
+    assert len(rows) == 7
+    assert rows[-1] == ("10.1/6", None)
+
+
+def test_column_codec_round_trips_and_recompresses(tmp_path: Path) -> None:
+    db_path = tmp_path / "aius.sqlite3"
+    db = DB(logger=getLogger(), db_path=db_path, codec="zlib")
+
+    markdown = DataFrame(data={"doi": ["10.1/a"], "markdown": ["# Title\n" * 100]})
+    db.write_dataframe_to_table(table_name="markdown", df=markdown)
+
+    with sqlite3.connect(db_path) as conn:
+        stored = conn.execute("SELECT markdown FROM markdown;").fetchone()[0]
+
+    assert stored.startswith(ColumnCodec.TAGS["zlib"])
+    assert next(db.iter_table(table_name="markdown"))["markdown"].tolist() == [
+        "# Title\n" * 100
+    ]
+
+    DB(logger=getLogger(), db_path=db_path, codec="none").recompress()
+
+    with sqlite3.connect(db_path) as conn:
+        stored = conn.execute("SELECT markdown FROM markdown;").fetchone()[0]
+
+    assert stored == "# Title\n" * 100
+
+
+def test_normalize_analysis_tables_links_prompt_text(tmp_path: Path) -> None:
+    db_path = tmp_path / "aius.sqlite3"
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            "CREATE TABLE uses_dl_analysis (_id INTEGER PRIMARY KEY, doi TEXT, "
+            "system_prompt TEXT, user_prompt TEXT, model_response TEXT, "
+            "model_reasoning TEXT, compute_time_seconds FLOAT);"
+        )
+        conn.execute(
+            "INSERT INTO uses_dl_analysis (doi, system_prompt, user_prompt, "
+            "model_response) VALUES ('10.1/a', 'Prompt', '# Paper', '{}');"
+        )
+
+    db = DB(logger=getLogger(), db_path=db_path)
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            "INSERT INTO markdown (doi, markdown) VALUES ('10.1/a', '# Paper');"
+        )
+        conn.execute(
+            "INSERT INTO _llm_prompts (tag, prompt) VALUES ('uses_dl', 'Prompt');"
+        )
+
+    db.normalize_analysis_tables()
+
+    assert "user_prompt" not in db._get_existing_columns(table_name="uses_dl_analysis")
+
+    # The view decodes markdown with `aius_decode`, registered by `DB`
+    with db.engine.connect() as conn:
+        row = conn.exec_driver_sql(
+            "SELECT doi, system_prompt, user_prompt FROM uses_dl_analysis_text;"
+        ).fetchone()
+
+    assert tuple(row) == ("10.1/a", "Prompt", "# Paper")
+
+
+def test_analysis_views_decode_compressed_markdown(tmp_path: Path) -> None:
+    db = DB(logger=getLogger(), db_path=tmp_path / "aius.sqlite3", codec="zlib")
+    db.bulk_insert(
+        table_name="markdown",
+        rows=DataFrame(data={"doi": ["10.1/a"], "markdown": ["# Paper"]}),
+    )
+    with sqlite3.connect(db.engine.url.database) as conn:
+        conn.execute(
+            "INSERT INTO uses_ptms_analysis (doi, markdown_id) VALUES ('10.1/a', 1);"
+        )
+
+    df = pd.read_sql(
+        sql="SELECT user_prompt FROM uses_ptms_analysis_text;", con=db.engine
+    )
+
+    assert df["user_prompt"].tolist() == ["# Paper"]
+
+
+def test_statistics_scripts_read_compressed_analysis_views(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    db_path = tmp_path / "aius.sqlite3"
+    db = DB(logger=getLogger(), db_path=db_path, codec="lzma")
+    db.bulk_insert(
+        table_name="markdown",
+        rows=DataFrame(data={"doi": ["10.1/a"], "markdown": ["# Paper"]}),
+    )
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            "INSERT INTO _llm_prompts (tag, prompt) "
+            "VALUES ('identify_ptm_impact', 'prompt');"
+        )
+        conn.execute(
+            "INSERT INTO identify_ptm_impact_analysis (doi, markdown_id, "
+            "llm_prompt_id, model_response, model_reasoning, compute_time_seconds) "
+            "VALUES ('10.1/a', 1, 1, '{\"step\": \"Analysis\"}', '', 1.0);"
+        )
+
+    # Loaded from its path, as the script is run from `statistics/`
+    spec = spec_from_file_location(
+        name="aggregate_impact",
+        location=Path(__file__).parents[1] / "statistics" / "aggregate_impact.py",
+    )
+    aggregate_impact = module_from_spec(spec)
+    spec.loader.exec_module(aggregate_impact)
+    monkeypatch.setattr(aggregate_impact, "DB_PATH", db_path)
+
+    # The script exits after printing the counts
+    with pytest.raises(SystemExit):
+        aggregate_impact.main()
+
+    assert "Analysis" in capsys.readouterr().out
+
+
+def test_update_rows_writes_by_id(tmp_path: Path) -> None:
+    db = DB(logger=getLogger(), db_path=tmp_path / "aius.sqlite3")
+    with sqlite3.connect(db.engine.url.database) as conn:
+        conn.execute("INSERT INTO openalex (doi) VALUES ('10.1/a'), ('10.1/b');")
+
+    db.update_rows(
+        table_name="openalex",
+        rows=[{"_id": 2, "publication_year": 2020, "type": "article"}],
+    )
+
+    with sqlite3.connect(db.engine.url.database) as conn:
+        rows = conn.execute(
+            "SELECT publication_year, type FROM openalex ORDER BY _id;"
+        ).fetchall()
+
+    assert rows == [(None, None), (2020, "article")]
+
+
+def test_export_parquet_round_trips_with_pushdown(tmp_path: Path) -> None:
+    db = DB(logger=getLogger(), db_path=tmp_path / "aius.sqlite3", codec="zlib")
+    db.upsert_documents(
+        articles=DataFrame(
+            data={"doi": ["10.1/a", "10.1/b"], "megajournal": ["PLOS", "BMJ"]}
+        ),
+    )
+    db.write_dataframe_to_table(
+        table_name="markdown",
+        df=DataFrame(data={"doi": ["10.1/a", "10.1/b"], "markdown": ["# A", "# B"]}),
+    )
+    with sqlite3.connect(db.engine.url.database) as conn:
+        conn.execute(
+            "INSERT INTO openalex (doi, publication_year) "
+            "VALUES ('10.1/a', 2020), ('10.1/b', 2023);"
+        )
+
+    db.export_parquet(output_dir=tmp_path / "parquet")
+
+    assert (
+        tmp_path / "parquet/markdown/megajournal=PLOS/publication_year=2020"
+    ).is_dir()
+
+    markdown = db.read_arrow(
+        table_name="markdown",
+        columns=["doi", "markdown"],
+        filters=[("publication_year", ">", 2021)],
+        dataset_path=tmp_path / "parquet",
+    )
+
+    assert markdown.to_pylist() == [{"doi": "10.1/b", "markdown": "# B"}]
+
+
+def test_export_parquet_partitions_raw_dois(tmp_path: Path) -> None:
+    db = DB(logger=getLogger(), db_path=tmp_path / "aius.sqlite3")
+    with sqlite3.connect(db.engine.url.database) as conn:
+        conn.execute(
+            "INSERT INTO articles (doi, megajournal) "
+            "VALUES ('https://doi.org/10.1/A', 'PLOS');"
+        )
+        conn.execute("INSERT INTO jats (doi) VALUES ('10.1/A');")
+        conn.execute(
+            "INSERT INTO documents (doi, megajournal) VALUES ('10.1/a', 'PLOS');"
+        )
+        conn.execute(
+            "INSERT INTO openalex (doi, publication_year) VALUES ('10.1/a', 2020);"
+        )
+
+    db.export_parquet(output_dir=tmp_path / "parquet")
+
+    assert (
+        tmp_path / "parquet/articles/megajournal=PLOS/publication_year=2020"
+    ).is_dir()
+    assert (tmp_path / "parquet/jats/megajournal=PLOS/publication_year=2020").is_dir()
+
+    with pytest.raises(FileNotFoundError, match="aius export"):
+        db.read_arrow(table_name="markdown", dataset_path=tmp_path / "missing")
+
+
+def test_upsert_documents_deduplicates_normalized_dois(tmp_path: Path) -> None:
+    db_path = tmp_path / "aius.sqlite3"
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            "CREATE TABLE articles (_id INTEGER PRIMARY KEY, search_id INTEGER, "
+            "doi TEXT, title TEXT, megajournal TEXT, journal TEXT);"
+        )
+        conn.execute(
+            "INSERT INTO articles (search_id, doi, title, megajournal, journal) "
+            "VALUES (1, '10.1/A', '', 'F1000', ''), "
+            "(2, 'https://doi.org/10.1/a', 'Title', 'F1000', 'F1000Research');"
+        )
+
+    db = DB(logger=getLogger(), db_path=db_path)
+
+    db.upsert_documents(
+        articles=[
+            ArticleModel(
+                doi="doi: 10.1/A",
+                title="Other",
+                megajournal="F1000",
+                journal="",
+                search_id=3,
+            ),
+            ArticleModel(
+                doi="10.1/b", title="", megajournal="PLOS", journal="", search_id=3
+            ),
+        ]
+    )
+
+    with sqlite3.connect(db_path) as conn:
+        documents = conn.execute(
+            "SELECT doi, title, journal FROM documents ORDER BY _id;"
+        ).fetchall()
+        links = conn.execute(
+            "SELECT document_id, search_id FROM document_searches "
+            "ORDER BY document_id, search_id;"
+        ).fetchall()
+
+    assert documents == [("10.1/a", "Title", "F1000Research"), ("10.1/b", "", "")]
+    assert links == [(1, 1), (1, 2), (1, 3), (2, 3)]
@@ -0,0 +1,105 @@
+import pickle
+import sqlite3
+from logging import getLogger
+from pathlib import Path
+
+from aius.db import DB
+from aius.megajournals.frontiersin import FRONTIERSIN_PAGE_SIZE, FrontiersIn
+
+
+class _FakeResponse:
+    def __init__(self, json_data: dict) -> None:
+        self.status_code = 200
+        self.content = b""
+        self._json_data = json_data
+
+    def json(self) -> dict:
+        return self._json_data
+
+
+class _FakeSession:
+    def __init__(self, article_count: int) -> None:
+        self.article_count = article_count
+        self.bodies: list[dict] = []
+
+    def post(self, url: str, json: dict, timeout: int) -> _FakeResponse:
+        self.bodies.append(json)
+        window = range(
+            json["Skip"], min(json["Skip"] + json["Top"], self.article_count)
+        )
+        return _FakeResponse(
+            json_data={
+                "Summary": {"Article": {"Count": self.article_count}},
+                "Articles": [
+                    # Only the fields the parser has always read; the year is
+                    # part of the DOI
+                    {
+                        "Doi": f"10.3389/fpsyg.{2019 + i % 3}.{i}",
+                        "Title": "",
+                        "Journal": {"Title": "Frontiers"},
+                    }
+                    for i in window
+                ],
+            }
+        )
+
+
+def test_frontiersin_pages_through_windows_and_filters_years(tmp_path: Path) -> None:
+    db = DB(logger=getLogger(), db_path=tmp_path / "aius.sqlite3")
+    with sqlite3.connect(db.engine.url.database) as conn:
+        conn.execute("INSERT INTO _search_keywords (keyword) VALUES ('deep learning');")
+        conn.execute("INSERT INTO _years (year) VALUES (2020), (2021);")
+
+    journal = FrontiersIn(logger=getLogger(), db=db, concurrency=2)
+    journal.session = _FakeSession(article_count=FRONTIERSIN_PAGE_SIZE * 2 + 5)
+
+    searches = list(journal.search())
+
+    assert [(search.year, search.page) for search in searches] == [
+        (0, 1),
+        (0, 2),
+        (0, 3),
+    ]
+    assert sorted(body["Skip"] for body in journal.session.bodies) == [
+        0,
+        FRONTIERSIN_PAGE_SIZE,
+        FRONTIERSIN_PAGE_SIZE * 2,
+    ]
+
+    # Pages are stored as the API returned them; years are filtered on parse
+    assert all("Years" not in search.json_data for search in searches)
+
+    articles = journal.parse_response(responses=searches)
+
+    assert len(articles) == 136
+    # The parser and its year filter are sent to spawned parse workers
+    assert pickle.loads(pickle.dumps(journal.page_parser))(searches[0].json_data) == [
+        (article.doi, "", "Frontiers") for article in articles[:66]
+    ]
+    assert articles[0].doi == "10.3389/fpsyg.2020.1"
+
+
+def test_frontiersin_reports_articles_without_a_year(caplog) -> None:
+    json_data = {
+        "Articles": [
+            {"Doi": "10.3389/fpsyg.2020.1", "Title": "a", "Journal": {"Title": "J"}},
+            {"Doi": "10.3389/fpsyg.2019.2", "Title": "b", "Journal": {"Title": "J"}},
+            {
+                "Doi": "10.3389/unknown",
+                "Title": "c",
+                "Journal": {"Title": "J"},
+                "PublishedDate": "2019-05-01T00:00:00Z",
+            },
+            {"Doi": "10.3389/undated", "Title": "d", "Journal": {"Title": "J"}},
+        ],
+    }
+
+    assert FrontiersIn.parse_page(
+        json_data=json_data,
+        years=frozenset({2020}),
+        logger=getLogger(name="frontiersin"),
+    ) == [
+        ("10.3389/fpsyg.2020.1", "a", "J"),
+        ("10.3389/undated", "d", "J"),
+    ]
+    assert "10.3389/undated" in caplog.text
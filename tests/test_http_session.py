@@ -0,0 +1,41 @@
+from threading import Thread
+from time import monotonic
+
+from requests import Response
+
+from aius.util.http_session import TokenBucket, parse_retry_after
+
+
+def test_token_bucket_paces_threads() -> None:
+    bucket = TokenBucket(rate=50.0, capacity=1.0)
+
+    start = monotonic()
+    threads = [Thread(target=bucket.acquire) for _ in range(11)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # One token is available up front, the other ten refill at 50 per second
+    assert monotonic() - start >= 0.18
+
+
+def test_token_bucket_pause_blocks_acquire() -> None:
+    bucket = TokenBucket(rate=1000.0)
+    bucket.pause(seconds=0.1)
+
+    start = monotonic()
+    bucket.acquire()
+
+    assert monotonic() - start >= 0.09
+
+
+def test_parse_retry_after() -> None:
+    resp = Response()
+    assert parse_retry_after(resp=resp, default=2.0) == 2.0
+
+    resp.headers["Retry-After"] = "7"
+    assert parse_retry_after(resp=resp, default=2.0) == 7.0
+
+    resp.headers["Retry-After"] = "Wed, 21 Oct 2015 07:28:00 GMT"
+    assert parse_retry_after(resp=resp, default=2.0) == 0.0
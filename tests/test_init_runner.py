@@ -0,0 +1,25 @@
+from logging import getLogger
+from pathlib import Path
+
+from aius.db import DB
+from aius.init.runner import InitRunner
+
+INIT_TABLES: list[str] = [
+    "_llm_prompts",
+    "_openalex_natural_science_fields",
+    "_search_keywords",
+    "_years",
+]
+
+
+def test_init_runner_is_idempotent(tmp_path: Path) -> None:
+    db = DB(logger=getLogger(), db_path=tmp_path / "aius.sqlite3")
+
+    InitRunner(db=db, logger=getLogger(), min_year=2015, max_year=2016).execute()
+    row_counts = {table: db.get_row_count(table_name=table) for table in INIT_TABLES}
+    InitRunner(db=db, logger=getLogger(), min_year=2015, max_year=2016).execute()
+
+    assert all(count > 0 for count in row_counts.values())
+    assert {
+        table: db.get_row_count(table_name=table) for table in INIT_TABLES
+    } == row_counts
@@ -0,0 +1,165 @@
+import sqlite3
+from itertools import product
+from logging import getLogger
+from pathlib import Path
+from random import random
+from time import sleep
+
+import pytest
+
+from aius.db import DB
+from aius.megajournals import MEGAJOURNAL_MAPPING, resolve_megajournal_names
+from aius.megajournals.megajournal import MegaJournal, parse_pool
+from aius.megajournals.models import SearchModel
+from aius.search.runner import SearchRunner
+
+
+class _FakeJournal(MegaJournal):
+    def __init__(
+        self, concurrency: int, db: DB | None = None, name: str = "Fake"
+    ) -> None:
+        super().__init__(logger=getLogger(), db=db, concurrency=concurrency)
+        self.name = name
+        self.keyword_year_products = product(["a", "b"], [2020, 2021])
+
+    def search_single_page(self, logger, keyword_year_pair, page) -> SearchModel:
+        sleep(random() / 100)
+        return SearchModel(
+            timestamp=0.0,
+            megajournal=self.name,
+            search_keyword=keyword_year_pair[0],
+            status_code=200,
+            year=keyword_year_pair[1],
+            page=page,
+            url="",
+            json_data={
+                "pages": 3 if keyword_year_pair[0] == "a" else 1,
+                "dois": [f"10.1/{keyword_year_pair[0]}{page}-{i}" for i in range(3)],
+            },
+        )
+
+    def _compute_total_number_of_pages(self, resp: SearchModel) -> int:
+        return resp.json_data["pages"]
+
+    @staticmethod
+    def parse_page(json_data: dict) -> list[tuple[str, str, str]]:
+        return [(doi, "", "") for doi in json_data["dois"]]
+
+    def download_jats(self, df, **kwargs): ...
+
+
+def test_concurrent_search_matches_serial_order() -> None:
+    def pages(journal: MegaJournal) -> list[tuple]:
+        return [
+            (resp.search_keyword, resp.year, resp.page) for resp in journal.search()
+        ]
+
+    serial = pages(journal=_FakeJournal(concurrency=1))
+
+    assert serial[:4] == [
+        ("a", 2020, 1),
+        ("a", 2020, 2),
+        ("a", 2020, 3),
+        ("a", 2021, 1),
+    ]
+    assert len(serial) == 8
+    assert pages(journal=_FakeJournal(concurrency=4)) == serial
+
+
+def test_search_skips_checkpointed_pages(tmp_path: Path) -> None:
+    db = DB(logger=getLogger(), db_path=tmp_path / "aius.sqlite3")
+    journal = _FakeJournal(concurrency=2, db=db)
+
+    first_page = journal.search_single_page(
+        logger=getLogger(), keyword_year_pair=("a", 2020), page=1
+    )
+    search_id = db.bulk_insert(table_name="searches", rows=[first_page])[0]
+    db.add_search_checkpoint(
+        megajournal="Fake", search_keyword="a", year=2020, page=1, search_id=search_id
+    )
+    db.add_search_checkpoint(
+        megajournal="Fake", search_keyword="a", year=2020, page=3, search_id=search_id
+    )
+
+    checkpoints = db.get_search_checkpoints(megajournal="Fake")
+    pages = [
+        (resp.search_keyword, resp.year, resp.page)
+        for resp in journal.search(checkpoints=checkpoints)
+    ]
+
+    assert pages == [
+        ("a", 2020, 2),
+        ("a", 2021, 1),
+        ("a", 2021, 2),
+        ("a", 2021, 3),
+        ("b", 2020, 1),
+        ("b", 2021, 1),
+    ]
+
+
+def test_parallel_parse_matches_serial_order(tmp_path: Path) -> None:
+    db = DB(logger=getLogger(), db_path=tmp_path / "aius.sqlite3")
+    journal = _FakeJournal(concurrency=1, db=db)
+
+    searches = list(journal.search())
+    search_ids = db.bulk_insert(table_name="searches", rows=searches)
+    serial = journal.parse_response(responses=searches, search_ids=search_ids)
+
+    assert len(serial) == 24
+    assert serial[0].search_id == search_ids[0]
+
+    with parse_pool(processes=2) as executor:
+        assert (
+            journal.parse_response(
+                responses=searches, search_ids=search_ids, executor=executor
+            )
+            == serial
+        )
+        stored = [
+            article
+            for articles in journal.parse_stored_searches(
+                executor=executor, chunksize=3
+            )
+            for article in articles
+        ]
+
+    assert stored == serial
+
+
+def test_resolve_megajournal_names() -> None:
+    assert resolve_megajournal_names(value="all") == list(MEGAJOURNAL_MAPPING)
+    assert resolve_megajournal_names(value="PLOS, bmj,plos") == ["plos", "bmj"]
+
+    with pytest.raises(ValueError, match="nature"):
+        resolve_megajournal_names(value="plos,nature")
+
+
+def test_search_runner_searches_journals_concurrently(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    db = DB(logger=getLogger(), db_path=tmp_path / "aius.sqlite3")
+
+    for name in ["fake1", "fake2"]:
+        monkeypatch.setitem(
+            MEGAJOURNAL_MAPPING,
+            name,
+            lambda logger, db, concurrency, http_cache, name=name: _FakeJournal(
+                concurrency=concurrency, db=db, name=name
+            ),
+        )
+
+    SearchRunner(
+        db=db, logger=getLogger(), megajournal_names=["fake1", "fake2"], concurrency=2
+    ).execute()
+
+    with sqlite3.connect(db.engine.url.database) as conn:
+        rows = conn.execute(
+            "SELECT s.megajournal, COUNT(a._id) FROM searches AS s "
+            "JOIN articles AS a ON a.search_id = s._id GROUP BY s.megajournal;"
+        ).fetchall()
+        checkpoints = conn.execute(
+            "SELECT COUNT(*) FROM _search_checkpoints;"
+        ).fetchone()[0]
+
+    assert rows == [("fake1", 24), ("fake2", 24)]
+    assert checkpoints == 16
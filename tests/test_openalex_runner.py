@@ -0,0 +1,342 @@
+import gzip
+import sqlite3
+from json import dumps, loads
+from logging import getLogger
+from pathlib import Path
+from random import random
+from time import sleep
+from urllib.parse import parse_qs, urlparse
+
+from aius.db import DB
+from aius.openalex.runner import OpenAlexRunner
+from aius.openalex.snapshot import init_worker, scan_partition
+
+
+class _FakeResponse:
+    def __init__(self, json_data: dict) -> None:
+        self.status_code = 200
+        self.content = b""
+        self._json_data = json_data
+
+    def json(self) -> dict:
+        return self._json_data
+
+
+class _FakeOpenAlexSession:
+    def __init__(self) -> None:
+        self.chunk_sizes: list[int] = []
+        self.selects: list[str | None] = []
+
+    def get(self, url: str, timeout: int) -> _FakeResponse:
+        # Finish out of order
+        sleep(random() / 100)
+
+        query = parse_qs(urlparse(url).query)
+        self.selects.append(query.get("select", [None])[0])
+
+        doi_filter = query["filter"][0]
+        dois = doi_filter.removeprefix("doi:").split("|")
+        self.chunk_sizes.append(len(dois))
+
+        return _FakeResponse(
+            json_data={
+                "results": [
+                    {
+                        "doi": doi,
+                        "cited_by_count": 1,
+                        "open_access": {"is_oa": True},
+                        "publication_year": 2020,
+                        "type": "article",
+                        "topics": [],
+                    }
+                    for doi in dois
+                ]
+            }
+        )
+
+
+def test_openalex_runner_fetches_chunks_concurrently_in_order(tmp_path: Path) -> None:
+    db = DB(logger=getLogger(), db_path=tmp_path / "aius.sqlite3")
+    with sqlite3.connect(db.engine.url.database) as conn:
+        conn.executemany(
+            "INSERT INTO documents (doi) VALUES (?);",
+            [(f"10.1/{i:04d}",) for i in range(250)],
+        )
+
+    runner = OpenAlexRunner(db=db, logger=getLogger(), email="a@b.c", concurrency=4)
+    runner.session = _FakeOpenAlexSession()
+    runner.execute()
+
+    assert sorted(runner.session.chunk_sizes) == [50, 100, 100]
+
+    with sqlite3.connect(db.engine.url.database) as conn:
+        dois = [
+            row[0] for row in conn.execute("SELECT doi FROM openalex ORDER BY _id;")
+        ]
+
+    assert dois == [f"10.1/{i:04d}" for i in range(250)]
+
+
+def test_openalex_runner_fetches_new_and_stale_dois_only(tmp_path: Path) -> None:
+    db = DB(logger=getLogger(), db_path=tmp_path / "aius.sqlite3")
+    with sqlite3.connect(db.engine.url.database) as conn:
+        conn.executemany(
+            "INSERT INTO documents (doi) VALUES (?);",
+            [(f"10.1/{i:04d}",) for i in range(10)],
+        )
+
+    def run(**kwargs) -> list[int]:
+        runner = OpenAlexRunner(db=db, logger=getLogger(), email="a@b.c", **kwargs)
+        runner.session = _FakeOpenAlexSession()
+        runner.execute()
+        return runner.session.chunk_sizes
+
+    assert run() == [10]
+    assert run() == []
+
+    with sqlite3.connect(db.engine.url.database) as conn:
+        conn.execute("UPDATE openalex SET timestamp = 0 WHERE doi = '10.1/0003';")
+        conn.execute("INSERT INTO documents (doi) VALUES ('10.1/0010');")
+
+    assert run(max_age_days=1) == [2]
+    assert run(full=True) == [11]
+
+    with sqlite3.connect(db.engine.url.database) as conn:
+        counts = conn.execute(
+            "SELECT COUNT(*), COUNT(DISTINCT doi) FROM openalex;"
+        ).fetchone()
+
+    assert counts == (11, 11)
+
+
+def test_openalex_runner_projects_fields_unless_archiving(tmp_path: Path) -> None:
+    db = DB(logger=getLogger(), db_path=tmp_path / "aius.sqlite3")
+    with sqlite3.connect(db.engine.url.database) as conn:
+        conn.execute("INSERT INTO documents (doi) VALUES ('10.1/a');")
+
+    runner = OpenAlexRunner(
+        db=db, logger=getLogger(), email="a@b.c", select=["title", "doi"]
+    )
+    runner.session = _FakeOpenAlexSession()
+    runner.execute()
+
+    assert runner.session.selects == [
+        "id,doi,publication_year,type,cited_by_count,open_access,"
+        "primary_topic,topics,title"
+    ]
+
+    runner = OpenAlexRunner(
+        db=db, logger=getLogger(), email="a@b.c", full=True, archive=True
+    )
+    runner.session = _FakeOpenAlexSession()
+    runner.execute()
+
+    assert runner.session.selects == [None]
+
+
+def test_openalex_runner_ingests_snapshot_partitions(tmp_path: Path) -> None:
+    db = DB(logger=getLogger(), db_path=tmp_path / "aius.sqlite3")
+    with sqlite3.connect(db.engine.url.database) as conn:
+        conn.executemany(
+            "INSERT INTO documents (doi) VALUES (?);", [("10.1/a",), ("10.1/c",)]
+        )
+
+    def work(doi: str) -> dict:
+        return {
+            "id": f"https://openalex.org/W{doi[-1]}",
+            "doi": f"https://doi.org/{doi.upper()}",
+            "cited_by_count": 2,
+            "open_access": {"is_oa": False},
+            "publication_year": 2021,
+            "type": "article",
+            "topics": [],
+            "authorships": [{"author": {"display_name": "A"}}],
+        }
+
+    for index, dois in enumerate([["10.1/a", "10.1/b"], ["10.1/c"]]):
+        partition = tmp_path / f"works/updated_date=2025-01-0{index + 1}/part_000.gz"
+        partition.parent.mkdir(parents=True)
+        with gzip.open(partition, mode="wt", encoding="UTF-8") as fp:
+            fp.writelines(dumps(work(doi=doi)) + "\n" for doi in dois)
+
+    OpenAlexRunner(
+        db=db,
+        logger=getLogger(),
+        email="a@b.c",
+        snapshot=tmp_path / "works",
+        processes=2,
+    ).execute()
+
+    with sqlite3.connect(db.engine.url.database) as conn:
+        rows = conn.execute(
+            "SELECT doi, cited_by_count, json_data FROM openalex ORDER BY _id;"
+        ).fetchall()
+
+    assert [row[:2] for row in rows] == [("10.1/a", 2), ("10.1/c", 2)]
+    assert "authorships" not in loads(rows[0][2])
+
+
+def test_scan_partition_matches_top_level_dois_only(tmp_path: Path) -> None:
+    works = [
+        # A tracked DOI nested in a location does not identify the work
+        {"locations": [{"doi": "10.1/a"}], "doi": "https://doi.org/10.1/x"},
+        # The top-level DOI is matched even after a nested one
+        {"related": {"doi": "10.9/z"}, "doi": "https://doi.org/10.1/B"},
+    ]
+
+    partition = tmp_path / "part_000.gz"
+    with gzip.open(partition, mode="wt", encoding="UTF-8") as fp:
+        fp.writelines(dumps(work) + "\n" for work in works)
+
+    init_worker(dois=["10.1/a", "10.1/b"])
+
+    assert scan_partition(partition=partition, select=["doi"]) == [
+        {"doi": "https://doi.org/10.1/B"}
+    ]
+
+
+def test_openalex_runner_skips_malformed_snapshot_works(tmp_path: Path) -> None:
+    db = DB(logger=getLogger(), db_path=tmp_path / "aius.sqlite3")
+    with sqlite3.connect(db.engine.url.database) as conn:
+        conn.executemany(
+            "INSERT INTO documents (doi) VALUES (?);",
+            [("10.1/a",), ("10.1/b",), ("10.1/c",)],
+        )
+
+    works = [
+        # Partial: every projected field but `doi` is missing
+        {"id": "https://openalex.org/Wa", "doi": "https://doi.org/10.1/a"},
+        # Malformed: the count is not a number
+        {"doi": "https://doi.org/10.1/b", "cited_by_count": "many"},
+        {
+            "doi": "https://doi.org/10.1/c",
+            "cited_by_count": 3,
+            "open_access": None,
+            "primary_topic": None,
+            "topics": None,
+        },
+    ]
+
+    partition = tmp_path / "works/updated_date=2025-01-01/part_000.gz"
+    partition.parent.mkdir(parents=True)
+    with gzip.open(partition, mode="wt", encoding="UTF-8") as fp:
+        fp.writelines(dumps(work) + "\n" for work in works)
+
+    OpenAlexRunner(
+        db=db,
+        logger=getLogger(),
+        email="a@b.c",
+        snapshot=tmp_path / "works",
+    ).execute()
+
+    with sqlite3.connect(db.engine.url.database) as conn:
+        rows = conn.execute(
+            "SELECT doi, cited_by_count, open_access, topic_0 FROM openalex "
+            "ORDER BY _id;"
+        ).fetchall()
+
+    assert rows == [("10.1/a", 0, 0, None), ("10.1/c", 3, 0, None)]
+
+
+def _natural_science_dois(db_path: Path) -> list[str]:
+    with sqlite3.connect(db_path) as conn:
+        rows = conn.execute(
+            "SELECT doi FROM natural_science_article_dois ORDER BY doi;"
+        ).fetchall()
+    return [row[0] for row in rows]
+
+
+def _topic(field_id: int, field: str, score: float) -> dict:
+    return {
+        "score": score,
+        "subfield": {"display_name": f"{field} subfield"},
+        "field": {
+            "id": f"https://openalex.org/fields/{field_id}",
+            "display_name": field,
+        },
+    }
+
+
+def test_openalex_runner_stores_ranked_topics(tmp_path: Path) -> None:
+    topics = [
+        _topic(field_id=27, field="Medicine", score=0.9),
+        _topic(field_id=13, field="Biochemistry", score=0.8),
+        _topic(field_id=27, field="Medicine", score=0.7),
+        _topic(field_id=16, field="Chemistry", score=0.6),
+    ]
+
+    assert OpenAlexRunner.extract_topics(topics=topics) == (
+        "Medicine",
+        "Biochemistry",
+        "Medicine",
+    )
+    assert OpenAlexRunner.extract_topics(topics=topics[:1]) == ("Medicine", None, None)
+
+    # A database written before `openalex_topics` and the natural science
+    # table existed
+    db_path = tmp_path / "aius.sqlite3"
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            "CREATE TABLE openalex (_id INTEGER PRIMARY KEY, timestamp DATETIME, "
+            "doi VARCHAR, cited_by_count INTEGER, open_access BOOLEAN, "
+            "topic_0 VARCHAR, topic_1 VARCHAR, topic_2 VARCHAR, json_data VARCHAR);"
+        )
+        conn.execute(
+            "CREATE TABLE _openalex_natural_science_fields "
+            "(_id INTEGER PRIMARY KEY, openalex_id INTEGER, field VARCHAR);"
+        )
+        conn.execute(
+            "INSERT INTO _openalex_natural_science_fields (openalex_id, field) "
+            "VALUES (16, 'Chemistry');"
+        )
+        conn.execute(
+            "INSERT INTO openalex (doi, cited_by_count, topic_0, json_data) "
+            "VALUES ('10.1/old', 1, 'Chemistry', ?);",
+            (
+                dumps(
+                    obj={
+                        "cited_by_count": 1,
+                        "open_access": {"is_oa": False},
+                        "topics": topics[3:],
+                    }
+                ),
+            ),
+        )
+
+    db = DB(logger=getLogger(), db_path=db_path)
+    assert _natural_science_dois(db_path=db_path) == ["10.1/old"]
+
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("INSERT INTO documents (doi) VALUES ('10.1/new');")
+
+    runner = OpenAlexRunner(db=db, logger=getLogger(), email="a@b.c")
+    runner.session = _FakeOpenAlexSession()
+    runner.session.get = lambda url, timeout: _FakeResponse(
+        json_data={
+            "results": [
+                {
+                    "doi": "https://doi.org/10.1/NEW",
+                    "cited_by_count": 2,
+                    "open_access": {"is_oa": True},
+                    "topics": topics,
+                }
+            ]
+        }
+    )
+    runner.execute()
+
+    with sqlite3.connect(db.engine.url.database) as conn:
+        rows = conn.execute(
+            "SELECT doi, rank, field_id, field_name, subfield, score "
+            "FROM openalex_topics ORDER BY doi, rank;"
+        ).fetchall()
+
+    assert rows == [
+        ("10.1/new", 0, 27, "Medicine", "Medicine subfield", 0.9),
+        ("10.1/new", 1, 13, "Biochemistry", "Biochemistry subfield", 0.8),
+        ("10.1/new", 2, 27, "Medicine", "Medicine subfield", 0.7),
+        ("10.1/new", 3, 16, "Chemistry", "Chemistry subfield", 0.6),
+        ("10.1/old", 0, 16, "Chemistry", "Chemistry subfield", 0.6),
+    ]
+    # The rank 3 Chemistry topic of `10.1/new` is outside the filter
+    assert _natural_science_dois(db_path=db_path) == ["10.1/old"]
@@ -0,0 +1,81 @@
+from logging import Logger, getLogger
+from pathlib import Path
+
+import pytest
+
+from aius.db import DB
+from aius.megajournals import MEGAJOURNAL_MAPPING
+from aius.megajournals.megajournal import MegaJournal
+from aius.megajournals.models import SearchModel
+from aius.reparse.runner import ReparseRunner
+
+
+class _FakeJournal(MegaJournal):
+    def __init__(self, logger: Logger, db: DB) -> None:
+        super().__init__(logger=logger, db=db)
+        self.name = "Fake"
+
+    @staticmethod
+    def parse_page(json_data: dict) -> list[tuple[str, str, str]]:
+        if json_data.get("broken"):
+            msg = "Unparsable page"
+            raise ValueError(msg)
+
+        return [(doi, "", "") for doi in json_data["dois"]]
+
+    def search_single_page(self, logger, keyword_year_pair, page): ...
+
+    def _compute_total_number_of_pages(self, resp: SearchModel) -> int: ...
+
+    def download_jats(self, df, **kwargs): ...
+
+
+def _store_search(db: DB, json_data: dict) -> None:
+    db.bulk_insert(
+        table_name="searches",
+        rows=[
+            SearchModel(
+                timestamp=0.0,
+                megajournal="Fake",
+                search_keyword="a",
+                year=2020,
+                page=1,
+                url="",
+                status_code=200,
+                json_data=json_data,
+            )
+        ],
+    )
+
+
+def _article_dois(db: DB) -> list[str]:
+    return db.read_table_to_dataframe(table_name="articles")["doi"].tolist()
+
+
+def test_reparse_replaces_articles(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setitem(MEGAJOURNAL_MAPPING, "fake", _FakeJournal)
+    db = DB(logger=getLogger(), db_path=tmp_path / "aius.sqlite3")
+    _store_search(db=db, json_data={"dois": ["10.1/a", "10.1/b"]})
+
+    ReparseRunner(db=db, logger=getLogger(), megajournal_name="fake").execute()
+    ReparseRunner(db=db, logger=getLogger(), megajournal_name="fake").execute()
+
+    assert _article_dois(db=db) == ["10.1/a", "10.1/b"]
+
+
+def test_failed_reparse_keeps_articles(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setitem(MEGAJOURNAL_MAPPING, "fake", _FakeJournal)
+    db = DB(logger=getLogger(), db_path=tmp_path / "aius.sqlite3")
+    _store_search(db=db, json_data={"dois": ["10.1/a", "10.1/b"]})
+    ReparseRunner(db=db, logger=getLogger(), megajournal_name="fake").execute()
+
+    # The journal's articles are deleted before the new page fails to parse
+    _store_search(db=db, json_data={"broken": True})
+    with pytest.raises(ValueError, match="Unparsable page"):
+        ReparseRunner(db=db, logger=getLogger(), megajournal_name="fake").execute()
+
+    assert _article_dois(db=db) == ["10.1/a", "10.1/b"]
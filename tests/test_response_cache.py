@@ -0,0 +1,91 @@
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from pathlib import Path
+from threading import Thread
+
+import pytest
+
+from aius.util.http_session import HTTPSession
+from aius.util.response_cache import ReplayCacheMissError, ResponseCache
+
+
+class _Handler(BaseHTTPRequestHandler):
+    requests_served: int = 0
+
+    def _respond(self) -> None:
+        type(self).requests_served += 1
+        length = int(self.headers.get("Content-Length", 0))
+        body = self.rfile.read(length) or b"get"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = _respond
+    do_POST = _respond
+
+    def log_message(self, *args) -> None: ...
+
+
+class _RedirectHandler(BaseHTTPRequestHandler):
+    def do_HEAD(self) -> None:
+        if self.path == "/doi":
+            self.send_response(302)
+            self.send_header("Location", "/article")
+        else:
+            self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args) -> None: ...
+
+
+def test_response_cache_hits_by_body_and_replays(tmp_path: Path) -> None:
+    server = HTTPServer(("127.0.0.1", 0), _Handler)
+    Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/search"
+
+    session = HTTPSession(cache=ResponseCache(cache_dir=tmp_path)).session
+    assert session.post(url=url, json={"q": "a"}).content == b'{"q": "a"}'
+    assert session.post(url=url, json={"q": "b"}).content == b'{"q": "b"}'
+    assert session.post(url=url, json={"q": "a"}).content == b'{"q": "a"}'
+    assert _Handler.requests_served == 2
+
+    server.shutdown()
+
+    replay = HTTPSession(cache=ResponseCache(cache_dir=tmp_path, replay=True)).session
+    assert replay.post(url=url, json={"q": "b"}).content == b'{"q": "b"}'
+    with pytest.raises(ReplayCacheMissError):
+        replay.get(url=url)
+
+    # Entries are JSON metadata and the raw body, not pickled objects
+    entry = next(tmp_path.glob("*.response")).read_bytes()
+    assert entry.split(b"\n", 1)[0].startswith(b'{"status_code": 200')
+
+
+def test_response_cache_replays_redirects(tmp_path: Path) -> None:
+    server = HTTPServer(("127.0.0.1", 0), _RedirectHandler)
+    Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/doi"
+
+    session = HTTPSession(cache=ResponseCache(cache_dir=tmp_path)).session
+    session.head(url=url, allow_redirects=True)
+    server.shutdown()
+
+    replay = HTTPSession(cache=ResponseCache(cache_dir=tmp_path, replay=True)).session
+    resp = replay.head(url=url, allow_redirects=True)
+
+    assert resp.status_code == 200
+    assert resp.url.endswith("/article")
+    assert [hop.status_code for hop in resp.history] == [302]
+
+
+def test_response_cache_evicts_oldest_entries(tmp_path: Path) -> None:
+    cache = ResponseCache(cache_dir=tmp_path, max_bytes=1)
+    server = HTTPServer(("127.0.0.1", 0), _Handler)
+    Thread(target=server.serve_forever, daemon=True).start()
+
+    session = HTTPSession(cache=cache).session
+    session.get(url=f"http://127.0.0.1:{server.server_port}/a")
+    server.shutdown()
+
+    assert list(tmp_path.glob("*.response")) == []
@@ -0,0 +1,62 @@
+from aius.megajournals.parsers import (
+    bmj_articles,
+    bmj_articles_soup,
+    bmj_document_count,
+    bmj_document_count_soup,
+    f1000_dois,
+    f1000_dois_soup,
+    f1000_total_number_of_pages,
+    f1000_total_number_of_pages_soup,
+)
+
+BMJ_PAGE = """
+<html><body>
+<div id="search-summary-wrapper" class="panel highwire-search-summary">250 results found</div>
+<div class="highwire-cite highwire-cite-highwire-article">
+  <span class="highwire-cite-title">Deep <i>learning</i> in medicine</span>
+  <span class="highwire-cite-metadata-journal">BMJ Open</span>
+  <span class="highwire-cite-metadata-doi">doi: 10.1136/bmjopen-2020-1</span>
+</div>
+<div class="highwire-cite highwire-cite-highwire-article">
+  <span class="highwire-cite-title">Missing a journal</span>
+  <span class="highwire-cite-metadata-doi">doi: 10.1136/bmjopen-2020-2</span>
+</div>
+</body></html>
+"""
+
+F1000_PAGE = """<?xml version="1.0" encoding="UTF-8"?>
+<results totalNumberOfPages="3">
+  <result><doi>10.12688/f1000research.1.1</doi></result>
+  <result><doi>10.12688/f1000research.2.1</doi></result>
+</results>
+"""
+
+
+def test_bmj_parsers_match_beautifulsoup() -> None:
+    assert bmj_articles(markup=BMJ_PAGE) == [
+        ("10.1136/bmjopen-2020-1", "Deep learning in medicine", "BMJ Open")
+    ]
+    assert bmj_articles(markup=BMJ_PAGE) == bmj_articles_soup(markup=BMJ_PAGE)
+
+    assert bmj_document_count(markup=BMJ_PAGE) == 250
+    assert bmj_document_count(markup=BMJ_PAGE) == bmj_document_count_soup(
+        markup=BMJ_PAGE
+    )
+
+
+def test_f1000_parsers_match_beautifulsoup() -> None:
+    assert f1000_dois(markup=F1000_PAGE) == [
+        "10.12688/f1000research.1.1",
+        "10.12688/f1000research.2.1",
+    ]
+    assert f1000_dois(markup=F1000_PAGE) == f1000_dois_soup(markup=F1000_PAGE)
+
+    assert f1000_total_number_of_pages(markup=F1000_PAGE) == 3
+    assert f1000_total_number_of_pages_soup(markup=F1000_PAGE) == 3
+
+
+def test_parsers_handle_empty_pages() -> None:
+    assert bmj_articles(markup="") == []
+    assert bmj_document_count(markup="") is None
+    assert f1000_dois(markup="") == []
+    assert f1000_total_number_of_pages(markup="") is None